@@ -8,7 +8,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
-from .models import User
+from .models import User, NotificationFanout
 
 
 @admin.register(User)
@@ -55,3 +55,21 @@ class UserAdmin(BaseUserAdmin):
     
     # 읽기 전용 필드
     readonly_fields = ('date_joined', 'last_login')
+
+
+@admin.register(NotificationFanout)
+class NotificationFanoutAdmin(admin.ModelAdmin):
+    """새 게시글 알림 발송 작업 (진행 상황 확인)"""
+
+    list_display = ('post', 'status', 'processed', 'total', 'progress', 'attempts', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('post__title',)
+    raw_id_fields = ('post',)
+    readonly_fields = (
+        'status', 'total', 'processed', 'last_follower_id', 'attempts',
+        'error', 'created_at', 'updated_at', 'finished_at',
+    )
+
+    @admin.display(description='진행률')
+    def progress(self, obj):
+        return f'{obj.progress}%'
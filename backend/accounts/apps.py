@@ -9,3 +9,7 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
     verbose_name = '사용자 관리'
+
+    def ready(self):
+        """시그널 등록"""
+        from . import signals  # noqa: F401
@@ -0,0 +1,179 @@
+"""
+Accounts 앱 - 프로필 이미지 크기별 파일
+=====================================
+프로필 이미지를 템플릿에서 쓰는 크기(AVATAR_SIZES)별 정사각형 WebP 로 미리 만들어 두고
+원본 대신 사용 (댓글 많은 페이지에서 같은 원본을 여러 번 내려받지 않음)
+
+처리 흐름:
+- 업로드/변경 시 커밋 후 백그라운드 작업 스레드에서 generate() (accounts.signals)
+- 변환은 썸네일과 같은 프로세스 풀에서 실행 (blog.thumbnails.process, blog.imaging.render_avatars)
+- 크기마다 1x / 2x 파일 생성, EXIF 제거
+- 파일명에 원본 내용 + 변환 설정 (크기, 배율, 품질) 해시 포함: avatars/<사용자 ID>/<해시>/32.webp, 32@2x.webp
+  → 원본이나 AVATAR_SIZES / AVATAR_QUALITY 가 바뀌면 URL 도 바뀌므로 만료 없이 캐시 가능 (Cache-Control: immutable)
+- 결과는 User.avatar_variants 에 저장, 이전 해시의 파일은 삭제
+
+템플릿 사용:
+    {% with avatar=comment.author.avatar.32 %}
+    <img src="{{ avatar.src }}" srcset="{{ avatar.srcset }}" width="32" height="32">
+    {% endwith %}
+
+아직 생성되지 않은 경우 (기존 회원 등) 생성 예약 후 원본 URL 사용
+(python manage.py generate_avatars 로 일괄 생성)
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from PIL import Image, UnidentifiedImageError
+
+from blog import background
+from blog.cache_tags import invalidate_tags
+from blog.imaging import render_avatars
+from blog.thumbnails import delete_files, process, save_file
+
+logger = logging.getLogger(__name__)
+
+SCALES = (1, 2)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def avatar_sizes():
+    return tuple(_setting('AVATAR_SIZES', (24, 28, 32, 48, 60, 80, 150)))
+
+
+def avatar_name(user_id, digest, size, scale):
+    suffix = '' if scale == 1 else f'@{scale}x'
+    return f'avatars/{user_id}/{digest}/{size}{suffix}.webp'
+
+
+def avatar_digest(data, sizes, scales, quality):
+    """파일 경로용 해시 (같은 원본이라도 변환 설정이 다르면 다른 값)"""
+    digest = hashlib.sha256(data)
+    digest.update(repr((tuple(sizes), tuple(scales), quality)).encode())
+    return digest.hexdigest()[:16]
+
+
+def _names(meta):
+    return set((meta or {}).get('files', {}).values())
+
+
+@dataclass(frozen=True)
+class AvatarImage:
+    """한 크기의 프로필 이미지 (src: 1x, srcset: 1x, 2x)"""
+    src: str
+    srcset: str = ''
+
+
+class Avatar:
+    """
+    사용자 프로필 이미지의 크기별 URL
+
+    avatar[32] / 템플릿 {{ user.avatar.32.src }}
+    설정에 없는 크기는 그보다 큰 가장 가까운 크기 사용
+    """
+
+    def __init__(self, user):
+        self.user = user
+        meta = user.avatar_variants or {}
+        self.ready = bool(user.profile_image) and meta.get('source') == user.profile_image.name
+        self.files = meta.get('files', {}) if self.ready else {}
+        if user.profile_image and not self.ready and user.pk:
+            schedule(user.pk)
+
+    def __bool__(self):
+        return bool(self.user.profile_image)
+
+    def __getitem__(self, size):
+        return self.image(int(size))
+
+    def _size_for(self, size):
+        sizes = sorted(int(key) for key in self.files if '@' not in key)
+        return next((s for s in sizes if s >= size), sizes[-1] if sizes else None)
+
+    def image(self, size):
+        if not self.user.profile_image:
+            return None
+        storage = self.user.profile_image.storage
+        generated = self._size_for(size)
+        if generated is None:
+            return AvatarImage(src=self.user.profile_image.url)
+        src = storage.url(self.files[str(generated)])
+        retina = self.files.get(f'{generated}@2x')
+        srcset = f'{src} 1x, {storage.url(retina)} 2x' if retina else ''
+        return AvatarImage(src=src, srcset=srcset)
+
+    def urls(self):
+        """전체 크기별 URL (API 용): {'32': {'1x': url, '2x': url}, ...}"""
+        storage = self.user.profile_image.storage
+        result = {}
+        for key, name in self.files.items():
+            size, _, scale = key.partition('@')
+            result.setdefault(size, {})[scale or '1x'] = storage.url(name)
+        return result
+
+
+def schedule(user_id):
+    """크기별 파일 생성 예약 (같은 사용자 중복 예약 무시)"""
+    if not _setting('THUMBNAIL_ASYNC', True):
+        generate(user_id)
+        return
+    background.submit(generate, user_id, key=('avatar', user_id))
+
+
+def generate(user_id):
+    """
+    프로필 이미지 크기별 파일 생성
+
+    이미지가 아니거나 손상된 파일은 오류를 기록하여 반복 시도하지 않음
+
+    Returns:
+        저장된 메타데이터 또는 None (이미지 없음 / 처리 중 변경)
+    """
+    from .models import User
+
+    user = User.objects.filter(pk=user_id).only('id', 'profile_image', 'avatar_variants').first()
+    if user is None or not user.profile_image:
+        return None
+    source = user.profile_image.name
+    storage = user.profile_image.storage
+    previous = user.avatar_variants or {}
+    sizes = avatar_sizes()
+    quality = _setting('AVATAR_QUALITY', 80)
+
+    try:
+        with storage.open(source, 'rb') as file:
+            data = file.read()
+        avatars = process(render_avatars, data, sizes, SCALES, quality)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        logger.warning('프로필 이미지 변환 실패 (user=%s, %s): %s', user_id, source, exc)
+        meta = {'source': source, 'error': str(exc)[:200], 'files': {}}
+    else:
+        digest = avatar_digest(data, sizes, SCALES, quality)
+        meta = {
+            'source': source,
+            'hash': digest,
+            'files': {
+                str(size) if scale == 1 else f'{size}@{scale}x':
+                    save_file(storage, avatar_name(user_id, digest, size, scale), content)
+                for size, scale, content in avatars
+            },
+        }
+
+    # 처리 중 프로필 이미지가 바뀌었으면 이번 결과 폐기
+    if not User.objects.filter(pk=user_id, profile_image=source).update(avatar_variants=meta):
+        delete_files(storage, _names(meta) - _names(previous))
+        return None
+    delete_files(storage, _names(previous) - _names(meta))
+    invalidate_tags(f'user:{user_id}')
+    return meta
+
+
+def delete_avatars(user):
+    """사용자의 크기별 파일 삭제 (회원 삭제 시)"""
+    if user.avatar_variants:
+        delete_files(user._meta.get_field('profile_image').storage, _names(user.avatar_variants))
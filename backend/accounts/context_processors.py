@@ -0,0 +1,19 @@
+"""
+Accounts 앱 - 컨텍스트 프로세서
+==============================
+모든 템플릿에서 사용하는 사용자 관련 값
+
+- unread_notification_count: 읽지 않은 알림 수
+  템플릿에서 처음 사용할 때 한 번만 계산 (요청당 최대 1회, 캐시 우선)
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+from .unread_counter import get_unread_count
+
+
+def notifications(request):
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return {'unread_notification_count': 0}
+    return {'unread_notification_count': SimpleLazyObject(lambda: get_unread_count(user.pk))}
@@ -0,0 +1,57 @@
+"""
+새 게시글 알림 발송 재시도 커맨드
+================================
+대기 / 실패 / 중단된 새 게시글 알림 발송 작업을 마지막 처리 지점부터 이어서 실행
+(서버 재시작 등으로 백그라운드 발송이 끊긴 경우)
+
+웹 워커도 NOTIFICATION_FANOUT_RESUME_INTERVAL 초마다 자동 재개하지만
+(요청이 있을 때만, 실행 횟수 NOTIFICATION_FANOUT_MAX_ATTEMPTS 미만),
+트래픽이 없는 시간대나 반복 실패한 작업을 위해 cron 등으로 주기 실행 권장:
+    */10 * * * *  cd /app/backend && python manage.py fanout_notifications
+
+사용법:
+    python manage.py fanout_notifications
+    python manage.py fanout_notifications --post-id 1 --batch-size 500
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.notifications import resumable_jobs, run_fanout
+
+
+class Command(BaseCommand):
+    help = '미완료 새 게시글 알림 발송 작업을 이어서 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='발송할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='배치당 팔로워 수',
+        )
+
+    def handle(self, *args, **options):
+        queryset = resumable_jobs()
+        if options['post_ids']:
+            queryset = queryset.filter(post_id__in=options['post_ids'])
+
+        def report(job):
+            self.stdout.write(f'  게시글 {job.post_id}: {job.processed}/{job.total} ({job.progress}%)')
+
+        count = 0
+        for job_id in queryset.order_by('created_at').values_list('pk', flat=True):
+            job = run_fanout(job_id, batch_size=options['batch_size'], on_progress=report)
+            if job is None:
+                continue
+            count += 1
+            style = self.style.SUCCESS if job.status == job.DONE else self.style.ERROR
+            self.stdout.write(style(f'게시글 {job.post_id}: {job.get_status_display()} ({job.processed}명)'))
+
+        self.stdout.write(self.style.SUCCESS(f'{count}개 발송 작업을 실행했습니다.'))
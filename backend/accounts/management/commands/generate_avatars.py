@@ -0,0 +1,58 @@
+"""
+프로필 이미지 크기별 파일 생성 커맨드
+===================================
+회원 프로필 이미지의 크기별 WebP 파일 생성 (accounts.avatars)
+기존 회원 일괄 처리 또는 AVATAR_SIZES 변경 후 실행
+
+사용법:
+    python manage.py generate_avatars
+    python manage.py generate_avatars --force
+    python manage.py generate_avatars --user-id 1 --user-id 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.avatars import generate
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    help = '회원 프로필 이미지의 크기별 WebP 파일을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            action='append',
+            type=int,
+            dest='user_ids',
+            help='처리할 회원 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 생성된 회원도 다시 생성',
+        )
+
+    def handle(self, *args, **options):
+        queryset = User.objects.exclude(profile_image='').exclude(profile_image__isnull=True)\
+            .only('id', 'profile_image', 'avatar_variants').order_by('pk')
+        if options['user_ids']:
+            queryset = queryset.filter(pk__in=options['user_ids'])
+
+        generated = failed = 0
+        for user in queryset.iterator(chunk_size=500):
+            current = (user.avatar_variants or {}).get('source') == user.profile_image.name
+            if current and not options['force']:
+                continue
+            meta = generate(user.pk)
+            if meta is None:
+                continue
+            if meta.get('error'):
+                failed += 1
+                self.stderr.write(f'회원 {user.pk}: {meta["error"]}')
+            else:
+                generated += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{generated}명의 프로필 이미지 크기별 파일을 생성했습니다. (실패 {failed}명)'
+        ))
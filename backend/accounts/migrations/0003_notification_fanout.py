@@ -0,0 +1,64 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def mark_published_posts_done(apps, schema_editor):
+    """기존 발행 게시글은 발송 완료로 기록 (배포 후 수정 시 알림이 나가지 않도록)"""
+    Post = apps.get_model('blog', 'Post')
+    NotificationFanout = apps.get_model('accounts', 'NotificationFanout')
+    post_ids = Post.objects.filter(published=True).values_list('pk', flat=True)
+    NotificationFanout.objects.bulk_create(
+        [NotificationFanout(post_id=pk, status='done') for pk in post_ids.iterator()],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_follow_notification_follow_unique_follow'),
+        ('blog', '0011_reaction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationFanout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '진행 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='대상 팔로워 수')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='처리한 팔로워 수')),
+                ('last_follower_id', models.BigIntegerField(default=0, verbose_name='마지막 처리 팔로워 ID')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='실행 횟수')),
+                ('error', models.TextField(blank=True, verbose_name='실패 사유')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='최근 진행')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일')),
+            ],
+            options={
+                'verbose_name': '새 게시글 알림 발송',
+                'verbose_name_plural': '새 게시글 알림 발송 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(fields=['following', 'follower'], name='accounts_fo_followi_844365_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('notification_type', 'new_post')), fields=('recipient', 'post'), name='unique_new_post_notification'),
+        ),
+        migrations.AddField(
+            model_name='notificationfanout',
+            name='post',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='notification_fanout', to='blog.post', verbose_name='게시글'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationfanout',
+            index=models.Index(fields=['status', 'updated_at'], name='accounts_no_status_bf8ae3_idx'),
+        ),
+        migrations.RunPython(mark_published_posts_done, migrations.RunPython.noop),
+    ]
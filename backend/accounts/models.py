@@ -8,13 +8,17 @@ Django의 AbstractUser를 확장하여 추가 필드 제공
 - User: 커스텀 사용자 모델 (이메일, 프로필 이미지, 자기소개)
 - Follow: 팔로우 관계 모델
 - Notification: 알림 모델
+- NotificationFanout: 새 게시글 알림 발송 작업 (진행 상황/재시도 지점)
 """
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.conf import settings
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from .avatars import Avatar
+
 
 class User(AbstractUser):
     """
@@ -34,6 +38,7 @@ class User(AbstractUser):
     
     추가 필드:
     - profile_image: 프로필 이미지
+    - avatar_variants: 프로필 이미지 크기별 파일 목록 (accounts.avatars)
     - bio: 자기소개
     """
     
@@ -55,6 +60,14 @@ class User(AbstractUser):
         help_text=_('프로필 이미지를 업로드하세요.')
     )
     
+    # 프로필 이미지 크기별 파일 (accounts.avatars 에서 생성)
+    avatar_variants = models.JSONField(
+        _('프로필 이미지 크기별 파일'),
+        default=dict,
+        blank=True,
+        editable=False
+    )
+    
     # 자기소개
     bio = models.TextField(
         _('자기소개'),
@@ -78,6 +91,11 @@ class User(AbstractUser):
     def __str__(self):
         return self.username
     
+    @cached_property
+    def avatar(self):
+        """크기별 프로필 이미지 (accounts.avatars.Avatar, 템플릿: user.avatar.32.src)"""
+        return Avatar(self)
+    
     def get_full_name(self):
         """전체 이름 반환 (한국식: 성+이름)"""
         full_name = f'{self.last_name}{self.first_name}'
@@ -104,8 +122,9 @@ class User(AbstractUser):
         return self.following.filter(following=user).exists()
     
     def get_unread_notification_count(self):
-        """읽지 않은 알림 수 반환"""
-        return self.notifications.filter(is_read=False).count()
+        """읽지 않은 알림 수 반환 (캐시 우선)"""
+        from .unread_counter import get_unread_count
+        return get_unread_count(self.pk)
 
 
 class Follow(models.Model):
@@ -147,6 +166,10 @@ class Follow(models.Model):
                 name='unique_follow'
             )
         ]
+        indexes = [
+            # 팔로워 목록 키셋 조회 (새 게시글 알림 발송)
+            models.Index(fields=['following', 'follower']),
+        ]
     
     def __str__(self):
         return f'{self.follower.username} → {self.following.username}'
@@ -227,13 +250,103 @@ class Notification(models.Model):
         verbose_name = '알림'
         verbose_name_plural = '알림 목록'
         ordering = ['-created_at']
+        constraints = [
+            # 새 게시글 알림은 수신자당 1개 (발송 재시도 시 중복 방지)
+            models.UniqueConstraint(
+                fields=['recipient', 'post'],
+                condition=models.Q(notification_type='new_post'),
+                name='unique_new_post_notification'
+            )
+        ]
     
     def __str__(self):
         return f'{self.recipient.username}: {self.message[:30]}'
     
     def mark_as_read(self):
-        """알림을 읽음으로 표시"""
-        if not self.is_read:
-            self.is_read = True
-            self.save(update_fields=['is_read'])
+        """
+        알림을 읽음으로 표시
+
+        Returns:
+            실제로 읽음으로 바뀌었으면 True
+        """
+        from .unread_counter import adjust_unread_count
+
+        if self.is_read:
+            return False
+        self.is_read = True
+        # 동시 요청에서 한 번만 차감되도록 조건부 UPDATE
+        changed = Notification.objects.filter(pk=self.pk, is_read=False).update(is_read=True)
+        if changed:
+            adjust_unread_count(self.recipient_id, -1)
+        return bool(changed)
+
+
+class NotificationFanout(models.Model):
+    """
+    새 게시글 알림 발송 작업
+
+    게시글이 처음 발행될 때 1개 생성되며
+    팔로워를 ID 순으로 나누어 처리한 지점(last_follower_id)을 기록
+
+    필드:
+    - post: 발행된 게시글
+    - status: 대기 / 진행 중 / 완료 / 실패
+    - total: 발송 시작 시점의 팔로워 수
+    - processed: 처리한 팔로워 수
+    - last_follower_id: 마지막으로 처리한 팔로워 ID (재시도 시 이어서 처리)
+    - attempts: 실행 횟수
+    - error: 마지막 실패 사유
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, '대기'),
+        (RUNNING, '진행 중'),
+        (DONE, '완료'),
+        (FAILED, '실패'),
+    ]
+
+    post = models.OneToOneField(
+        'blog.Post',
+        on_delete=models.CASCADE,
+        related_name='notification_fanout',
+        verbose_name='게시글'
+    )
+    status = models.CharField(
+        '상태',
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=PENDING
+    )
+    total = models.PositiveIntegerField('대상 팔로워 수', default=0)
+    processed = models.PositiveIntegerField('처리한 팔로워 수', default=0)
+    last_follower_id = models.BigIntegerField('마지막 처리 팔로워 ID', default=0)
+    attempts = models.PositiveSmallIntegerField('실행 횟수', default=0)
+    error = models.TextField('실패 사유', blank=True)
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    updated_at = models.DateTimeField('최근 진행', auto_now=True)
+    finished_at = models.DateTimeField('완료일', null=True, blank=True)
+
+    class Meta:
+        verbose_name = '새 게시글 알림 발송'
+        verbose_name_plural = '새 게시글 알림 발송 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.post_id}: {self.get_status_display()} ({self.progress}%)'
 
+    @property
+    def progress(self):
+        """진행률 (%)"""
+        if self.status == self.DONE:
+            return 100
+        if not self.total:
+            return 0
+        return min(100, self.processed * 100 // self.total)
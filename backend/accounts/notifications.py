@@ -0,0 +1,251 @@
+"""
+Accounts 앱 - 새 게시글 알림 발송
+================================
+게시글이 처음 발행되면 작성자의 팔로워 전원에게 new_post 알림 생성
+작성자의 요청 안에서 팔로워 수만큼 INSERT 하지 않고 백그라운드에서 나누어 처리
+
+동작 방식:
+- schedule_new_post_fanout(): 게시글당 NotificationFanout 작업 1개 생성
+  (트랜잭션 커밋 후 백그라운드 작업 스레드에서 실행, blog.background)
+- run_fanout(): 팔로워를 ID 순으로 NOTIFICATION_FANOUT_BATCH_SIZE 명씩 읽어
+  bulk_create 후 처리 지점(last_follower_id)과 진행 수를 같은 트랜잭션에 기록
+- 실패/중단된 작업은 기록된 지점부터 이어서 처리
+  - 자동: 요청이 들어오면 NOTIFICATION_FANOUT_RESUME_INTERVAL 초에 한 번 (전체 워커 중 1곳)
+    재시도 대상 작업을 백그라운드에서 이어서 실행 (maybe_resume_jobs, accounts.signals)
+    → 배포/재시작으로 끊긴 발송도 다음 요청부터 재개
+    실행 횟수가 NOTIFICATION_FANOUT_MAX_ATTEMPTS 이상인 작업은 자동 재시도하지 않음
+  - 수동: python manage.py fanout_notifications (횟수 제한 없음, cron 예시는 커맨드 설명 참고)
+
+중복 방지:
+- 게시글당 작업 1개 (OneToOne) → 재발행/재저장 시 다시 발송하지 않음
+- (수신자, 게시글) new_post 알림 유니크 제약 + ignore_conflicts
+  → 같은 배치를 재시도해도 알림이 중복 생성되지 않음
+- 작업 점유는 조건부 UPDATE 1회 → 같은 작업을 두 곳에서 동시에 실행하지 않음
+
+배치마다 수신자의 읽지 않은 알림 수 캐시를 삭제 (accounts.unread_counter)
+같은 배치에서 팔로워 피드(blog.timeline)에도 게시글 추가
+(팔로워가 TIMELINE_FANOUT_MAX_FOLLOWERS 를 넘으면 피드 조회 시 반영)
+
+설정:
+- NOTIFICATION_FANOUT_BATCH_SIZE: 배치당 팔로워 수
+- NOTIFICATION_FANOUT_ASYNC: False 이면 커밋 직후 현재 스레드에서 실행
+- NOTIFICATION_FANOUT_STALE_AFTER: 진행 기록이 없는 실행 중 작업을 재시도 대상으로 보는 시간 (초)
+- NOTIFICATION_FANOUT_RESUME_INTERVAL: 자동 재시도 확인 주기 (초, 0 이면 자동 재시도 안 함)
+- NOTIFICATION_FANOUT_MAX_ATTEMPTS: 자동 재시도 최대 실행 횟수
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from blog import background, timeline
+
+from .models import Follow, Notification, NotificationFanout
+from .unread_counter import invalidate_unread_counts
+
+logger = logging.getLogger(__name__)
+
+RESUME_LOCK_KEY = 'notifications:fanout_resume'
+
+_resume_lock = threading.Lock()
+_next_resume_check = 0.0
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def schedule_new_post_fanout(post):
+    """
+    발행된 게시글의 알림 발송 예약
+
+    이미 작업이 있으면 (이전에 발행된 적 있음) 아무것도 하지 않음
+
+    Returns:
+        새로 생성된 NotificationFanout 또는 None
+    """
+    job, created = NotificationFanout.objects.get_or_create(post=post)
+    if not created:
+        return None
+    transaction.on_commit(lambda: start_fanout(job.pk))
+    return job
+
+
+def start_fanout(job_id):
+    """작업 실행 (설정에 따라 백그라운드 또는 현재 스레드)"""
+    if not _setting('NOTIFICATION_FANOUT_ASYNC', True):
+        return run_fanout(job_id)
+    background.submit(run_fanout, job_id, key=('notification_fanout', job_id))
+    return None
+
+
+def resumable_jobs():
+    """재시도 대상 작업 (대기 / 실패 / 진행 기록이 끊긴 실행 중)"""
+    stale_before = timezone.now() - timedelta(
+        seconds=_setting('NOTIFICATION_FANOUT_STALE_AFTER', 300)
+    )
+    return NotificationFanout.objects.filter(
+        Q(status__in=[NotificationFanout.PENDING, NotificationFanout.FAILED])
+        | Q(status=NotificationFanout.RUNNING, updated_at__lt=stale_before)
+    )
+
+
+def resume_stale_jobs():
+    """
+    재시도 대상 작업을 오래된 순으로 이어서 실행 (실행 횟수 NOTIFICATION_FANOUT_MAX_ATTEMPTS 미만)
+
+    Returns:
+        실행한 작업 수
+    """
+    job_ids = list(
+        resumable_jobs()
+        .filter(attempts__lt=_setting('NOTIFICATION_FANOUT_MAX_ATTEMPTS', 5))
+        .order_by('created_at')
+        .values_list('pk', flat=True)
+    )
+    count = 0
+    for job_id in job_ids:
+        if run_fanout(job_id) is not None:
+            count += 1
+    if count:
+        logger.info('중단된 새 게시글 알림 발송 %d건 재개', count)
+    return count
+
+
+def maybe_resume_jobs():
+    """
+    자동 재시도 (요청마다 호출, 워커별 / 전체 워커에서 NOTIFICATION_FANOUT_RESUME_INTERVAL 초에 1회만 실행)
+
+    워커 안에서는 시각만 비교하고, 주기가 지났을 때만 공유 캐시 잠금 확인
+    """
+    global _next_resume_check
+
+    interval = _setting('NOTIFICATION_FANOUT_RESUME_INTERVAL', 60)
+    if not interval:
+        return
+    now = time.monotonic()
+    with _resume_lock:
+        if now < _next_resume_check:
+            return
+        _next_resume_check = now + interval
+    if not cache.add(RESUME_LOCK_KEY, 1, interval):
+        return
+    if not _setting('NOTIFICATION_FANOUT_ASYNC', True):
+        resume_stale_jobs()
+        return
+    background.submit(resume_stale_jobs, key='notification_fanout_resume')
+
+
+def _claim(job_id):
+    """작업 점유 (다른 실행자가 진행 중이면 False)"""
+    return resumable_jobs().filter(pk=job_id).update(
+        status=NotificationFanout.RUNNING,
+        attempts=F('attempts') + 1,
+        error='',
+        updated_at=timezone.now(),
+    ) == 1
+
+
+def run_fanout(job_id, batch_size=None, on_progress=None):
+    """
+    알림 발송 작업 실행 (마지막 처리 지점부터)
+
+    Args:
+        job_id: NotificationFanout ID
+        batch_size: 배치당 팔로워 수 (기본: NOTIFICATION_FANOUT_BATCH_SIZE)
+        on_progress: 배치마다 호출되는 콜백 (job)
+
+    Returns:
+        NotificationFanout 또는 None (다른 실행자가 점유 중)
+    """
+    if not _claim(job_id):
+        return None
+    batch_size = batch_size or _setting('NOTIFICATION_FANOUT_BATCH_SIZE', 1000)
+    job = NotificationFanout.objects.select_related('post__author').get(pk=job_id)
+
+    try:
+        _send(job, batch_size, on_progress)
+    except Exception as exc:
+        logger.exception('새 게시글 알림 발송 실패 (post=%s, 처리 %d명)', job.post_id, job.processed)
+        NotificationFanout.objects.filter(pk=job.pk).update(
+            status=NotificationFanout.FAILED,
+            error=str(exc)[:1000],
+            updated_at=timezone.now(),
+        )
+        job.status = NotificationFanout.FAILED
+        return job
+
+    job.status = NotificationFanout.DONE
+    job.finished_at = timezone.now()
+    NotificationFanout.objects.filter(pk=job.pk).update(
+        status=job.status,
+        finished_at=job.finished_at,
+        updated_at=job.finished_at,
+    )
+    logger.info('새 게시글 알림 발송 완료 (post=%s, %d명)', job.post_id, job.processed)
+    return job
+
+
+def _send(job, batch_size, on_progress):
+    post = job.post
+    author = post.author
+    # 발행 취소된 게시글은 남은 팔로워에게 발송하지 않음
+    if not post.published:
+        return
+
+    followers = Follow.objects.filter(following_id=author.pk)
+    job.total = job.processed + followers.filter(follower_id__gt=job.last_follower_id).count()
+    NotificationFanout.objects.filter(pk=job.pk).update(total=job.total)
+
+    push_timeline = not timeline.should_pull(job.total)
+    if not push_timeline:
+        timeline.mark_pull(post)
+
+    message = Truncator(f'{author.username}님이 새 글을 발행했습니다: {post.title}').chars(255)
+
+    while True:
+        follower_ids = list(
+            followers.filter(follower_id__gt=job.last_follower_id)
+            .order_by('follower_id')
+            .values_list('follower_id', flat=True)[:batch_size]
+        )
+        if not follower_ids:
+            return
+
+        with transaction.atomic():
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        recipient_id=follower_id,
+                        sender_id=author.pk,
+                        notification_type='new_post',
+                        post_id=post.pk,
+                        message=message,
+                    )
+                    for follower_id in follower_ids
+                ],
+                ignore_conflicts=True,
+            )
+            if push_timeline:
+                timeline.push_post(post, follower_ids)
+            NotificationFanout.objects.filter(pk=job.pk).update(
+                processed=F('processed') + len(follower_ids),
+                last_follower_id=follower_ids[-1],
+                updated_at=timezone.now(),
+            )
+        # bulk_create 는 시그널이 없으므로 수신자 읽지 않은 알림 수 캐시 삭제
+        invalidate_unread_counts(follower_ids)
+
+        job.processed += len(follower_ids)
+        job.last_follower_id = follower_ids[-1]
+        logger.debug('새 게시글 알림 발송 중 (post=%s, %d/%d)', post.pk, job.processed, job.total)
+        if on_progress is not None:
+            on_progress(job)
@@ -18,8 +18,10 @@ class UserSerializer(serializers.ModelSerializer):
     
     읽기 전용: 사용자 정보 조회용
     비밀번호는 제외
+    avatar: 크기별 프로필 이미지 URL {"32": {"1x": url, "2x": url}, ...} (accounts.avatars)
     """
     
+    avatar = serializers.SerializerMethodField()
     post_count = serializers.SerializerMethodField()
     comment_count = serializers.SerializerMethodField()
     
@@ -27,11 +29,21 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = [
             'id', 'username', 'email', 'first_name', 'last_name',
-            'profile_image', 'bio', 'date_joined',
+            'profile_image', 'avatar', 'bio', 'date_joined',
             'post_count', 'comment_count'
         ]
         read_only_fields = ['id', 'date_joined']
     
+    def get_avatar(self, obj):
+        if not obj.profile_image:
+            return None
+        request = self.context.get('request')
+        absolute = request.build_absolute_uri if request is not None else str
+        return {
+            size: {scale: absolute(url) for scale, url in urls.items()}
+            for size, urls in obj.avatar.urls().items()
+        }
+    
     def get_post_count(self, obj):
         return obj.get_post_count()
     
@@ -0,0 +1,116 @@
+"""
+Accounts 앱 - 시그널
+====================
+- 읽지 않은 알림 수: 알림 생성 시 수신자 카운터 증가
+- 팔로잉 피드: 팔로우 시 작성자 최근 게시글 추가, 언팔로우 시 삭제
+- 사이트 통계: 회원 가입/삭제, 활성 상태 변경 시 회원 수 증감 (blog.site_stats)
+- 프로필 이미지: 변경 시 크기별 파일 생성 예약, 회원 삭제 시 파일 삭제 (accounts.avatars)
+- 캐시 의존성 태그: 팔로우/언팔로우, 회원 정보 변경 시 user:<id> 갱신 (blog.cache_tags)
+- 새 게시글 알림: 요청 시작 시 중단된 발송 작업 자동 재개 (주기 제한, accounts.notifications)
+"""
+
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+
+from blog import site_stats, timeline
+from blog.cache_tags import invalidate_tags
+
+from . import avatars, notifications
+from .models import Follow, Notification, User
+from .unread_counter import adjust_unread_count
+
+
+@receiver(request_started)
+def resume_notification_fanout(sender, **kwargs):
+    """배포/재시작으로 끊긴 새 게시글 알림 발송 재개 (NOTIFICATION_FANOUT_RESUME_INTERVAL 초에 1회)"""
+    notifications.maybe_resume_jobs()
+
+
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created, raw=False, **kwargs):
+    """새 알림 생성 시 읽지 않은 알림 수 증가"""
+    if created and not raw and not instance.is_read:
+        adjust_unread_count(instance.recipient_id, 1)
+
+
+@receiver(post_save, sender=Follow)
+def backfill_timeline(sender, instance, created, raw=False, **kwargs):
+    """팔로우 시 작성자의 최근 게시글을 피드에 추가"""
+    if created and not raw:
+        timeline.backfill(instance.follower_id, instance.following_id)
+
+
+@receiver(post_delete, sender=Follow)
+def clear_timeline(sender, instance, **kwargs):
+    """언팔로우 시 작성자의 게시글을 피드에서 삭제"""
+    timeline.remove_author(instance.follower_id, instance.following_id)
+
+
+@receiver(pre_save, sender=User)
+def remember_user_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """저장 전 회원 활성 상태 기억 (로그인 시각만 저장하는 경우 등은 생략)"""
+    instance._was_active = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and 'is_active' not in update_fields:
+        return
+    instance._was_active = User.objects.filter(pk=instance.pk)\
+        .values_list('is_active', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def count_user(sender, instance, created, raw=False, **kwargs):
+    """회원 가입/활성 상태 변경 시 회원 수 증감"""
+    if raw:
+        return
+    if created:
+        site_stats.adjust(users=1, active_users=1 if instance.is_active else 0)
+        return
+    was_active = getattr(instance, '_was_active', None)
+    if was_active is not None and was_active != instance.is_active:
+        site_stats.adjust(active_users=1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=User)
+def uncount_user(sender, instance, **kwargs):
+    """회원 삭제 시 회원 수 감소"""
+    site_stats.adjust(users=-1, active_users=-1 if instance.is_active else 0)
+
+
+@receiver(post_save, sender=User)
+def generate_avatars(sender, instance, raw=False, update_fields=None, **kwargs):
+    """프로필 이미지가 바뀌었으면 커밋 후 크기별 파일 생성"""
+    if raw or not instance.profile_image:
+        return
+    if update_fields is not None and 'profile_image' not in update_fields:
+        return
+    if (instance.avatar_variants or {}).get('source') == instance.profile_image.name:
+        return
+    user_id = instance.pk
+    transaction.on_commit(lambda: avatars.schedule(user_id))
+
+
+@receiver(post_delete, sender=User)
+def delete_avatars(sender, instance, **kwargs):
+    """회원 삭제 시 크기별 파일 삭제 (커밋 후)"""
+    if instance.avatar_variants:
+        transaction.on_commit(lambda: avatars.delete_avatars(instance))
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def invalidate_follow_cache_tags(sender, instance, raw=False, **kwargs):
+    """팔로우 변경 시 양쪽 사용자 태그 갱신"""
+    if not raw:
+        invalidate_tags(f'user:{instance.follower_id}', f'user:{instance.following_id}')
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache_tags(sender, instance, raw=False, update_fields=None, **kwargs):
+    """회원 정보 변경 시 사용자 태그 갱신 (로그인 시각만 저장된 경우 제외)"""
+    if raw or (update_fields and set(update_fields) <= {'last_login'}):
+        return
+    invalidate_tags(f'user:{instance.pk}')
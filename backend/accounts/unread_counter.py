@@ -0,0 +1,74 @@
+"""
+Accounts 앱 - 읽지 않은 알림 수
+==============================
+사용자별 읽지 않은 알림 수를 캐시에 유지
+페이지마다 COUNT(*) 를 실행하지 않음
+
+갱신 시점:
+- 알림 생성 (post_save): +1
+- 읽음 처리: -1 (실제로 읽음으로 바뀐 경우만)
+- 모두 읽음: 0
+- 삭제 (delete_notification 뷰): -1 (읽지 않은 알림인 경우만)
+- 일괄 생성 (bulk_create, 시그널 없음): 해당 수신자 캐시 삭제
+
+자가 복구:
+- 캐시에 없으면 DB COUNT 후 저장 (NOTIFICATION_UNREAD_TTL 동안 유지)
+- 캐시에 없는 상태에서의 증감은 무시 (다음 조회 시 DB 기준으로 계산)
+- 음수가 되면 캐시 삭제 (어긋난 값 폐기)
+- 알림 목록 페이지 조회 시 DB 기준 값으로 다시 저장
+- CASCADE 삭제 등 추적하지 않는 변경은 TTL 만료 시 보정
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _key(user_id):
+    return f'notifications:unread:{user_id}'
+
+
+def _ttl():
+    return getattr(settings, 'NOTIFICATION_UNREAD_TTL', 300)
+
+
+def count_unread(user_id):
+    """DB 기준 읽지 않은 알림 수"""
+    from .models import Notification
+
+    return Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+
+
+def get_unread_count(user_id):
+    """읽지 않은 알림 수 (캐시 우선, 없으면 DB)"""
+    count = cache.get(_key(user_id))
+    if count is None:
+        count = count_unread(user_id)
+        cache.add(_key(user_id), count, _ttl())
+    return count
+
+
+def refresh_unread_count(user_id):
+    """DB 기준으로 다시 계산하여 저장"""
+    count = count_unread(user_id)
+    cache.set(_key(user_id), count, _ttl())
+    return count
+
+
+def adjust_unread_count(user_id, delta):
+    """캐시된 값 증감 (캐시에 없으면 무시)"""
+    key = _key(user_id)
+    try:
+        count = cache.incr(key, delta)
+    except ValueError:
+        return
+    if count < 0:
+        cache.delete(key)
+
+
+def set_unread_count(user_id, count):
+    cache.set(_key(user_id), count, _ttl())
+
+
+def invalidate_unread_counts(user_ids):
+    """여러 사용자 캐시 삭제 (다음 조회 시 DB 기준으로 계산)"""
+    cache.delete_many([_key(user_id) for user_id in set(user_ids)])
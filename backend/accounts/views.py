@@ -6,7 +6,6 @@ Accounts 앱 - 뷰
 """
 
 from django.shortcuts import render, redirect, get_object_or_404
-from django.db.models import Q, Count
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import LoginView, LogoutView
@@ -16,8 +15,12 @@ from django.urls import reverse_lazy
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 
+from blog.models import Post, PostQuerySet
+from blog.search import search_posts
+
 from .models import User, Follow, Notification
 from .forms import CustomUserCreationForm, CustomAuthenticationForm, UserProfileForm
+from .unread_counter import adjust_unread_count, get_unread_count, refresh_unread_count, set_unread_count
 
 
 class RegisterView(CreateView):
@@ -98,7 +101,7 @@ class ProfileView(DetailView):
         # 작성한 게시글
         context['user_posts'] = self.object.posts.filter(
             published=True
-        ).select_related('category').order_by('-created_at')
+        ).select_related('category').for_list().order_by('-created_at')
 
         # 북마크한 게시글 (필터링 및 정렬 지원)
         search_query = self.request.GET.get('bookmark_q', '')
@@ -107,12 +110,11 @@ class ProfileView(DetailView):
         bookmarked_posts = self.object.bookmarks.all()
         
         if search_query:
-            bookmarked_posts = bookmarked_posts.filter(
-                Q(post__title__icontains=search_query) | 
-                Q(post__content__icontains=search_query)
-            )
+            matched = search_posts(Post.objects.all(), search_query)
+            bookmarked_posts = bookmarked_posts.filter(post__in=matched.values('pk'))
         
-        context['bookmarked_posts'] = bookmarked_posts.select_related('post', 'post__author', 'post__category').order_by(sort_order)
+        context['bookmarked_posts'] = bookmarked_posts.select_related('post', 'post__author', 'post__category')\
+            .defer(*PostQuerySet.list_deferred_fields('post__')).order_by(sort_order)
         context['bookmark_q'] = search_query
         context['bookmark_sort'] = sort_order
         
@@ -232,7 +234,8 @@ def notification_list(request):
         'sender', 'post', 'comment'
     ).order_by('-created_at')[:50]
     
-    unread_count = request.user.get_unread_notification_count()
+    # 목록 조회 시 DB 기준으로 다시 계산 (캐시 값 보정)
+    unread_count = refresh_unread_count(request.user.pk)
     
     return render(request, 'accounts/notification_list.html', {
         'notifications': notifications,
@@ -251,7 +254,7 @@ def mark_notification_read(request, pk):
     
     return JsonResponse({
         'success': True,
-        'unread_count': request.user.get_unread_notification_count()
+        'unread_count': get_unread_count(request.user.pk)
     })
 
 
@@ -260,6 +263,7 @@ def mark_notification_read(request, pk):
 def mark_all_notifications_read(request):
     """모든 알림 읽음 처리"""
     request.user.notifications.filter(is_read=False).update(is_read=True)
+    set_unread_count(request.user.pk, 0)
     
     return JsonResponse({
         'success': True,
@@ -274,6 +278,8 @@ def delete_notification(request, pk):
         Notification, pk=pk, recipient=request.user
     )
     notification.delete()
+    if not notification.is_read:
+        adjust_unread_count(request.user.pk, -1)
     messages.success(request, '알림이 삭제되었습니다.')
     return redirect('accounts:notification_list')
 
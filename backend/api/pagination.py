@@ -0,0 +1,79 @@
+"""
+API 앱 - 페이지네이션
+====================
+DRF 키셋(커서) 페이지네이션
+blog.pagination 의 키셋 조회를 DRF 응답 형식으로 제공
+
+응답 형식:
+    {
+        "next": "http://.../api/posts/?cursor=...",
+        "previous": null,
+        "results": [...]
+    }
+
+?ordering=, ?search=, 필터 파라미터와 함께 사용 가능하며
+커서는 같은 정렬에서만 유효 (정렬이 바뀌면 첫 페이지부터 다시 조회)
+"""
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from blog.pagination import InvalidCursor, paginate
+
+
+class KeysetPagination(BasePagination):
+    """키셋 페이지네이션 (전체 개수 없음, 깊이와 무관한 조회 비용)"""
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        cursor = request.query_params.get(self.cursor_query_param)
+        try:
+            self.page = paginate(queryset, cursor, self.page_size)
+        except InvalidCursor:
+            raise NotFound(self.invalid_cursor_message)
+        return list(self.page.object_list)
+
+    def _link(self, cursor):
+        if not cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self._link(self.page.next_cursor)
+
+    def get_previous_link(self):
+        return self._link(self.page.previous_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': '페이지 커서 (next/previous 링크에 포함)',
+            'schema': {'type': 'string'},
+        }]
@@ -11,7 +11,10 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
 from rest_framework.authtoken.models import Token
 from rest_framework.views import APIView
+from rest_framework.filters import OrderingFilter
+from django_filters.rest_framework import DjangoFilterBackend
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from accounts.models import User
@@ -19,13 +22,14 @@ from accounts.serializers import (
     UserSerializer, RegisterSerializer, 
     LoginSerializer, PasswordChangeSerializer
 )
-from blog.models import Category, Post, Comment
+from blog.models import Category, Post, PostQuerySet, Comment
 from blog.serializers import (
     CategorySerializer,
     PostListSerializer, PostDetailSerializer, PostCreateUpdateSerializer,
     CommentSerializer, CommentCreateSerializer
 )
-from blog.filters import PostFilter, CommentFilter
+from blog.filters import PostFilter, CommentFilter, PostSearchFilter
+from blog.counters import adjust_post_counters
 
 
 # ===========================================
@@ -183,17 +187,20 @@ class PostViewSet(viewsets.ModelViewSet):
     DELETE /api/posts/{slug}/    - 삭제 (작성자)
     
     필터 파라미터:
-    - search: 제목/내용 검색
+    - search: 전문 검색 (정확도순)
     - category: 카테고리 슬러그
     - author: 작성자 username
+    - ordering: created_at, views, title, likes_count (- 접두사로 내림차순)
+    - cursor: 페이지 커서 (응답의 next/previous 링크)
     """
     queryset = Post.objects.filter(published=True)\
-        .select_related('author', 'category')\
-        .prefetch_related('comments')
+        .select_related('author', 'category')
     permission_classes = [IsAuthenticatedOrReadOnly]
+    # 검색 필터가 마지막에 적용되어야 ?ordering= 이 없을 때 정확도순 정렬 유지
+    filter_backends = [DjangoFilterBackend, OrderingFilter, PostSearchFilter]
     filterset_class = PostFilter
     search_fields = ['title', 'content']
-    ordering_fields = ['created_at', 'views', 'title']
+    ordering_fields = ['created_at', 'views', 'title', 'likes_count']
     ordering = ['-created_at']
     lookup_field = 'slug'
     
@@ -214,6 +221,11 @@ class PostViewSet(viewsets.ModelViewSet):
                 author=self.request.user
             )
             queryset = queryset.select_related('author', 'category')
+        # 검색 색인은 읽지 않고, 목록은 본문도 제외 (DISTINCT 비교 대상에서도 제외)
+        if self.action == 'list':
+            queryset = queryset.for_list()
+        else:
+            queryset = queryset.defer(*PostQuerySet.SEARCH_INDEX_FIELDS)
         return queryset.distinct()
     
     def perform_create(self, serializer):
@@ -262,7 +274,8 @@ class CommentViewSet(viewsets.ModelViewSet):
     DELETE /api/comments/{id}/      - 삭제 (작성자)
     """
     queryset = Comment.objects.filter(is_active=True)\
-        .select_related('author', 'post')
+        .select_related('author', 'post')\
+        .defer(*PostQuerySet.list_deferred_fields('post__'))
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     filterset_class = CommentFilter
@@ -290,8 +303,12 @@ class CommentViewSet(viewsets.ModelViewSet):
                 {'error': '본인의 댓글만 삭제할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        instance.is_active = False
-        instance.save()
+        with transaction.atomic():
+            was_active = instance.is_active
+            instance.is_active = False
+            instance.save()
+            if was_active:
+                adjust_post_counters(instance.post_id, comment_count=-1)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -5,9 +5,12 @@ Django Admin에서 게시글, 댓글, 카테고리 관리
 """
 
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 
 from .models import Category, Post, Comment
+from .counters import refresh_comment_counts
+from . import site_stats
 
 
 @admin.register(Category)
@@ -21,14 +24,10 @@ class CategoryAdmin(admin.ModelAdmin):
     - 게시글 수 표시
     """
     
-    list_display = ('name', 'slug', 'get_post_count', 'created_at')
+    list_display = ('name', 'slug', 'post_count', 'created_at')
     search_fields = ('name', 'description')
     prepopulated_fields = {'slug': ('name',)}
     ordering = ('name',)
-    
-    def get_post_count(self, obj):
-        return obj.get_post_count()
-    get_post_count.short_description = '게시글 수'
 
 
 @admin.register(Post)
@@ -68,12 +67,12 @@ class PostAdmin(admin.ModelAdmin):
             'fields': ('published',)
         }),
         ('통계', {
-            'fields': ('views',),
+            'fields': ('views', 'likes_count', 'dislikes_count', 'comment_count', 'bookmark_count'),
             'classes': ('collapse',)
         }),
     )
     
-    readonly_fields = ('views',)
+    readonly_fields = ('views', 'likes_count', 'dislikes_count', 'comment_count', 'bookmark_count')
     
     def thumbnail_preview(self, obj):
         """썸네일 미리보기"""
@@ -87,14 +86,30 @@ class PostAdmin(admin.ModelAdmin):
     
     actions = ['make_published', 'make_unpublished']
     
+    def _set_published(self, queryset, published):
+        """
+        발행 상태 일괄 변경
+
+        게시글마다 save(update_fields=['published']) 로 저장하여 post_save 시그널 처리를 그대로 적용
+        (게시글 수, 사이트 통계, 리더보드, 팔로잉 피드 삭제/복원, 팔로워 알림, 관련 게시글 색인, 페이지 캐시 태그)
+        상태가 이미 같은 게시글은 건너뜀
+        """
+        count = 0
+        with transaction.atomic():
+            for post in queryset.exclude(published=published).select_for_update():
+                post.published = published
+                post.save(update_fields=['published'])
+                count += 1
+        return count
+    
     @admin.action(description='선택한 게시글 발행')
     def make_published(self, request, queryset):
-        count = queryset.update(published=True)
+        count = self._set_published(queryset, True)
         self.message_user(request, f'{count}개의 게시글이 발행되었습니다.')
     
     @admin.action(description='선택한 게시글 비공개')
     def make_unpublished(self, request, queryset):
-        count = queryset.update(published=False)
+        count = self._set_published(queryset, False)
         self.message_user(request, f'{count}개의 게시글이 비공개되었습니다.')
 
 
@@ -107,6 +122,7 @@ class CommentAdmin(admin.ModelAdmin):
     - 댓글 목록 (게시글, 작성자, 내용 미리보기)
     - 활성/비활성 상태 관리
     - 일괄 삭제(비활성화) 처리
+    - 변경 시 게시글 댓글 수(comment_count) 재계산
     """
     
     list_display = (
@@ -137,10 +153,37 @@ class CommentAdmin(admin.ModelAdmin):
     
     @admin.action(description='선택한 댓글 활성화')
     def activate_comments(self, request, queryset):
-        count = queryset.update(is_active=True)
+        with transaction.atomic():
+            post_ids = set(queryset.values_list('post_id', flat=True))
+            count = queryset.update(is_active=True)
+            refresh_comment_counts(post_ids)
+            site_stats.reconcile(['active_comments'])
         self.message_user(request, f'{count}개의 댓글이 활성화되었습니다.')
     
     @admin.action(description='선택한 댓글 비활성화 (삭제)')
     def deactivate_comments(self, request, queryset):
-        count = queryset.update(is_active=False)
+        with transaction.atomic():
+            post_ids = set(queryset.values_list('post_id', flat=True))
+            count = queryset.update(is_active=False)
+            refresh_comment_counts(post_ids)
+            site_stats.reconcile(['active_comments'])
         self.message_user(request, f'{count}개의 댓글이 비활성화되었습니다.')
+    
+    def save_model(self, request, obj, form, change):
+        """개별 수정 시 댓글 수 재계산"""
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            refresh_comment_counts([obj.post_id])
+    
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            post_id = obj.post_id
+            super().delete_model(request, obj)
+            refresh_comment_counts([post_id])
+    
+    def delete_queryset(self, request, queryset):
+        """일괄 삭제 액션"""
+        with transaction.atomic():
+            post_ids = set(queryset.values_list('post_id', flat=True))
+            super().delete_queryset(request, queryset)
+            refresh_comment_counts(post_ids)
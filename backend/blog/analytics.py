@@ -0,0 +1,299 @@
+"""
+Blog 앱 - 게시글 활동 통계
+=========================
+게시글별 조회수/좋아요/댓글/북마크 증감을 날짜별로 집계
+Post.views 같은 누적 값만으로는 볼 수 없는 기간별 추이 제공
+
+저장 구조:
+- PostActivityHour: (게시글, 시간) 당 한 행 (최근 ANALYTICS_HOURLY_RETENTION_DAYS 일)
+- PostActivityDay: (게시글, 날짜) 당 한 행 (그 이전)
+
+기록 흐름:
+- 요청 경로에서 record_activity() → 프로세스 메모리 버퍼에 (게시글, 시간, 지표)별 누적
+  (조회: blog.view_counter, 좋아요: blog.reactions, 댓글/북마크: blog.signals)
+- ANALYTICS_FLUSH_INTERVAL 초마다 시간별 행에 views = views + n 으로 일괄 반영
+- flush 후 ANALYTICS_COMPACT_INTERVAL 초에 1회 compact():
+  보관 기간이 지난 시간별 행을 일별 행에 더하고 삭제 (같은 트랜잭션)
+
+조회 (일별 + 아직 합치지 않은 시간별 행 합계):
+- top_posts(): 최근 N일 지표 합계 상위 게시글
+- post_series(): 게시글별 일별 추이 (스파크라인)
+- site_series(): 사이트 전체 일별 추이 (관리자 대시보드 차트)
+
+사용 예:
+    record_activity(post.pk, likes=1)
+    for post in top_posts(days=7):
+        post.period_total
+"""
+
+import atexit
+import heapq
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from . import background
+from .models import Post, PostActivityDay, PostActivityHour
+from .view_counter import ViewCountBuffer
+
+METRICS = ('views', 'likes', 'comments', 'bookmarks')
+
+COMPACT_LOCK_KEY = 'analytics:compacted'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _group_deltas(rows):
+    """증감값이 같은 행끼리 묶기: {(날짜/시간, ((지표, 증감), ...)): [게시글 ID]}"""
+    groups = defaultdict(list)
+    for (post_id, bucket), deltas in rows.items():
+        groups[(bucket, tuple(sorted(deltas.items())))].append(post_id)
+    return groups
+
+
+class ActivityBuffer(ViewCountBuffer):
+    """
+    (게시글 ID, 시간, 지표)별 증감 버퍼
+
+    주기 flush / 실패 시 재시도 / 지표는 ViewCountBuffer 와 동일
+    flush 시 PostActivityHour 에 누적
+    """
+
+    def _write(self, pending):
+        rows = defaultdict(lambda: defaultdict(int))
+        for (post_id, hour, metric), delta in pending.items():
+            rows[(post_id, hour)][metric] += delta
+
+        # 버퍼에 있는 동안 삭제된 게시글 제외
+        post_ids = {post_id for post_id, _ in rows}
+        existing = set(Post.objects.filter(pk__in=post_ids).values_list('pk', flat=True))
+        rows = {
+            key: {metric: delta for metric, delta in deltas.items() if delta}
+            for key, deltas in rows.items()
+            if key[0] in existing
+        }
+        rows = {key: deltas for key, deltas in rows.items() if deltas}
+        if not rows:
+            return
+
+        with transaction.atomic():
+            PostActivityHour.objects.bulk_create(
+                [PostActivityHour(post_id=post_id, hour=hour) for post_id, hour in rows],
+                ignore_conflicts=True,
+            )
+            for (hour, deltas), post_ids in _group_deltas(rows).items():
+                PostActivityHour.objects.filter(hour=hour, post_id__in=post_ids).update(**{
+                    metric: F(metric) + delta for metric, delta in deltas
+                })
+
+    def _notify(self, pending):
+        schedule_compaction()
+
+
+activity_buffer = ActivityBuffer(
+    flush_interval=_setting('ANALYTICS_FLUSH_INTERVAL', 60),
+    max_pending=_setting('ANALYTICS_MAX_PENDING', 5000),
+)
+
+# 프로세스 종료 시 남은 증감 반영
+atexit.register(activity_buffer.shutdown)
+
+
+def record_activity(post_id, **deltas):
+    """
+    게시글 활동 기록
+
+    Args:
+        post_id: 게시글 ID
+        **deltas: 지표=증감값 (예: views=1, likes=-1)
+    """
+    hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+    for metric, delta in deltas.items():
+        if metric in METRICS and delta:
+            activity_buffer.record((post_id, hour, metric), delta)
+
+
+def flush_activity():
+    """대기 중인 증감 즉시 반영"""
+    return activity_buffer.flush()
+
+
+# ==================== 시간별 → 일별 ====================
+
+def _day_start(date):
+    """TIME_ZONE 기준 날짜의 0시"""
+    return timezone.make_aware(datetime.combine(date, time.min))
+
+
+def compaction_cutoff(keep_days=None):
+    """이 시각 이전의 시간별 행을 일별로 합침 (오늘 포함 keep_days 일 보관)"""
+    keep_days = keep_days or _setting('ANALYTICS_HOURLY_RETENTION_DAYS', 2)
+    return _day_start(timezone.localdate() - timedelta(days=keep_days - 1))
+
+
+def _add_daily(rows):
+    """{(게시글 ID, 날짜): {지표: 증감}} 을 일별 행에 더하기"""
+    PostActivityDay.objects.bulk_create(
+        [PostActivityDay(post_id=post_id, date=date) for post_id, date in rows],
+        ignore_conflicts=True,
+    )
+    for (date, deltas), post_ids in _group_deltas(rows).items():
+        PostActivityDay.objects.filter(date=date, post_id__in=post_ids).update(**{
+            metric: F(metric) + delta for metric, delta in deltas
+        })
+
+
+def compact(keep_days=None, batch_size=5000):
+    """
+    보관 기간이 지난 시간별 행을 일별 행으로 합치기
+
+    배치마다 (시간별 행 잠금 → 일별 합계 반영 → 시간별 행 삭제) 를 한 트랜잭션으로 처리
+    일별 행에 더하는 방식이므로 늦게 flush 된 시간별 행도 다음 실행에서 합쳐짐
+
+    Returns:
+        합쳐진 시간별 행 수
+    """
+    cutoff = compaction_cutoff(keep_days)
+    sums = {f'total_{metric}': Sum(metric) for metric in METRICS}
+    compacted = 0
+    while True:
+        with transaction.atomic():
+            pks = list(
+                PostActivityHour.objects.filter(hour__lt=cutoff)
+                .order_by('pk').select_for_update()
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not pks:
+                return compacted
+            rows = {}
+            totals = PostActivityHour.objects.filter(pk__in=pks)\
+                .annotate(date=TruncDate('hour'))\
+                .values('post_id', 'date').annotate(**sums).order_by()
+            for row in totals:
+                deltas = {metric: row[f'total_{metric}'] for metric in METRICS if row[f'total_{metric}']}
+                if deltas:
+                    rows[(row['post_id'], row['date'])] = deltas
+            _add_daily(rows)
+            PostActivityHour.objects.filter(pk__in=pks).delete()
+        compacted += len(pks)
+
+
+def schedule_compaction():
+    """ANALYTICS_COMPACT_INTERVAL 초에 1회 compact() 실행 (전체 워커 기준)"""
+    if not cache.add(COMPACT_LOCK_KEY, 1, _setting('ANALYTICS_COMPACT_INTERVAL', 3600)):
+        return
+    if not _setting('ANALYTICS_ASYNC', True):
+        compact()
+        return
+    background.submit(compact, key=('analytics_compact',))
+
+
+# ==================== 조회 ====================
+
+def period_start(days):
+    """오늘 포함 최근 days 일의 첫 날짜"""
+    return timezone.localdate() - timedelta(days=days - 1)
+
+
+def _rollup(group_by, start, metrics=METRICS, **filters):
+    """
+    start 이후 일별 + 시간별 행을 group_by 기준으로 합산
+
+    Returns:
+        {group_by 값 튜플: {지표: 합계}}
+    """
+    sums = {f'total_{metric}': Sum(metric) for metric in metrics}
+    daily = PostActivityDay.objects.filter(date__gte=start, **filters)
+    hourly = PostActivityHour.objects.filter(hour__gte=_day_start(start), **filters)\
+        .annotate(date=TruncDate('hour'))
+
+    merged = {}
+    for queryset in (daily, hourly):
+        for row in queryset.values(*group_by).annotate(**sums).order_by():
+            totals = merged.setdefault(tuple(row[field] for field in group_by), dict.fromkeys(metrics, 0))
+            for metric in metrics:
+                totals[metric] += row[f'total_{metric}'] or 0
+    return merged
+
+
+def _check_metric(metric):
+    if metric not in METRICS:
+        raise ValueError(f'알 수 없는 지표: {metric}')
+
+
+def top_posts(days=7, metric='views', limit=10):
+    """
+    최근 days 일 지표 합계 상위 발행 게시글
+
+    Returns:
+        Post 목록 (period_total 속성 포함, 합계 내림차순)
+    """
+    _check_metric(metric)
+    totals = _rollup(('post_id',), period_start(days), (metric,), post__published=True)
+    top = heapq.nlargest(
+        limit,
+        ((values[metric], post_id) for (post_id,), values in totals.items() if values[metric] > 0),
+    )
+    posts = Post.objects.select_related('author', 'category').in_bulk([post_id for _, post_id in top])
+    result = []
+    for total, post_id in top:
+        post = posts.get(post_id)
+        if post is not None:
+            post.period_total = total
+            result.append(post)
+    return result
+
+
+def _dates(days):
+    start = period_start(days)
+    return [start + timedelta(days=offset) for offset in range(days)]
+
+
+def post_series(post_ids, days=14, metric='views'):
+    """
+    게시글별 일별 추이 (빈 날짜는 0)
+
+    Returns:
+        {게시글 ID: [일별 값, ...]} (오래된 날짜부터)
+    """
+    _check_metric(metric)
+    post_ids = list(post_ids)
+    dates = _dates(days)
+    totals = _rollup(('post_id', 'date'), dates[0], (metric,), post_id__in=post_ids)
+    return {
+        post_id: [totals.get((post_id, date), {}).get(metric, 0) for date in dates]
+        for post_id in post_ids
+    }
+
+
+def site_series(days=30):
+    """
+    사이트 전체 일별 추이
+
+    Returns:
+        [{'date': date, 'views': n, 'likes': n, 'comments': n, 'bookmarks': n}, ...]
+    """
+    dates = _dates(days)
+    totals = _rollup(('date',), dates[0])
+    return [{'date': date, **totals.get((date,), dict.fromkeys(METRICS, 0))} for date in dates]
+
+
+def sparkline_points(values, width=100, height=24):
+    """SVG polyline points 문자열 (최댓값 기준 높이)"""
+    values = list(values)
+    if not values:
+        return ''
+    peak = max(max(values), 1)
+    step = width / max(len(values) - 1, 1)
+    return ' '.join(
+        f'{index * step:.1f},{height - max(value, 0) / peak * height:.1f}'
+        for index, value in enumerate(values)
+    )
@@ -9,3 +9,7 @@ class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
     verbose_name = '블로그'
+    
+    def ready(self):
+        """시그널 등록"""
+        from . import signals  # noqa: F401
@@ -0,0 +1,60 @@
+"""
+Blog 앱 - 백그라운드 작업
+========================
+요청 처리와 분리해 실행할 작업을 프로세스 내 작업 스레드 1개에서 순서대로 실행
+(새 게시글 알림 발송, 관련 게시글 색인 갱신 등)
+
+- submit(): 작업 추가 (DB 연결은 작업 전후로 정리)
+- 같은 key 로 대기 중인 작업이 있으면 중복 추가하지 않음
+- 작업 실패는 로그만 남김 (재시도는 각 작업의 관리 커맨드로 수행)
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_lock = threading.Lock()
+_pending = set()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='blog-background')
+        return _executor
+
+
+def submit(func, *args, key=None):
+    """
+    작업 추가
+
+    Args:
+        func: 실행할 함수
+        args: 함수 인자
+        key: 중복 방지 키 (같은 키의 작업이 아직 시작 전이면 추가하지 않음)
+    """
+    if key is not None:
+        with _lock:
+            if key in _pending:
+                return
+            _pending.add(key)
+    _get_executor().submit(_run, func, args, key)
+
+
+def _run(func, args, key):
+    if key is not None:
+        with _lock:
+            _pending.discard(key)
+    close_old_connections()
+    try:
+        func(*args)
+    except Exception:
+        logger.exception('백그라운드 작업 실패 (%s)', getattr(func, '__name__', func))
+    finally:
+        close_old_connections()
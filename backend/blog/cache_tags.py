@@ -0,0 +1,108 @@
+"""
+Blog 앱 - 캐시 의존성 태그
+=========================
+캐시 항목을 의존하는 데이터의 태그 (post:<id>, category:<id>, user:<id> 등) 와 함께 저장하고,
+데이터 변경 시 태그만 갱신하여 그 태그에 의존하는 항목 전체를 키 검색 없이 무효화
+
+구조:
+- 태그마다 공유 캐시에 토큰 1개 저장 (cachetag:<태그>)
+- 항목 저장 시 의존 태그의 현재 토큰 (stamp) 을 값과 함께 저장
+- 읽을 때 저장된 토큰과 현재 토큰을 get_many 1회로 비교 → 하나라도 다르면 사용하지 않음
+- 무효화: 태그 토큰을 새 임의 값으로 교체 (의존 항목 수와 무관하게 태그당 키 1개)
+- 토큰 키가 캐시에서 제거되면 새 토큰이 생성되므로 이전 항목은 모두 무효
+
+트랜잭션:
+- invalidate_tags() 는 태그를 모아 두었다가 커밋 후 set_many 1회로 반영 (트랜잭션 밖이면 즉시)
+- 롤백된 트랜잭션에서 모은 태그는 다음 반영 시 함께 처리 (불필요한 무효화일 뿐 누락 없음)
+
+태그 (blog.signals, accounts.signals 에서 갱신):
+- post:<id>       게시글 상세 (본문, 댓글, 북마크)
+- category:<id> / tag:<id> / series:<id> / user:<id>
+                  해당 객체 자체 (이름, 설명, 프로필 이미지, 팔로우 등) 를 표시하는 페이지
+- category:<id>:posts / tag:<id>:posts / series:<id>:posts / user:<id>:posts
+                  해당 객체의 게시글 목록 (게시글 추가/삭제/수정, 연결 변경)
+- post:list / category:list / tag:list / series:list   전체 게시글 목록·홈 / 전체 목록
+
+게시글 저장 → post:<id>, post:list, 작성자/카테고리/시리즈/태그의 :posts 태그 (이전 카테고리/시리즈 포함)
+
+사용 예:
+    stamp = tag_stamp(['post:1', 'user:3'])
+    value = render()
+    cache.set(key, {'value': value, 'stamp': stamp})
+
+    entry = cache.get(key)
+    if entry is not None and is_current(entry['stamp']): ...
+
+    invalidate_tags('post:1')
+"""
+
+import secrets
+import threading
+
+from django.core.cache import cache
+from django.db import transaction
+
+_pending = threading.local()
+
+
+def _key(tag):
+    return f'cachetag:{tag}'
+
+
+def _new_token():
+    return secrets.token_hex(6)
+
+
+def tag_stamp(tags):
+    """
+    태그별 현재 토큰 (없으면 생성)
+
+    값을 계산하기 전에 호출해야 계산 중 무효화가 반영됨
+
+    Returns:
+        {태그: 토큰}
+    """
+    tags = set(tags)
+    if not tags:
+        return {}
+    found = cache.get_many([_key(tag) for tag in tags])
+    stamp = {}
+    for tag in tags:
+        token = found.get(_key(tag))
+        if token is None:
+            token = _new_token()
+            if not cache.add(_key(tag), token, None):
+                token = cache.get(_key(tag), token)
+        stamp[tag] = token
+    return stamp
+
+
+def is_current(stamp):
+    """저장 당시 토큰이 모두 현재 토큰과 같은지"""
+    if not stamp:
+        return True
+    current = cache.get_many([_key(tag) for tag in stamp])
+    return all(current.get(_key(tag)) == token for tag, token in stamp.items())
+
+
+def _flush():
+    tags = getattr(_pending, 'tags', None)
+    if not tags:
+        return
+    _pending.tags = set()
+    cache.set_many({_key(tag): _new_token() for tag in tags}, None)
+
+
+def invalidate_tags(*tags):
+    """
+    태그에 의존하는 캐시 항목 무효화 (커밋 후, 같은 트랜잭션의 태그는 한 번에 반영)
+
+    None 이 포함된 태그 (예: 카테고리 없는 게시글의 category:None) 는 무시
+    """
+    tags = {tag for tag in tags if tag and not tag.endswith(':None')}
+    if not tags:
+        return
+    if not hasattr(_pending, 'tags'):
+        _pending.tags = set()
+    _pending.tags |= tags
+    transaction.on_commit(_flush)
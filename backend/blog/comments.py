@@ -0,0 +1,80 @@
+"""
+Blog 앱 - 댓글 트리
+==================
+게시글의 활성 댓글 전체를 한 번의 쿼리로 읽어 트리로 조립
+
+쿼리 구성 (댓글 수와 무관하게 1회):
+- 댓글 + 작성자 (select_related)
+- 좋아요/싫어요 수 (비정규화 컬럼)
+- 현재 사용자의 반응 값 (Reaction 서브쿼리, 로그인 시)
+
+조립 결과:
+- 각 댓글에 reply_list (활성 대댓글 목록) 속성 추가
+- 비활성 댓글의 대댓글은 표시하지 않음 (기존 동작과 동일)
+
+사용 예:
+    thread = load_comment_tree(post, request.user)
+    for comment in thread.roots:
+        comment.likes_count, comment.id in thread.liked_ids
+"""
+
+from dataclasses import dataclass, field
+
+from django.db.models import IntegerField, OuterRef, Subquery, Value
+
+from .models import Comment, Reaction
+
+
+@dataclass
+class CommentThread:
+    """게시글 댓글 트리"""
+    roots: list = field(default_factory=list)
+    liked_ids: frozenset = frozenset()
+    disliked_ids: frozenset = frozenset()
+    total: int = 0
+
+
+def load_comment_tree(post, user=None):
+    """
+    게시글 댓글 트리 조회
+
+    Args:
+        post: Post 인스턴스 또는 ID
+        user: 현재 사용자 (비로그인/None 이면 좋아요 여부 생략)
+
+    Returns:
+        CommentThread
+    """
+    post_id = getattr(post, 'pk', post)
+    queryset = Comment.objects.filter(post_id=post_id, is_active=True)\
+        .select_related('author')
+
+    if user is not None and user.is_authenticated:
+        my_reaction = Subquery(
+            Reaction.objects.filter(
+                target_type=Reaction.COMMENT, target_id=OuterRef('pk'), user=user
+            ).values('value')[:1]
+        )
+    else:
+        my_reaction = Value(None, output_field=IntegerField())
+    queryset = queryset.annotate(my_reaction=my_reaction)
+
+    comments = list(queryset.order_by('created_at', 'id'))
+    by_id = {comment.pk: comment for comment in comments}
+    roots = []
+    for comment in comments:
+        comment.reply_list = []
+    for comment in comments:
+        if comment.parent_id is None:
+            roots.append(comment)
+        elif comment.parent_id in by_id:
+            parent = by_id[comment.parent_id]
+            comment.parent = parent
+            parent.reply_list.append(comment)
+
+    return CommentThread(
+        roots=roots,
+        liked_ids=frozenset(c.pk for c in comments if c.my_reaction == Reaction.LIKE),
+        disliked_ids=frozenset(c.pk for c in comments if c.my_reaction == Reaction.DISLIKE),
+        total=len(comments),
+    )
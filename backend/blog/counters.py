@@ -0,0 +1,174 @@
+"""
+Blog 앱 - 게시글 카운터
+======================
+Post 모델에 비정규화된 집계 컬럼 관리
+좋아요/싫어요/댓글/북마크 수를 매 요청마다 COUNT 하지 않도록
+쓰기 시점에 같은 트랜잭션 안에서 증감
+
+카운터 필드:
+- likes_count: 좋아요 수
+- dislikes_count: 싫어요 수
+- comment_count: 활성 댓글 수
+- bookmark_count: 북마크 수
+- Comment.likes_count / dislikes_count: 댓글 좋아요/싫어요 수 (blog.reactions)
+- Category / Tag / PostSeries.post_count: 발행 게시글 수
+  (발행/비공개 전환, 삭제, 카테고리/시리즈 변경, 태그 변경 시 blog.signals 에서 증감)
+  변경 시 목록 캐시 무효화 (blog.taxonomy)
+
+사용 예:
+    with transaction.atomic():
+        Bookmark.objects.create(user=user, post=post)
+        adjust_post_counters(post.pk, bookmark_count=1)
+"""
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from . import taxonomy
+from .models import Post, Comment, Bookmark, Reaction, Category, Tag, PostSeries
+
+
+
+def adjust_post_counters(post_id, **deltas):
+    """
+    게시글 카운터 증감
+
+    UPDATE ... SET field = GREATEST(field + delta, 0) 한 문장으로 처리하여
+    동시 요청에서도 증분이 유실되지 않음
+
+    Args:
+        post_id: 게시글 ID
+        **deltas: 필드명=증감값 (예: likes_count=1, dislikes_count=-1)
+    """
+    updates = {
+        field: Greatest(F(field) + delta, 0)
+        for field, delta in deltas.items()
+        if field in Post.COUNTER_FIELDS and delta
+    }
+    if updates:
+        Post.objects.filter(pk=post_id).update(**updates)
+
+
+def adjust_taxonomy_counts(delta, category_ids=(), tag_ids=(), series_ids=()):
+    """
+    카테고리/태그/시리즈 발행 게시글 수 증감
+
+    Args:
+        delta: 증감값 (게시글 1개 발행 시 1, 비공개/삭제 시 -1)
+        category_ids / tag_ids / series_ids: 대상 ID (None 은 무시)
+    """
+    if not delta:
+        return
+    for model, ids in ((Category, category_ids), (Tag, tag_ids), (PostSeries, series_ids)):
+        ids = {pk for pk in ids if pk is not None}
+        if ids:
+            model.objects.filter(pk__in=ids).update(post_count=Greatest(F('post_count') + delta, 0))
+            taxonomy.invalidate(model)
+
+
+def _count_subquery(queryset, field):
+    """게시글별 COUNT 서브쿼리"""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef('pk')})
+            .order_by()
+            .values(field)
+            .annotate(c=Count('*'))
+            .values('c')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def refresh_comment_counts(post_ids):
+    """
+    지정한 게시글들의 댓글 수 재계산
+
+    관리자 일괄 활성화/비활성화처럼 여러 댓글 상태가 한 번에 바뀌는 경우 사용
+    """
+    post_ids = set(post_ids)
+    if not post_ids:
+        return 0
+    return Post.objects.filter(pk__in=post_ids).update(
+        comment_count=_count_subquery(Comment.objects.filter(is_active=True), 'post'),
+    )
+
+
+def rebuild_post_counters(queryset=None):
+    """
+    게시글 카운터 전체 재계산
+
+    Args:
+        queryset: 대상 게시글 쿼리셋 (기본값: 전체)
+
+    Returns:
+        갱신된 게시글 수
+    """
+    if queryset is None:
+        queryset = Post.objects.all()
+
+    reactions = Reaction.objects.filter(target_type=Reaction.POST)
+
+    return queryset.update(
+        likes_count=_count_subquery(reactions.filter(value=Reaction.LIKE), 'target_id'),
+        dislikes_count=_count_subquery(reactions.filter(value=Reaction.DISLIKE), 'target_id'),
+        comment_count=_count_subquery(Comment.objects.filter(is_active=True), 'post'),
+        bookmark_count=_count_subquery(Bookmark.objects.all(), 'post'),
+    )
+
+
+def rebuild_comment_counters(queryset=None):
+    """
+    댓글 좋아요/싫어요 카운터 재계산
+
+    Args:
+        queryset: 대상 댓글 쿼리셋 (기본값: 전체)
+
+    Returns:
+        갱신된 댓글 수
+    """
+    if queryset is None:
+        queryset = Comment.objects.all()
+
+    reactions = Reaction.objects.filter(target_type=Reaction.COMMENT)
+
+    return queryset.update(
+        likes_count=_count_subquery(reactions.filter(value=Reaction.LIKE), 'target_id'),
+        dislikes_count=_count_subquery(reactions.filter(value=Reaction.DISLIKE), 'target_id'),
+    )
+
+
+def rebuild_taxonomy_counters(posts=None):
+    """
+    카테고리/태그/시리즈 발행 게시글 수 재계산
+
+    Args:
+        posts: 이 게시글들이 속한 카테고리/태그/시리즈만 재계산 (기본값: 전체)
+
+    Returns:
+        갱신된 카테고리/태그/시리즈 수
+    """
+    categories = Category.objects.all()
+    tags = Tag.objects.all()
+    series = PostSeries.objects.all()
+    if posts is not None:
+        post_ids = list(posts.values_list('pk', flat=True))
+        categories = categories.filter(posts__in=post_ids).distinct()
+        tags = tags.filter(posts__in=post_ids).distinct()
+        series = series.filter(posts__in=post_ids).distinct()
+
+    published = Post.objects.filter(published=True)
+    tagged = Post.tags.through.objects.filter(post__published=True)
+    taxonomy.invalidate(Category, Tag, PostSeries)
+    return (
+        Category.objects.filter(pk__in=categories.values('pk')).update(
+            post_count=_count_subquery(published, 'category'),
+        )
+        + Tag.objects.filter(pk__in=tags.values('pk')).update(
+            post_count=_count_subquery(tagged, 'tag'),
+        )
+        + PostSeries.objects.filter(pk__in=series.values('pk')).update(
+            post_count=_count_subquery(published, 'series'),
+        )
+    )
@@ -0,0 +1,302 @@
+"""
+Blog 앱 - DB 장애 시 읽기 전용 모드
+=================================
+PostgreSQL 이 느려지거나 연결되지 않으면 모든 요청이 connect_timeout 동안 멈추고 워커가 밀리므로,
+마지막 정상 응답을 보관해 두었다가 장애 중에는 DB 없이 그대로 응답
+
+정상 응답 보관 (DegradedModeMiddleware):
+- 비로그인 GET 200 HTML/JSON 응답 (페이지, 읽기 API)
+  세션 쿠키/Authorization 헤더가 있거나 인증된 사용자 (세션, DRF 토큰 인증 포함) 의 응답은 보관하지 않음
+- 키: 호스트 + 경로 + 쿼리스트링 (API 는 Accept 헤더 포함), 공유 캐시에 DEGRADED_STALE_TTL 초 보관
+- 같은 URL 은 DEGRADED_REFRESH_INTERVAL 초에 한 번만 다시 저장
+- 제외: DEGRADED_EXCLUDED_PATHS, 사용자별 경로 (북마크, 알림), 검색 결과, 캐시 금지 응답 (never_cache 등)
+
+장애 판단 (워커별 집계, 판정 결과는 공유 캐시로 전체 워커에 전달):
+- 쿼리가 DEGRADED_SLOW_QUERY_MS 이상 걸리거나 DB 오류가 나면 실패로 집계, 정상 쿼리는 초기화
+- 연속 실패가 DEGRADED_FAILURE_THRESHOLD 회에 도달하면 DEGRADED_COOLDOWN 초 동안 장애 모드
+
+장애 모드:
+- 읽기 (GET/HEAD): 보관된 응답을 stale 표시하여 반환 (X-Degraded-Mode, Warning, Age 헤더)
+  보관된 응답이 없으면 DB 를 기다리지 않고 503
+- 쓰기 (POST/PUT/PATCH/DELETE): 즉시 503 (Retry-After)
+- 백그라운드에서 DB 상태 확인 (DEGRADED_PROBE_INTERVAL 초마다 1회) → 정상이면 장애 모드 해제,
+  이후 요청부터 새로 렌더링하여 보관된 응답도 갱신
+
+보관된 HTML 은 비로그인 상태 렌더링이므로 로그인 사용자의 메뉴/상태는 static/js/main.js 가 채움
+(장애 중에는 사용자 상태 조회도 503 → 비로그인 화면 유지)
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, InterfaceError, OperationalError, connection
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
+
+from . import background
+from .page_cache import request_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEGRADED_KEY = 'degraded:until'
+PROBE_LOCK_KEY = 'degraded:probe'
+
+STORED_CONTENT_TYPES = ('text/html', 'application/json')
+UNCACHEABLE_DIRECTIVES = ('private', 'no-store', 'no-cache', 'max-age=0')
+SEARCH_PARAMS = ('q', 'search')
+
+# 사용자별 내용이라 경로 어디에 있어도 보관하지 않는 구간
+USER_SCOPED_PATH_PARTS = ('/bookmark', '/notification')
+
+# DB 상태 문제로 보는 오류 (무결성 오류 등 요청 자체의 오류는 제외)
+UNAVAILABLE_ERRORS = (OperationalError, InterfaceError)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class CircuitBreaker:
+    """
+    DB 상태 집계 (스레드 안전)
+
+    장애 판정 시각은 공유 캐시 (DEGRADED_KEY) 에 저장하고,
+    워커는 DEGRADED_CHECK_INTERVAL 초마다 다시 읽음
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._until = 0.0
+        self._checked_at = 0.0
+        self.trips = 0
+        self.stale_served = 0
+        self.rejected = 0
+
+    def record(self, ok):
+        """쿼리 1건 결과 (ok=False: 오류 또는 느린 쿼리, 이미 장애 모드이면 무시)"""
+        with self._lock:
+            if ok or self._until > time.time():
+                self._failures = 0
+                return
+            self._failures += 1
+            tripped = self._failures >= _setting('DEGRADED_FAILURE_THRESHOLD', 3)
+        if tripped:
+            self.trip()
+
+    def trip(self):
+        """장애 모드 시작 (모든 워커)"""
+        until = time.time() + _setting('DEGRADED_COOLDOWN', 30)
+        with self._lock:
+            self._failures = 0
+            self._until = until
+            self._checked_at = time.monotonic()
+            self.trips += 1
+        try:
+            cache.set(DEGRADED_KEY, until, _setting('DEGRADED_COOLDOWN', 30))
+        except Exception:
+            logger.exception('장애 모드 상태 저장 실패')
+        logger.warning('DB 응답 지연/오류로 읽기 전용 모드 시작 (%s초)', _setting('DEGRADED_COOLDOWN', 30))
+
+    def reset(self):
+        """장애 모드 해제 (모든 워커)"""
+        with self._lock:
+            self._failures = 0
+            self._until = 0.0
+            self._checked_at = time.monotonic()
+        cache.delete(DEGRADED_KEY)
+        logger.info('DB 정상 응답 확인, 읽기 전용 모드 해제')
+
+    def is_open(self):
+        """장애 모드 여부"""
+        now = time.monotonic()
+        if now - self._checked_at >= _setting('DEGRADED_CHECK_INTERVAL', 1):
+            try:
+                until = cache.get(DEGRADED_KEY) or 0.0
+            except Exception:
+                until = self._until
+            with self._lock:
+                self._until = until
+                self._checked_at = now
+        return self._until > time.time()
+
+    def count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'degraded': self._until > time.time(),
+                'consecutive_failures': self._failures,
+                'trips': self.trips,
+                'stale_served': self.stale_served,
+                'rejected': self.rejected,
+            }
+
+
+breaker = CircuitBreaker()
+
+
+def _probe():
+    """DB 응답 확인 (백그라운드 작업 스레드), 정상이면 장애 모드 해제"""
+    started = time.monotonic()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except DatabaseError as exc:
+        logger.warning('DB 상태 확인 실패: %s', exc)
+        breaker.trip()
+        return
+    finally:
+        connection.close()
+    if (time.monotonic() - started) * 1000 < _setting('DEGRADED_SLOW_QUERY_MS', 1000):
+        breaker.reset()
+    else:
+        breaker.trip()
+
+
+def schedule_probe():
+    """DB 상태 확인 예약 (전체 워커에서 DEGRADED_PROBE_INTERVAL 초에 1회)"""
+    if cache.add(PROBE_LOCK_KEY, 1, _setting('DEGRADED_PROBE_INTERVAL', 5)):
+        background.submit(_probe, key='degraded-probe')
+
+
+def _is_api(request):
+    return request.path.startswith(_setting('DEGRADED_API_PREFIX', '/api/'))
+
+
+def last_good_key(request):
+    key = f'lastgood:{request_fingerprint(request)}'
+    if _is_api(request):
+        key += f':{request.headers.get("Accept", "")}'
+    return key
+
+
+def _is_anonymous(request):
+    """
+    인증 정보 없는 요청인지
+
+    DRF 토큰 인증은 뷰 안에서 request.user 를 설정하므로 응답 후 확인
+    """
+    if settings.SESSION_COOKIE_NAME in request.COOKIES or 'Authorization' in request.headers:
+        return False
+    user = getattr(request, 'user', None)
+    return user is None or not user.is_authenticated
+
+
+def _can_store(request, response):
+    if (
+        request.method != 'GET'
+        or response.status_code != 200
+        or response.streaming
+        or response.cookies
+        or not _is_anonymous(request)
+        or request.path.startswith(tuple(_setting('DEGRADED_EXCLUDED_PATHS', ('/admin/',))))
+        or any(part in request.path for part in USER_SCOPED_PATH_PARTS)
+        or any(param in request.GET for param in SEARCH_PARAMS)
+    ):
+        return False
+    if not response.get('Content-Type', '').startswith(STORED_CONTENT_TYPES):
+        return False
+    cache_control = response.get('Cache-Control', '')
+    return not any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES)
+
+
+def _store(request, response):
+    key = last_good_key(request)
+    if not cache.add(f'{key}:fresh', 1, _setting('DEGRADED_REFRESH_INTERVAL', 60)):
+        return
+    cache.set(key, {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'stored_at': time.time(),
+    }, _setting('DEGRADED_STALE_TTL', 60 * 60 * 24))
+
+
+def _stale_response(request):
+    """보관된 응답 (stale 표시) 또는 None"""
+    try:
+        entry = cache.get(last_good_key(request))
+    except Exception:
+        return None
+    if entry is None:
+        return None
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['X-Degraded-Mode'] = 'stale'
+    response['Warning'] = '110 - "Response is Stale"'
+    response['Age'] = str(max(int(time.time() - entry['stored_at']), 0))
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _unavailable(request):
+    """DB 를 기다리지 않는 503 응답"""
+    retry_after = str(_setting('DEGRADED_COOLDOWN', 30))
+    message = '일시적으로 서비스를 이용할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    if _is_api(request) or request.headers.get('Accept', '').startswith('application/json'):
+        response = JsonResponse({'detail': message}, status=503)
+    else:
+        response = HttpResponse(message, content_type='text/plain; charset=utf-8', status=503)
+    response['Retry-After'] = retry_after
+    response['X-Degraded-Mode'] = 'unavailable'
+    return response
+
+
+class DegradedModeMiddleware:
+    """
+    DB 장애 시 읽기 요청은 보관된 응답, 쓰기 요청은 즉시 503
+
+    SessionMiddleware / CommonMiddleware 다음, 인증/CSRF 앞에 배치
+    (세션/사용자 조회는 지연 로딩이므로 장애 중 DB 에 접근하지 않음)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _observe(self, execute, sql, params, many, context):
+        """쿼리 소요 시간/오류 집계"""
+        started = time.monotonic()
+        try:
+            result = execute(sql, params, many, context)
+        except UNAVAILABLE_ERRORS:
+            breaker.record(False)
+            raise
+        elapsed_ms = (time.monotonic() - started) * 1000
+        breaker.record(elapsed_ms < _setting('DEGRADED_SLOW_QUERY_MS', 1000))
+        return result
+
+    def __call__(self, request):
+        if not _setting('DEGRADED_MODE_ENABLED', True):
+            return self.get_response(request)
+
+        if breaker.is_open():
+            schedule_probe()
+            if request.method in ('GET', 'HEAD'):
+                response = _stale_response(request)
+                if response is not None:
+                    breaker.count('stale_served')
+                    return response
+            breaker.count('rejected')
+            return _unavailable(request)
+
+        with connection.execute_wrapper(self._observe):
+            response = self.get_response(request)
+        if _can_store(request, response):
+            _store(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        """연결 실패 등 DB 오류로 뷰가 실패하면 보관된 응답으로 대체"""
+        if not isinstance(exception, UNAVAILABLE_ERRORS):
+            return None
+        breaker.record(False)
+        if request.method in ('GET', 'HEAD'):
+            response = _stale_response(request)
+            if response is not None:
+                breaker.count('stale_served')
+                return response
+        return None
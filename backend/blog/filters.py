@@ -6,7 +6,10 @@ DRF django-filter 필터 정의
 """
 
 import django_filters
+from rest_framework.filters import SearchFilter
+
 from .models import Post, Comment
+from .search import search_posts, order_by_rank
 
 
 class PostFilter(django_filters.FilterSet):
@@ -16,12 +19,13 @@ class PostFilter(django_filters.FilterSet):
     필터 옵션:
     - title: 제목 검색 (부분 일치)
     - content: 내용 검색 (부분 일치)
-    - search: 제목 또는 내용 검색
     - category: 카테고리 슬러그
     - author: 작성자 username
     - published: 발행 여부
     - created_after: 생성일 이후
     - created_before: 생성일 이전
+
+    ?search= 는 PostSearchFilter 가 처리 (전문 검색 + 정확도순 정렬)
     """
     
     title = django_filters.CharFilter(
@@ -32,10 +36,6 @@ class PostFilter(django_filters.FilterSet):
         lookup_expr='icontains',
         label='내용'
     )
-    search = django_filters.CharFilter(
-        method='filter_search',
-        label='검색'
-    )
     category = django_filters.CharFilter(
         field_name='category__slug',
         label='카테고리'
@@ -61,18 +61,27 @@ class PostFilter(django_filters.FilterSet):
     class Meta:
         model = Post
         fields = [
-            'title', 'content', 'search',
+            'title', 'content',
             'category', 'author', 'published',
             'created_after', 'created_before'
         ]
+
+
+class PostSearchFilter(SearchFilter):
+    """
+    게시글 검색 필터 (DRF ?search=)
+
+    icontains 조합 대신 blog.search 전문 검색 사용
+    ?ordering= 지정이 없으면 정확도순 정렬
+    """
     
-    def filter_search(self, queryset, name, value):
-        """제목 또는 내용에서 검색"""
-        if value:
-            return queryset.filter(
-                django_filters.Q(title__icontains=value) |
-                django_filters.Q(content__icontains=value)
-            )
+    def filter_queryset(self, request, queryset, view):
+        terms = ' '.join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+        queryset = search_posts(queryset, terms)
+        if not request.query_params.get('ordering'):
+            queryset = order_by_rank(queryset)
         return queryset
 
 
@@ -0,0 +1,134 @@
+"""
+Blog 앱 - 이미지 변환
+====================
+업로드 이미지 1회 디코딩으로 너비별 / 포맷별 파생 이미지 생성 (Pillow)
+Django 에 의존하지 않으므로 작업 프로세스(blog.thumbnails)에서 그대로 실행
+
+처리 내용:
+- EXIF 방향 적용 후 EXIF 제거 (파생 이미지는 메타데이터 없이 저장)
+- 원본에 EXIF 가 있으면 메타데이터를 뺀 원본도 함께 반환
+- 원본보다 큰 너비는 만들지 않음 (원본 너비로 대체)
+- 지원하지 않는 포맷 (Pillow 빌드에 AVIF 없음 등)은 건너뜀
+- 프로필 이미지: 가운데 기준 정사각형으로 잘라 크기별 1x / 2x WebP 생성 (render_avatars)
+"""
+
+import io
+
+from PIL import Image, ImageOps
+
+try:
+    # Pillow 11.2 미만은 AVIF 플러그인 설치 시에만 AVIF 저장 가능
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+# 포맷 → (Pillow 포맷, 확장자, MIME 타입)
+FORMATS = {
+    'avif': ('AVIF', 'avif', 'image/avif'),
+    'webp': ('WEBP', 'webp', 'image/webp'),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+}
+
+DEFAULT_QUALITY = {'avif': 50, 'webp': 75, 'jpeg': 80}
+
+# 메타데이터 제거 후 다시 저장할 수 있는 원본 포맷
+REENCODABLE = {'JPEG': {'quality': 95}, 'PNG': {'optimize': True}, 'WEBP': {'quality': 95}}
+
+
+def supported_formats(formats):
+    """현재 Pillow 빌드에서 저장 가능한 포맷만"""
+    Image.init()
+    return [name for name in formats if name in FORMATS and FORMATS[name][0] in Image.SAVE]
+
+
+def _encode(image, pil_format, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def _flatten(image):
+    """투명 배경을 흰색으로 (JPEG 용)"""
+    if image.mode == 'RGB':
+        return image
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+    return background
+
+
+def render_variants(data, widths, formats, quality=None):
+    """
+    파생 이미지 생성
+
+    Args:
+        data: 원본 이미지 바이트
+        widths: 생성할 너비 목록
+        formats: 생성할 포맷 목록 (FORMATS 키)
+        quality: 포맷별 품질 (기본: DEFAULT_QUALITY)
+
+    Returns:
+        {
+            'width', 'height': 방향 보정 후 원본 크기,
+            'original': EXIF 를 제거한 원본 바이트 (EXIF 가 없으면 None),
+            'variants': [(포맷, 너비, 높이, 바이트), ...],
+        }
+    """
+    quality = {**DEFAULT_QUALITY, **(quality or {})}
+    formats = supported_formats(formats)
+
+    with Image.open(io.BytesIO(data)) as source:
+        source_format = source.format
+        has_exif = bool(source.getexif())
+        image = ImageOps.exif_transpose(source)
+        image.load()
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    width, height = image.size
+
+    original = None
+    if has_exif and source_format in REENCODABLE:
+        frame = _flatten(image) if source_format == 'JPEG' else image
+        original = _encode(frame, source_format, **REENCODABLE[source_format])
+
+    variants = []
+    for target in sorted({min(w, width) for w in widths}):
+        target_height = max(round(height * target / width), 1)
+        resized = image if target == width else image.resize((target, target_height), Image.LANCZOS)
+        for name in formats:
+            pil_format = FORMATS[name][0]
+            frame = _flatten(resized) if name == 'jpeg' else resized
+            options = {'quality': quality[name]}
+            if name == 'jpeg':
+                options.update(optimize=True, progressive=True)
+            variants.append((name, target, target_height, _encode(frame, pil_format, **options)))
+
+    return {'width': width, 'height': height, 'original': original, 'variants': variants}
+
+
+def render_avatars(data, sizes, scales=(1, 2), quality=80):
+    """
+    프로필 이미지 크기별 정사각형 WebP 생성 (EXIF 제거)
+
+    Args:
+        data: 원본 이미지 바이트
+        sizes: 표시 크기 목록 (px)
+        scales: 배율 목록 (고해상도 화면용 2x 등)
+        quality: WebP 품질
+
+    Returns:
+        [(크기, 배율, 바이트), ...]
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image.load()
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    avatars = []
+    for size in sorted(set(sizes)):
+        for scale in scales:
+            pixels = size * scale
+            square = ImageOps.fit(image, (pixels, pixels), Image.LANCZOS)
+            avatars.append((size, scale, _encode(square, 'WEBP', quality=quality)))
+    return avatars
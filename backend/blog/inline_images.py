@@ -0,0 +1,105 @@
+"""
+Blog 앱 - 본문 인라인 이미지 추출
+================================
+Summernote 에 붙여넣은 이미지는 <img src="data:image/png;base64,..."> 로 본문에 그대로 들어감
+→ 게시글 행을 읽을 때마다 (목록/검색 포함) 수백 KB 를 함께 읽게 되므로 저장 시 미디어 파일로 분리
+
+처리 내용:
+- 게시글 저장 시 본문의 base64 이미지를 디코딩하여 파일로 저장 후 src 를 파일 URL 로 교체 (Post.save)
+- 파일명은 내용 해시: posts/inline/ab/ab12....png → 같은 이미지는 한 파일만 저장
+- 실제 이미지 포맷은 Pillow 로 확인 (PNG / JPEG / GIF / WebP 만, 그 외/손상 데이터는 그대로 둠)
+- 기존 게시글: python manage.py extract_inline_images (줄어든 용량 보고)
+
+트랜잭션이 롤백되어도 저장된 파일은 남지만, 같은 내용이면 다시 저장하지 않으므로 재시도 시 재사용됨
+
+사용 예:
+    content, names = extract_inline_images(post.content)
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import re
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, UnidentifiedImageError
+
+# Pillow 포맷 → 확장자
+EXTENSIONS = {'PNG': 'png', 'JPEG': 'jpg', 'GIF': 'gif', 'WEBP': 'webp'}
+
+MARKER = 'data:image/'
+
+# <img ... src="data:image/png;base64,...">
+INLINE_IMAGE_RE = re.compile(
+    r'(<img\b[^>]*?\bsrc\s*=\s*)(["\'])data:image/[a-z0-9.+-]+;base64,([^"\']*)\2',
+    re.IGNORECASE,
+)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def inline_image_name(data, image_format):
+    """내용 해시 기반 파일명"""
+    digest = hashlib.sha256(data).hexdigest()
+    directory = _setting('INLINE_IMAGE_DIR', 'posts/inline').rstrip('/')
+    return f'{directory}/{digest[:2]}/{digest}.{EXTENSIONS[image_format]}'
+
+
+def _decode(payload):
+    """base64 → (이미지 바이트, Pillow 포맷), 이미지가 아니면 None"""
+    try:
+        data = base64.b64decode(re.sub(r'\s+', '', payload), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+            image.verify()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        return None
+    if image_format not in EXTENSIONS:
+        return None
+    return data, image_format
+
+
+def extract_inline_images(content, storage=None, save=True):
+    """
+    본문의 base64 이미지를 파일로 저장하고 src 교체
+
+    Args:
+        content: 게시글 본문 HTML
+        storage: 저장소 (기본값: default_storage)
+        save: False 이면 파일을 저장하지 않고 교체 결과만 계산 (미리보기)
+
+    Returns:
+        (교체된 본문, 추출한 파일명 목록)
+    """
+    if not content or MARKER not in content.lower():
+        return content, []
+    storage = storage or default_storage
+    names = []
+
+    def replace(match):
+        decoded = _decode(match.group(3))
+        if decoded is None:
+            return match.group(0)
+        data, image_format = decoded
+        name = inline_image_name(data, image_format)
+        if save and not storage.exists(name):
+            name = storage.save(name, ContentFile(data))
+        names.append(name)
+        quote = match.group(2)
+        return f'{match.group(1)}{quote}{storage.url(name)}{quote}'
+
+    return INLINE_IMAGE_RE.sub(replace, content), names
+
+
+def extract_post_images(post):
+    """게시글 인스턴스 본문에 반영 (저장은 호출자가 수행)"""
+    post.content, names = extract_inline_images(post.content)
+    return names
@@ -0,0 +1,174 @@
+"""
+Blog 앱 - 인기 게시글 리더보드
+============================
+조회수 상위 게시글 목록을 캐시에 유지하고 모든 사이드바에서 공유
+
+구조:
+- 전체 리더보드와 카테고리별 리더보드를 각각 캐시 키로 저장
+- 캐시 미스 시 (published, -views) 인덱스로 상위 LEADERBOARD_SIZE 개만 조회
+  (조회수가 같으면 ID 역순, DB 조회와 증분 병합에서 같은 순서)
+  (blog.recompute: 워커 1개만 재계산, 만료 전 확률적 조기 갱신, TTL 분산)
+- 조회수 버퍼 flush 시 apply_view_deltas()로 캐시된 리더보드를 증분 갱신
+- 게시글 비공개/삭제/수정 시 버전 키를 올려 모든 리더보드 무효화
+
+리더보드 항목은 PopularPost 로 반환되어 템플릿에서 Post 와 같은 방식으로 사용
+(post.title, post.views, post.get_absolute_url)
+"""
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+
+from .recompute import RecomputeGuard
+
+# 캐시 키
+VERSION_KEY = 'leaderboard:version'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+boards = RecomputeGuard('leaderboard', ttl=_setting('LEADERBOARD_TTL', 300))
+
+
+@dataclass(frozen=True)
+class PopularPost:
+    """리더보드 항목 (DB 조회 없이 사이드바 렌더링용)"""
+    id: int
+    title: str
+    slug: str
+    views: int
+    category_id: int = None
+
+    def get_absolute_url(self):
+        return reverse('blog:post_detail', kwargs={'slug': self.slug})
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY, version, None)
+    return version
+
+
+def _board_key(category_id, version):
+    scope = 'all' if category_id is None else f'category:{category_id}'
+    return f'{version}:{scope}'
+
+
+def _load_rows(category_id):
+    """DB에서 상위 게시글 조회 (인덱스 정렬)"""
+    from .models import Post
+
+    queryset = Post.objects.filter(published=True)
+    if category_id is not None:
+        queryset = queryset.filter(category_id=category_id)
+    return list(
+        queryset.order_by('-views', '-id')
+        .values('id', 'title', 'slug', 'views', 'category_id')[:_setting('LEADERBOARD_SIZE', 20)]
+    )
+
+
+def _sort_key(row):
+    """_load_rows 와 같은 순서 (조회수 역순, ID 역순)"""
+    return (-row['views'], -row['id'])
+
+
+def get_popular_posts(category=None, limit=None):
+    """
+    인기 게시글 목록
+
+    Args:
+        category: Category 인스턴스 (None 이면 전체)
+        limit: 반환 개수 (기본값: POPULAR_POSTS_LIMIT)
+
+    Returns:
+        PopularPost 리스트
+    """
+    limit = limit or _setting('POPULAR_POSTS_LIMIT', 5)
+    category_id = category.pk if category is not None else None
+    key = _board_key(category_id, _version())
+
+    rows = boards.get_or_compute(key, lambda: _load_rows(category_id))
+    return [PopularPost(**row) for row in rows[:limit]]
+
+
+def apply_view_deltas(deltas):
+    """
+    조회수 증가분을 캐시된 리더보드에 반영
+
+    flush 된 게시글의 최신 조회수를 한 번에 읽어 전체/카테고리 리더보드에 병합
+    캐시에 없는 리더보드는 다음 조회 시 새로 만들어지므로 건너뜀
+
+    Args:
+        deltas: {게시글 ID: 증가량}
+    """
+    from .models import Post
+
+    if not deltas:
+        return
+    version = _version()
+    rows = list(
+        Post.objects.filter(pk__in=list(deltas), published=True)
+        .values('id', 'title', 'slug', 'views', 'category_id')
+    )
+    if not rows:
+        return
+
+    scopes = {None} | {row['category_id'] for row in rows if row['category_id'] is not None}
+    size = _setting('LEADERBOARD_SIZE', 20)
+
+    for category_id in scopes:
+        key = _board_key(category_id, version)
+        board = boards.peek(key)
+        if board is None:
+            continue
+        candidates = [
+            row for row in rows
+            if category_id is None or row['category_id'] == category_id
+        ]
+        updated_ids = {row['id'] for row in candidates}
+        merged = [row for row in board if row['id'] not in updated_ids] + candidates
+        merged.sort(key=_sort_key)
+        # 리더보드가 가득 찼다면 마지막 항목보다 낮은 게시글은 자연히 잘려나감
+        boards.set(key, merged[:size])
+
+
+def invalidate():
+    """모든 리더보드 무효화 (버전 증가)"""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, None)
+
+
+def affects(post, previous_category_id=None):
+    """
+    게시글 변경이 캐시된 리더보드에 영향을 주는지 확인
+
+    - 전체/현재 카테고리/이전 카테고리 리더보드에 올라 있는 게시글
+    - 발행된 게시글이 전체/현재 카테고리 리더보드에 들어갈 수 있는 경우
+      (리더보드가 아직 가득 차지 않았거나, 마지막 항목보다 앞 순서)
+
+    Args:
+        post: Post
+        previous_category_id: 저장 전 카테고리 ID (카테고리 이동 시)
+    """
+    version = _version()
+    size = _setting('LEADERBOARD_SIZE', 20)
+    scopes = {None, post.category_id}
+    for category_id in scopes | {previous_category_id}:
+        board = boards.peek(_board_key(category_id, version))
+        if board is None:
+            continue
+        if any(row['id'] == post.pk for row in board):
+            return True
+        if category_id not in scopes or not post.published:
+            continue
+        if len(board) < size or _sort_key({'views': post.views, 'id': post.pk}) < _sort_key(board[-1]):
+            return True
+    return False
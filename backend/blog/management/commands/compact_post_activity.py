@@ -0,0 +1,35 @@
+"""
+게시글 활동 통계 합치기 커맨드
+============================
+보관 기간이 지난 시간별 활동(PostActivityHour)을 일별 활동(PostActivityDay)으로 합침
+(blog.analytics, flush 후 자동 실행되지만 cron 등으로도 실행 가능)
+
+사용법:
+    python manage.py compact_post_activity
+    python manage.py compact_post_activity --keep-days 1
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.analytics import compact, compaction_cutoff, flush_activity
+
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 시간별 게시글 활동을 일별 집계로 합칩니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep-days',
+            type=int,
+            default=None,
+            help='시간별로 보관할 일수 (오늘 포함, 기본: ANALYTICS_HOURLY_RETENTION_DAYS)',
+        )
+
+    def handle(self, *args, **options):
+        flush_activity()
+        keep_days = options['keep_days']
+        cutoff = compaction_cutoff(keep_days)
+        count = compact(keep_days)
+        self.stdout.write(self.style.SUCCESS(
+            f'{cutoff:%Y-%m-%d %H:%M} 이전 시간별 활동 {count}건을 일별로 합쳤습니다.'
+        ))
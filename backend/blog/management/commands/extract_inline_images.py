@@ -0,0 +1,75 @@
+"""
+본문 인라인 이미지 추출 커맨드
+============================
+기존 게시글 본문의 base64 이미지를 미디어 파일로 분리 (blog.inline_images)
+본문 렌더링 결과(content_html)도 함께 갱신하고 줄어든 용량 보고
+
+사용법:
+    python manage.py extract_inline_images
+    python manage.py extract_inline_images --dry-run
+    python manage.py extract_inline_images --post-id 1 --post-id 2
+"""
+
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from blog.inline_images import MARKER, extract_inline_images
+from blog.models import Post
+from blog.rendering import render_content
+
+
+def _size(text):
+    return len((text or '').encode('utf-8'))
+
+
+class Command(BaseCommand):
+    help = '게시글 본문의 base64 인라인 이미지를 미디어 파일로 분리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='처리할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='파일 저장/본문 수정 없이 줄어들 용량만 계산',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        queryset = Post.objects.filter(content__icontains=MARKER)\
+            .only('id', 'content', 'content_html').order_by('pk')
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+
+        posts = images = before = after = 0
+        for post in queryset.iterator(chunk_size=50):
+            content, names = extract_inline_images(post.content, save=not dry_run)
+            if not names:
+                continue
+            rendered = render_content(content)
+            if not dry_run:
+                # 처리 중 본문이 수정되었으면 건너뜀 (다음 실행에서 처리)
+                updated = Post.objects.filter(pk=post.pk, content=post.content)\
+                    .update(content=content, **rendered)
+                if not updated:
+                    continue
+            posts += 1
+            images += len(names)
+            before += _size(post.content) + _size(post.content_html)
+            after += _size(content) + _size(rendered['content_html'])
+            self.stdout.write(
+                f'게시글 {post.pk}: 이미지 {len(names)}개, '
+                f'{filesizeformat(_size(post.content))} → {filesizeformat(_size(content))}'
+            )
+
+        prefix = '[미리보기] ' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{posts}개 게시글에서 이미지 {images}개를 분리했습니다. '
+            f'(본문+렌더링 HTML {filesizeformat(before)} → {filesizeformat(after)}, '
+            f'{filesizeformat(before - after)} 감소)'
+        ))
@@ -0,0 +1,58 @@
+"""
+썸네일 파생 이미지 생성 커맨드
+============================
+게시글 썸네일의 크기별 AVIF / WebP / JPEG 파생 이미지 생성 (blog.thumbnails)
+기존 게시글 일괄 처리 또는 THUMBNAIL_WIDTHS / THUMBNAIL_FORMATS 변경 후 실행
+
+사용법:
+    python manage.py generate_thumbnails
+    python manage.py generate_thumbnails --force
+    python manage.py generate_thumbnails --post-id 1 --post-id 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.thumbnails import generate
+
+
+class Command(BaseCommand):
+    help = '게시글 썸네일 파생 이미지(AVIF/WebP/JPEG)를 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='처리할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 생성된 게시글도 다시 생성',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.exclude(thumbnail='').exclude(thumbnail__isnull=True)\
+            .only('id', 'thumbnail', 'thumbnail_variants').order_by('pk')
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+
+        generated = failed = 0
+        for post in queryset.iterator(chunk_size=500):
+            current = (post.thumbnail_variants or {}).get('source') == post.thumbnail.name
+            if current and not options['force']:
+                continue
+            meta = generate(post.pk)
+            if meta is None:
+                continue
+            if meta.get('error'):
+                failed += 1
+                self.stderr.write(f'게시글 {post.pk}: {meta["error"]}')
+            else:
+                generated += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{generated}개 게시글의 썸네일 파생 이미지를 생성했습니다. (실패 {failed}개)'
+        ))
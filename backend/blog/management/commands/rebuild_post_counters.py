@@ -0,0 +1,44 @@
+"""
+게시글 카운터 재계산 커맨드
+==========================
+좋아요/싫어요/댓글/북마크 비정규화 컬럼을 원본 테이블 기준으로 다시 계산
+대상 게시글에 달린 댓글의 좋아요/싫어요 수도 함께 재계산
+카테고리/태그/시리즈 발행 게시글 수도 함께 재계산 (--post-id 지정 시 해당 게시글이 속한 것만)
+
+사용법:
+    python manage.py rebuild_post_counters
+    python manage.py rebuild_post_counters --post-id 1 --post-id 2
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.models import Post, Comment
+from blog.counters import rebuild_post_counters, rebuild_comment_counters, rebuild_taxonomy_counters
+
+
+class Command(BaseCommand):
+    help = '게시글 좋아요/싫어요/댓글/북마크 및 카테고리/태그/시리즈 게시글 수를 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='재계산할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.all()
+        comments = Comment.objects.all()
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+            comments = comments.filter(post_id__in=options['post_ids'])
+
+        with transaction.atomic():
+            count = rebuild_post_counters(queryset)
+            rebuild_comment_counters(comments)
+            rebuild_taxonomy_counters(queryset if options['post_ids'] else None)
+
+        self.stdout.write(self.style.SUCCESS(f'{count}개 게시글의 카운터를 재계산했습니다.'))
@@ -0,0 +1,80 @@
+"""
+관련 게시글 색인 재생성 커맨드
+============================
+발행 게시글 전체의 단어 빈도와 TF-IDF 이웃 목록을 다시 계산
+증분 갱신은 IDF 변화를 다른 게시글에 반영하지 않으므로 주기적으로 실행 (예: 매일)
+게시글별 이웃 최저 유사도 (PostTerms.min_score) 도 함께 저장 (증분 갱신 대상 판단, 마이그레이션 직후 1회 실행)
+
+사용법:
+    python manage.py rebuild_related_posts
+    python manage.py rebuild_related_posts --processes 4 --neighbors 10
+    python manage.py rebuild_related_posts --skip-terms   # 단어 빈도는 그대로 두고 이웃만 재계산
+"""
+
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.models import RelatedPost
+from blog.related import (
+    build_links, compute_all_neighbors, load_matrix, min_score, neighbor_count, rebuild_terms,
+    reset_index, save_min_scores,
+)
+
+
+class Command(BaseCommand):
+    help = '관련 게시글 색인(TF-IDF 이웃 목록)을 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='유사도 계산 프로세스 수 (기본: CPU 수)',
+        )
+        parser.add_argument(
+            '--neighbors',
+            type=int,
+            default=None,
+            help='게시글당 저장할 관련 게시글 수 (기본: RELATED_POSTS_COUNT)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='프로세스 작업 단위 게시글 수',
+        )
+        parser.add_argument(
+            '--skip-terms',
+            action='store_true',
+            help='단어 빈도 재계산 생략',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        if not options['skip_terms']:
+            count = rebuild_terms()
+            self.stdout.write(f'{count}개 게시글의 단어 빈도를 계산했습니다.')
+
+        matrix = load_matrix()
+        k = options['neighbors'] or neighbor_count()
+        links = []
+        min_scores = {}
+        for post_id, neighbors in compute_all_neighbors(
+            matrix, k=k, processes=options['processes'], chunk_size=options['chunk_size']
+        ):
+            links.extend(build_links(post_id, neighbors))
+            min_scores[post_id] = min_score(neighbors, k)
+
+        with transaction.atomic():
+            RelatedPost.objects.all().delete()
+            RelatedPost.objects.bulk_create(links, batch_size=2000)
+            save_min_scores(min_scores)
+        reset_index()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(matrix.post_ids)}개 게시글의 관련 게시글 {len(links)}개를 저장했습니다. ({elapsed:.1f}초)'
+        ))
@@ -0,0 +1,42 @@
+"""
+게시글 검색 색인 재생성 커맨드
+==============================
+search_document / search_vector 를 현재 제목/작성자/본문 기준으로 다시 생성
+토큰화 규칙(blog.search)을 변경한 뒤 실행
+
+사용법:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --post-id 1 --post-id 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.search import reindex_post
+
+
+class Command(BaseCommand):
+    help = '게시글 전문 검색 색인을 다시 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='재색인할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.select_related('author').only(
+            'id', 'title', 'content', 'author__username'
+        )
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+
+        count = 0
+        for post in queryset.iterator(chunk_size=500):
+            reindex_post(post)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f'{count}개 게시글을 재색인했습니다.'))
@@ -0,0 +1,43 @@
+"""
+팔로잉 피드 재생성 커맨드
+========================
+팔로우 관계 기준으로 사용자 피드를 다시 채움
+피드 도입 이전의 팔로우 관계, 설정(TIMELINE_BACKFILL) 변경 후 실행
+
+사용법:
+    python manage.py rebuild_timelines
+    python manage.py rebuild_timelines --user-id 1 --user-id 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import Follow
+from blog import timeline
+
+
+class Command(BaseCommand):
+    help = '팔로우 관계 기준으로 팔로잉 피드를 다시 채웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            action='append',
+            type=int,
+            dest='user_ids',
+            help='재생성할 사용자 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        follows = Follow.objects.order_by('follower_id', 'following_id')\
+            .values_list('follower_id', 'following_id')
+        if options['user_ids']:
+            follows = follows.filter(follower_id__in=options['user_ids'])
+
+        users = set()
+        for follower_id, following_id in follows.iterator(chunk_size=2000):
+            timeline.backfill(follower_id, following_id)
+            users.add(follower_id)
+        for user_id in users:
+            timeline.trim(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'{len(users)}명의 피드를 다시 채웠습니다.'))
@@ -0,0 +1,36 @@
+"""
+사이트 통계 재계산 커맨드
+========================
+전체 게시글/댓글/회원/조회수를 DB 기준으로 다시 계산 (blog.site_stats)
+증감 누락분을 보정하며, cron 등으로 주기 실행
+
+사용법:
+    python manage.py reconcile_site_stats
+    python manage.py reconcile_site_stats --stat views --stat active_users
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.site_stats import STATS, reconcile
+
+
+class Command(BaseCommand):
+    help = '사이트 통계(게시글/댓글/회원/조회수)를 DB 기준으로 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stat',
+            action='append',
+            choices=list(STATS),
+            dest='stats',
+            help='재계산할 통계 (여러 번 지정 가능, 생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        result = reconcile(options['stats'])
+        for key, stat in result.items():
+            line = f'{STATS[key][0]}: {stat.value}'
+            if stat.drift:
+                line += f' (보정 {-stat.drift:+d})'
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS(f'{len(result)}개 통계를 재계산했습니다.'))
@@ -0,0 +1,41 @@
+"""
+게시글 본문 재렌더링 커맨드
+==========================
+content_html / excerpt / word_count / reading_time / toc 를 다시 생성
+허용 태그 등 렌더링 규칙(blog.rendering)을 변경한 뒤 실행
+0009 마이그레이션 적용 후 기존 게시글의 렌더링 필드를 채울 때도 사용
+
+사용법:
+    python manage.py render_post_content
+    python manage.py render_post_content --post-id 1 --post-id 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.rendering import render_content
+
+
+class Command(BaseCommand):
+    help = '게시글 본문 렌더링 결과(HTML, 요약, 읽기 시간, 목차)를 다시 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post-id',
+            action='append',
+            type=int,
+            dest='post_ids',
+            help='재렌더링할 게시글 ID (여러 번 지정 가능, 생략 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.only('id', 'content')
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+
+        count = 0
+        for post in queryset.iterator(chunk_size=200):
+            Post.objects.filter(pk=post.pk).update(**render_content(post.content))
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f'{count}개 게시글을 다시 렌더링했습니다.'))
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:00
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.filter(post=OuterRef('pk')).order_by().values('post')
+            .annotate(c=Count('*')).values('c')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    """기존 게시글 카운터 채우기"""
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    Bookmark = apps.get_model('blog', 'Bookmark')
+    Post.objects.update(
+        likes_count=_count(Post.likes.through.objects.all()),
+        dislikes_count=_count(Post.dislikes.through.objects.all()),
+        comment_count=_count(Comment.objects.filter(is_active=True)),
+        bookmark_count=_count(Bookmark.objects.all()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_tag_post_draft_saved_at_post_is_draft_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='bookmark_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='북마크 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='dislikes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='싫어요 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='좋아요 수'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['published', '-likes_count', '-created_at'], name='blog_post_publish_36f9b5_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:04
+
+import html
+import re
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+from django.utils.html import strip_tags
+
+# 작성 시점의 blog.search 토큰화 규칙 사본
+# (이후 규칙이 바뀌어도 마이그레이션 결과가 달라지지 않도록 고정, 재색인은 rebuild_search_index)
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^가-힣]+')
+HANGUL_RE = re.compile(r'[가-힣]')
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+WHITESPACE_RE = re.compile(r'\s+')
+SEARCH_CONFIG = 'simple'
+
+
+def html_to_text(value):
+    if not value:
+        return ''
+    text = html.unescape(strip_tags(value.replace('<', ' <')))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def tokenize(text):
+    tokens = []
+    for word in WORD_RE.findall((text or '').lower()):
+        if not HANGUL_RE.search(word):
+            tokens.append(word)
+            continue
+        for run in HANGUL_RUN_RE.findall(word):
+            if not HANGUL_RE.match(run) or len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def backfill_search_index(apps, schema_editor):
+    """기존 게시글 검색 색인 채우기 (GIN 인덱스는 0019 에서 생성)"""
+    Post = apps.get_model('blog', 'Post')
+    is_postgres = schema_editor.connection.vendor == 'postgresql'
+
+    for post in Post.objects.select_related('author').iterator(chunk_size=500):
+        title = ' '.join(tokenize(post.title))
+        body = ' '.join(tokenize(f'{post.author.username} {html_to_text(post.content)}'))
+        updates = {'search_document': f'{title} {body}'.strip()}
+        if is_postgres:
+            updates['search_vector'] = (
+                SearchVector(Value(title), weight='A', config=SEARCH_CONFIG)
+                + SearchVector(Value(body), weight='B', config=SEARCH_CONFIG)
+            )
+        Post.objects.filter(pk=post.pk).update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_views_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False, help_text='HTML 제거 및 토큰화된 제목/작성자/본문', verbose_name='검색 문서'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='검색 벡터'),
+        ),
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
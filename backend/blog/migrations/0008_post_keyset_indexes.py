@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_post_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_categor_405168_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_publish_a2f496_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_publish_36f9b5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='blog_post_categor_aa115a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['published', '-created_at', '-id'], name='blog_post_publish_6607e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['published', '-likes_count', '-created_at', '-id'], name='blog_post_publish_b304a1_idx'),
+        ),
+    ]
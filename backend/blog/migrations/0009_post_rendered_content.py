@@ -0,0 +1,41 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:10
+
+# 기존 게시글 렌더링 필드 채우기는 마이그레이션 적용 후 커맨드로 실행:
+#     python manage.py render_post_content
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_post_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='허용 태그만 남기고 제목 앵커를 추가한 HTML', verbose_name='렌더링된 본문'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='요약'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=1, editable=False, verbose_name='읽기 시간(분)'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='toc',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='목차'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='단어 수'),
+        ),
+    ]
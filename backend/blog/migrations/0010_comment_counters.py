@@ -0,0 +1,46 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:13
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.filter(comment=OuterRef('pk')).order_by().values('comment')
+            .annotate(c=Count('*')).values('c')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    """기존 댓글 카운터 채우기"""
+    Comment = apps.get_model('blog', 'Comment')
+    Comment.objects.update(
+        likes_count=_count(Comment.likes.through.objects.all()),
+        dislikes_count=_count(Comment.dislikes.through.objects.all()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_rendered_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='dislikes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='싫어요 수'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='좋아요 수'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+POST, COMMENT = 1, 2
+LIKE, DISLIKE = 1, -1
+BATCH_SIZE = 2000
+
+
+def _count(Reaction, target_type, value):
+    return Coalesce(
+        Subquery(
+            Reaction.objects.filter(
+                target_type=target_type, target_id=OuterRef('pk'), value=value
+            ).order_by().values('target_id').annotate(c=Count('*')).values('c')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def copy_reactions(apps, schema_editor):
+    """
+    좋아요/싫어요 M2M 4개 테이블 → Reaction
+
+    좋아요를 먼저 옮기므로 좋아요/싫어요가 함께 있던 경우 좋아요 유지
+    이후 카운터를 Reaction 기준으로 다시 계산
+    """
+    Reaction = apps.get_model('blog', 'Reaction')
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    sources = [
+        (Post.likes.through, 'post_id', POST, LIKE),
+        (Comment.likes.through, 'comment_id', COMMENT, LIKE),
+        (Post.dislikes.through, 'post_id', POST, DISLIKE),
+        (Comment.dislikes.through, 'comment_id', COMMENT, DISLIKE),
+    ]
+    for through, column, target_type, value in sources:
+        batch = []
+        for target_id, user_id in through.objects.values_list(column, 'user_id').iterator(chunk_size=BATCH_SIZE):
+            batch.append(Reaction(target_type=target_type, target_id=target_id, user_id=user_id, value=value))
+            if len(batch) >= BATCH_SIZE:
+                Reaction.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        Reaction.objects.bulk_create(batch, ignore_conflicts=True)
+
+    for model, target_type in ((Post, POST), (Comment, COMMENT)):
+        model.objects.update(
+            likes_count=_count(Reaction, target_type, LIKE),
+            dislikes_count=_count(Reaction, target_type, DISLIKE),
+        )
+
+
+def restore_reactions(apps, schema_editor):
+    """Reaction → 좋아요/싫어요 M2M 테이블 (되돌리기)"""
+    Reaction = apps.get_model('blog', 'Reaction')
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    targets = {
+        (POST, LIKE): (Post.likes.through, 'post_id'),
+        (POST, DISLIKE): (Post.dislikes.through, 'post_id'),
+        (COMMENT, LIKE): (Comment.likes.through, 'comment_id'),
+        (COMMENT, DISLIKE): (Comment.dislikes.through, 'comment_id'),
+    }
+    for (target_type, value), (through, column) in targets.items():
+        rows = Reaction.objects.filter(target_type=target_type, value=value)\
+            .values_list('target_id', 'user_id').iterator(chunk_size=BATCH_SIZE)
+        through.objects.bulk_create(
+            (through(**{column: target_id, 'user_id': user_id}) for target_id, user_id in rows),
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_comment_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Reaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.PositiveSmallIntegerField(choices=[(1, '게시글'), (2, '댓글')], verbose_name='대상 종류')),
+                ('target_id', models.PositiveBigIntegerField(verbose_name='대상 ID')),
+                ('value', models.SmallIntegerField(choices=[(1, '좋아요'), (-1, '싫어요')], verbose_name='반응')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reactions', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '반응',
+                'verbose_name_plural': '반응 목록',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reaction',
+            constraint=models.UniqueConstraint(fields=('target_type', 'target_id', 'user'), name='unique_target_user_reaction'),
+        ),
+        migrations.RunPython(copy_reactions, restore_reactions),
+        migrations.RemoveField(
+            model_name='comment',
+            name='dislikes',
+        ),
+        migrations.RemoveField(
+            model_name='comment',
+            name='likes',
+        ),
+        migrations.RemoveField(
+            model_name='post',
+            name='dislikes',
+        ),
+        migrations.RemoveField(
+            model_name='post',
+            name='likes',
+        ),
+    ]
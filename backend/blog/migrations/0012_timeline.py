@@ -0,0 +1,64 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_reaction'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='게시글 작성일')),
+            ],
+            options={
+                'verbose_name': '피드 항목',
+                'verbose_name_plural': '피드 항목 목록',
+                'ordering': ['-created_at', '-post_id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='timeline_pull',
+            field=models.BooleanField(default=False, editable=False, help_text='팔로워가 많아 발행 시 피드에 넣지 않고 팔로워가 피드를 볼 때 가져오는 게시글', verbose_name='피드 조회 시 반영'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('timeline_pull', True)), fields=['author', '-created_at'], name='blog_post_timeline_pull_idx'),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='작성자'),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='blog.post', verbose_name='게시글'),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL, verbose_name='사용자'),
+        ),
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['user', '-created_at', '-post', '-id'], name='blog_timeli_user_id_f05406_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['user', 'author'], name='blog_timeli_user_id_1c1204_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='timelineentry',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='unique_user_timeline_post'),
+        ),
+    ]
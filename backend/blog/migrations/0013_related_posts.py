@@ -0,0 +1,46 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_timeline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostTerms',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='terms', serialize=False, to='blog.post', verbose_name='게시글')),
+                ('terms', models.JSONField(default=dict, verbose_name='단어 빈도')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일')),
+            ],
+            options={
+                'verbose_name': '게시글 단어 빈도',
+                'verbose_name_plural': '게시글 단어 빈도 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='유사도')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='순위')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='blog.post', verbose_name='게시글')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='blog.post', verbose_name='관련 게시글')),
+            ],
+            options={
+                'verbose_name': '관련 게시글',
+                'verbose_name_plural': '관련 게시글 목록',
+                'ordering': ['post', 'rank'],
+                'indexes': [models.Index(fields=['post', 'rank'], name='blog_relate_post_id_0c405e_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='relatedpost',
+            constraint=models.UniqueConstraint(fields=('post', 'related'), name='unique_related_post'),
+        ),
+    ]
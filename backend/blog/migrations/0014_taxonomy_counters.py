@@ -0,0 +1,60 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:27
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef('pk')}).order_by().values(field)
+            .annotate(c=Count('*')).values('c')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    """기존 카테고리/태그/시리즈의 발행 게시글 수 채우기"""
+    Post = apps.get_model('blog', 'Post')
+    Category = apps.get_model('blog', 'Category')
+    Tag = apps.get_model('blog', 'Tag')
+    PostSeries = apps.get_model('blog', 'PostSeries')
+    published = Post.objects.filter(published=True)
+    Category.objects.update(post_count=_count(published, 'category'))
+    PostSeries.objects.update(post_count=_count(published, 'series'))
+    Tag.objects.update(
+        post_count=_count(Post.tags.through.objects.filter(post__published=True), 'tag')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_related_posts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='postseries',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='게시글 수'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['-post_count'], name='blog_tag_post_co_1f0ef7_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_taxonomy_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStat',
+            fields=[
+                ('key', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='이름')),
+                ('value', models.BigIntegerField(default=0, verbose_name='값')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='갱신일')),
+                ('reconciled_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='재계산일')),
+                ('drift', models.BigIntegerField(default=0, verbose_name='재계산 차이')),
+            ],
+            options={
+                'verbose_name': '사이트 통계',
+                'verbose_name_plural': '사이트 통계 목록',
+                'ordering': ['key'],
+            },
+        ),
+    ]
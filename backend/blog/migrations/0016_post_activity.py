@@ -0,0 +1,59 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_site_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostActivityHour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(verbose_name='시간')),
+                ('views', models.IntegerField(default=0, verbose_name='조회수')),
+                ('likes', models.IntegerField(default=0, verbose_name='좋아요')),
+                ('comments', models.IntegerField(default=0, verbose_name='댓글')),
+                ('bookmarks', models.IntegerField(default=0, verbose_name='북마크')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_hours', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '게시글 시간별 활동',
+                'verbose_name_plural': '게시글 시간별 활동 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='PostActivityDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('views', models.IntegerField(default=0, verbose_name='조회수')),
+                ('likes', models.IntegerField(default=0, verbose_name='좋아요')),
+                ('comments', models.IntegerField(default=0, verbose_name='댓글')),
+                ('bookmarks', models.IntegerField(default=0, verbose_name='북마크')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_days', to='blog.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '게시글 일별 활동',
+                'verbose_name_plural': '게시글 일별 활동 목록',
+                'indexes': [models.Index(fields=['date'], name='blog_postac_date_1ffd26_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='postactivityday',
+            constraint=models.UniqueConstraint(fields=('post', 'date'), name='unique_post_activity_day'),
+        ),
+        migrations.AddIndex(
+            model_name='postactivityhour',
+            index=models.Index(fields=['hour'], name='blog_postac_hour_5365b0_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='postactivityhour',
+            constraint=models.UniqueConstraint(fields=('post', 'hour'), name='unique_post_activity_hour'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0016_post_activity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='thumbnail_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='크기/포맷별 파생 이미지 목록 (blog.thumbnails 에서 생성)', verbose_name='썸네일 파생 이미지'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0017_post_thumbnail_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postterms',
+            name='min_score',
+            field=models.FloatField(default=0, help_text='저장된 이웃 목록의 마지막 유사도 (목록이 가득 차지 않았으면 0)', verbose_name='이웃 최저 유사도'),
+        ),
+    ]
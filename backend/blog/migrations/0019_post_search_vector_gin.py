@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-17 10:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+def drop_legacy_search_index(apps, schema_editor):
+    """0007 에서 RunPython 으로 직접 만들던 GIN 인덱스 제거 (AddIndex 로 다시 생성)"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS blog_post_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0018_postterms_min_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_legacy_search_index, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='blog_post_search_vector_gin'),
+        ),
+    ]
@@ -11,14 +11,81 @@ Blog 앱 - 모델
 - Post: 게시글 (제목, 내용, 작성자, 카테고리 등)
 - Comment: 댓글 (게시글, 작성자, 내용)
 - Bookmark: 북마크 (사용자, 게시글)
+- Reaction: 좋아요/싫어요 (게시글/댓글 공용)
+- TimelineEntry: 팔로잉 피드 (사용자별 게시글 ID 목록)
+- PostTerms / RelatedPost: 관련 게시글 색인 (TF-IDF 단어 빈도 / 상위 이웃)
 """
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.conf import settings
 
+from .view_counter import record_view
+from . import search, thumbnails
+from .inline_images import extract_post_images
+from .rendering import render_post
+
+
+class ReactionUsers:
+    """
+    좋아요/싫어요 사용자 접근자
+
+    Reaction 테이블로 통합하기 전 ManyToManyField 와 같은 방식으로 사용
+    - post.likes.all() / post.likes.count() / post.likes.filter(...)
+    - post.likes.add(user) / post.likes.remove(user) (blog.reactions 경유, 카운터 함께 갱신)
+    """
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return BoundReactionUsers(instance, self.value)
+
+
+class BoundReactionUsers:
+    """특정 게시글/댓글에 바인딩된 ReactionUsers"""
+    
+    def __init__(self, target, value):
+        self.target = target
+        self.value = value
+    
+    def get_queryset(self):
+        from django.contrib.auth import get_user_model
+        return get_user_model().objects.filter(
+            reactions__target_type=Reaction.target_type_for(type(self.target)),
+            reactions__target_id=self.target.pk,
+            reactions__value=self.value,
+        )
+    
+    def all(self):
+        return self.get_queryset()
+    
+    def filter(self, *args, **kwargs):
+        return self.get_queryset().filter(*args, **kwargs)
+    
+    def count(self):
+        return self.get_queryset().count()
+    
+    def exists(self):
+        return self.get_queryset().exists()
+    
+    def add(self, *users):
+        from .reactions import set_reaction
+        for user in users:
+            set_reaction(self.target, user, self.value)
+    
+    def remove(self, *users):
+        from .reactions import remove_reaction
+        for user in users:
+            remove_reaction(self.target, user, self.value)
+
 
 class Tag(models.Model):
     """
@@ -31,6 +98,7 @@ class Tag(models.Model):
     - name: 태그명
     - slug: URL 친화적 식별자
     - created_at: 생성일
+    - post_count: 발행 게시글 수 (비정규화)
     """
     
     name = models.CharField(
@@ -49,11 +117,22 @@ class Tag(models.Model):
         '생성일',
         auto_now_add=True
     )
+    # 발행 게시글 수 (blog.counters 에서 F() 증감으로만 관리)
+    COUNTER_FIELDS = ('post_count',)
+    post_count = models.PositiveIntegerField(
+        '게시글 수',
+        default=0,
+        editable=False
+    )
     
     class Meta:
         verbose_name = '태그'
         verbose_name_plural = '태그 목록'
         ordering = ['name']
+        indexes = [
+            # 태그 클라우드 (게시글 많은 순)
+            models.Index(fields=['-post_count']),
+        ]
     
     def __str__(self):
         return self.name
@@ -62,14 +141,20 @@ class Tag(models.Model):
         """슬러그 자동 생성"""
         if not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
+        # 기존 객체 수정 시 카운터 컬럼은 덮어쓰지 않음
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
         return reverse('blog:tag_detail', kwargs={'slug': self.slug})
     
     def get_post_count(self):
-        """태그가 붙은 게시글 수"""
-        return self.posts.filter(published=True).count()
+        """태그가 붙은 발행 게시글 수"""
+        return self.post_count
 
 
 class PostSeries(models.Model):
@@ -85,6 +170,7 @@ class PostSeries(models.Model):
     - author: 작성자
     - created_at: 생성일
     - updated_at: 수정일
+    - post_count: 발행 게시글 수 (비정규화)
     """
     
     title = models.CharField(
@@ -117,6 +203,13 @@ class PostSeries(models.Model):
         '수정일',
         auto_now=True
     )
+    # 발행 게시글 수 (blog.counters 에서 F() 증감으로만 관리)
+    COUNTER_FIELDS = ('post_count',)
+    post_count = models.PositiveIntegerField(
+        '게시글 수',
+        default=0,
+        editable=False
+    )
     
     class Meta:
         verbose_name = '시리즈'
@@ -132,18 +225,24 @@ class PostSeries(models.Model):
             base_slug = slugify(self.title, allow_unicode=True)
             timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
             self.slug = f'{base_slug}-{timestamp}'
+        # 기존 객체 수정 시 카운터 컬럼은 덮어쓰지 않음
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
         return reverse('blog:series_detail', kwargs={'slug': self.slug})
     
     def get_post_count(self):
-        """시리즈 내 게시글 수"""
-        return self.posts.filter(published=True).count()
+        """시리즈 내 발행 게시글 수"""
+        return self.post_count
     
     def get_posts(self):
         """시리즈 내 게시글 목록 (순서대로)"""
-        return self.posts.filter(published=True).order_by('series_order', 'created_at')
+        return self.posts.filter(published=True).for_list().order_by('series_order', 'created_at')
 
 
 class Category(models.Model):
@@ -158,6 +257,7 @@ class Category(models.Model):
     - slug: URL 친화적 식별자
     - description: 카테고리 설명
     - created_at: 생성일
+    - post_count: 발행 게시글 수 (비정규화)
     """
     
     name = models.CharField(
@@ -181,6 +281,13 @@ class Category(models.Model):
         '생성일',
         auto_now_add=True
     )
+    # 발행 게시글 수 (blog.counters 에서 F() 증감으로만 관리)
+    COUNTER_FIELDS = ('post_count',)
+    post_count = models.PositiveIntegerField(
+        '게시글 수',
+        default=0,
+        editable=False
+    )
     
     class Meta:
         verbose_name = '카테고리'
@@ -194,14 +301,40 @@ class Category(models.Model):
         """슬러그 자동 생성"""
         if not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
+        # 기존 객체 수정 시 카운터 컬럼은 덮어쓰지 않음
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
         return reverse('blog:category_detail', kwargs={'slug': self.slug})
     
     def get_post_count(self):
-        """카테고리 내 게시글 수"""
-        return self.posts.filter(published=True).count()
+        """카테고리 내 발행 게시글 수"""
+        return self.post_count
+
+
+class PostQuerySet(models.QuerySet):
+    """게시글 쿼리셋"""
+
+    # 검색 색인 (상세 페이지에서도 읽지 않음)
+    SEARCH_INDEX_FIELDS = ('search_document', 'search_vector')
+    # 본문 (목록 카드는 excerpt / reading_time 만 사용)
+    BODY_FIELDS = ('content', 'content_html', 'toc')
+    # 목록 (카드, 사이드바, API 목록) 에서 읽지 않는 큰 컬럼
+    LIST_DEFERRED_FIELDS = SEARCH_INDEX_FIELDS + BODY_FIELDS
+
+    @classmethod
+    def list_deferred_fields(cls, prefix=''):
+        """목록에서 제외하는 컬럼 (select_related 로 읽을 때는 prefix='post__')"""
+        return [f'{prefix}{name}' for name in cls.LIST_DEFERRED_FIELDS]
+
+    def for_list(self):
+        """목록용 (검색 색인, 본문 등 카드에 쓰지 않는 컬럼 제외)"""
+        return self.defer(*self.list_deferred_fields())
 
 
 class Post(models.Model):
@@ -213,18 +346,24 @@ class Post(models.Model):
     필드:
     - title: 제목
     - slug: URL 친화적 식별자
-    - content: 본문 내용
+    - content: 본문 내용 (붙여넣은 base64 이미지는 저장 시 파일로 분리, blog.inline_images)
     - author: 작성자 (User FK)
     - category: 카테고리 (Category FK)
     - tags: 태그 (Tag M2M)
     - series: 시리즈 (PostSeries FK)
     - thumbnail: 썸네일 이미지
+    - thumbnail_variants: 썸네일 파생 이미지 메타데이터 (blog.thumbnails)
     - published: 발행 여부
     - is_draft: 임시저장 여부
     - created_at: 생성일
     - updated_at: 수정일
     - draft_saved_at: 임시저장일
     - views: 조회수
+    - likes_count / dislikes_count: 좋아요/싫어요 수 (비정규화)
+    - comment_count: 활성 댓글 수 (비정규화)
+    - bookmark_count: 북마크 수 (비정규화)
+    - search_document / search_vector: 검색 색인 (blog.search)
+    - content_html / excerpt / word_count / reading_time / toc: 본문 렌더링 결과 (blog.rendering)
     """
     
     title = models.CharField(
@@ -283,6 +422,13 @@ class Post(models.Model):
         null=True,
         help_text='게시글 썸네일 이미지'
     )
+    thumbnail_variants = models.JSONField(
+        '썸네일 파생 이미지',
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text='크기/포맷별 파생 이미지 목록 (blog.thumbnails 에서 생성)'
+    )
     published = models.BooleanField(
         '발행',
         default=True,
@@ -311,19 +457,81 @@ class Post(models.Model):
         '조회수',
         default=0
     )
-    likes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name='liked_posts',
+    # 좋아요/싫어요 사용자 (Reaction 테이블 호환 접근자)
+    likes = ReactionUsers(1)
+    dislikes = ReactionUsers(-1)
+    # 비정규화 카운터 (blog.counters 에서 F() 증감으로만 관리)
+    COUNTER_FIELDS = ('likes_count', 'dislikes_count', 'comment_count', 'bookmark_count')
+    # 검색 색인에 들어가는 필드
+    SEARCH_SOURCE_FIELDS = {'title', 'content', 'author'}
+    # 본문 저장 시 함께 갱신되는 렌더링 필드
+    RENDERED_FIELDS = ('content_html', 'excerpt', 'word_count', 'reading_time', 'toc')
+    likes_count = models.PositiveIntegerField(
+        '좋아요 수',
+        default=0
+    )
+    dislikes_count = models.PositiveIntegerField(
+        '싫어요 수',
+        default=0
+    )
+    comment_count = models.PositiveIntegerField(
+        '댓글 수',
+        default=0
+    )
+    bookmark_count = models.PositiveIntegerField(
+        '북마크 수',
+        default=0
+    )
+    # 검색 색인 (blog.search 에서 저장 시 갱신)
+    search_document = models.TextField(
+        '검색 문서',
         blank=True,
-        verbose_name='좋아요'
+        editable=False,
+        help_text='HTML 제거 및 토큰화된 제목/작성자/본문'
     )
-    dislikes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name='disliked_posts',
+    search_vector = SearchVectorField(
+        '검색 벡터',
+        null=True,
+        editable=False
+    )
+    # 본문 렌더링 결과 (blog.rendering 에서 저장 시 갱신)
+    content_html = models.TextField(
+        '렌더링된 본문',
+        blank=True,
+        editable=False,
+        help_text='허용 태그만 남기고 제목 앵커를 추가한 HTML'
+    )
+    excerpt = models.CharField(
+        '요약',
+        max_length=300,
+        blank=True,
+        editable=False
+    )
+    word_count = models.PositiveIntegerField(
+        '단어 수',
+        default=0,
+        editable=False
+    )
+    reading_time = models.PositiveIntegerField(
+        '읽기 시간(분)',
+        default=1,
+        editable=False
+    )
+    toc = models.JSONField(
+        '목차',
+        default=list,
         blank=True,
-        verbose_name='싫어요'
+        editable=False
+    )
+    timeline_pull = models.BooleanField(
+        '피드 조회 시 반영',
+        default=False,
+        editable=False,
+        help_text='팔로워가 많아 발행 시 피드에 넣지 않고 팔로워가 피드를 볼 때 가져오는 게시글'
     )
     
+    objects = PostQuerySet.as_manager()
+    
     class Meta:
         verbose_name = '게시글'
         verbose_name_plural = '게시글 목록'
@@ -332,8 +540,21 @@ class Post(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['author', '-created_at']),
-            models.Index(fields=['category', '-created_at']),
-            models.Index(fields=['published', '-created_at']),
+            # 목록 키셋 페이지네이션 (정렬 키 + id)
+            models.Index(fields=['category', '-created_at', '-id']),
+            models.Index(fields=['published', '-created_at', '-id']),
+            # 인기 게시글 (조회수순)
+            models.Index(fields=['published', '-views']),
+            # 좋아요순 정렬
+            models.Index(fields=['published', '-likes_count', '-created_at', '-id']),
+            # 팔로잉 피드 조회 시 가져오는 게시글 (팔로워가 많은 작성자)
+            models.Index(
+                fields=['author', '-created_at'],
+                condition=models.Q(timeline_pull=True),
+                name='blog_post_timeline_pull_idx'
+            ),
+            # 전문 검색 (PostgreSQL)
+            GinIndex(fields=['search_vector'], name='blog_post_search_vector_gin'),
         ]
     
     def __str__(self):
@@ -346,23 +567,67 @@ class Post(models.Model):
             # 유니크 슬러그 생성
             timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
             self.slug = f'{base_slug}-{timestamp}'
+        update_fields = kwargs.get('update_fields')
+        # 본문이 저장 대상이면 base64 이미지를 파일로 분리 후 렌더링 필드 갱신
+        if update_fields is None or 'content' in update_fields:
+            extract_post_images(self)
+            render_post(self)
+            if update_fields is not None:
+                update_fields = kwargs['update_fields'] = {*update_fields, *self.RENDERED_FIELDS}
+        # 제목/본문/작성자가 저장 대상일 때만 검색 색인 갱신
+        reindex = update_fields is None or bool(self.SEARCH_SOURCE_FIELDS & set(update_fields))
+        if reindex:
+            self.search_document = search.build_search_document(self)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'search_document'}
+        # 기존 게시글 수정 시 카운터/조회수 컬럼은 덮어쓰지 않음 (동시 증감 유실 방지)
+        if not self._state.adding and update_fields is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key
+                and f.name not in self.COUNTER_FIELDS
+                and f.name not in ('views', 'search_vector', 'timeline_pull', 'thumbnail_variants')
+            ]
         super().save(*args, **kwargs)
+        if reindex:
+            search.update_search_vector(self, using=kwargs.get('using') or 'default')
     
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'slug': self.slug})
     
+    @cached_property
+    def thumbnail_image(self):
+        """썸네일 파생 이미지 정보 (blog.thumbnails.ThumbnailImage 또는 None)"""
+        return thumbnails.thumbnail_image(self)
+    
     def get_comment_count(self):
-        """댓글 수 반환"""
-        return self.comments.count()
+        """댓글 수 반환 (비정규화 컬럼)"""
+        return self.comment_count
     
     def increase_views(self):
-        """조회수 증가"""
+        """
+        조회수 증가
+
+        DB에 바로 쓰지 않고 조회수 버퍼에 기록 (blog.view_counter)
+        버퍼가 주기적으로 views = views + n 으로 일괄 반영
+        """
+        record_view(self.pk)
         self.views += 1
-        self.save(update_fields=['views'])
     
     def get_related_posts(self, limit=5):
-        """관련 게시글 (같은 카테고리)"""
-        if self.category:
+        """
+        관련 게시글 (본문/태그/카테고리 TF-IDF 유사도순, blog.related)
+
+        색인 전이거나 유사한 게시글이 없으면 같은 카테고리 최신 게시글
+        """
+        related = list(
+            Post.objects.filter(similar_to__post=self, published=True)
+            .select_related('author', 'category')
+            .order_by('similar_to__rank')[:limit]
+        )
+        if related:
+            return related
+        if self.category_id:
             return Post.objects.filter(
                 category=self.category,
                 published=True
@@ -385,6 +650,7 @@ class Comment(models.Model):
     - created_at: 생성일
     - updated_at: 수정일
     - is_active: 활성 상태 (삭제 시 False)
+    - likes_count / dislikes_count: 좋아요/싫어요 수 (비정규화)
     """
     
     post = models.ForeignKey(
@@ -424,17 +690,18 @@ class Comment(models.Model):
         default=True,
         help_text='삭제된 댓글은 비활성 상태'
     )
-    likes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name='liked_comments',
-        blank=True,
-        verbose_name='좋아요'
+    # 좋아요/싫어요 사용자 (Reaction 테이블 호환 접근자)
+    likes = ReactionUsers(1)
+    dislikes = ReactionUsers(-1)
+    # 비정규화 카운터 (blog.reactions 에서 F() 증감으로만 관리)
+    COUNTER_FIELDS = ('likes_count', 'dislikes_count')
+    likes_count = models.PositiveIntegerField(
+        '좋아요 수',
+        default=0
     )
-    dislikes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name='disliked_comments',
-        blank=True,
-        verbose_name='싫어요'
+    dislikes_count = models.PositiveIntegerField(
+        '싫어요 수',
+        default=0
     )
     
     class Meta:
@@ -445,6 +712,15 @@ class Comment(models.Model):
     def __str__(self):
         return f'{self.author.username}: {self.content[:30]}'
     
+    def save(self, *args, **kwargs):
+        """기존 댓글 수정 시 카운터 컬럼은 덮어쓰지 않음"""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+    
     def get_replies(self):
         """대댓글 목록"""
         return self.replies.filter(is_active=True)
@@ -492,3 +768,341 @@ class Bookmark(models.Model):
 
     def __str__(self):
         return f'{self.user.username} - {self.post.title}'
+
+
+class Reaction(models.Model):
+    """
+    좋아요/싫어요 모델
+
+    게시글/댓글의 좋아요·싫어요를 한 테이블에 저장
+    (대상 종류, 대상 ID, 사용자) 유니크 인덱스 하나로 조회/전환/상호 배타 처리
+
+    필드:
+    - user: 사용자
+    - target_type: 대상 종류 (게시글/댓글)
+    - target_id: 대상 ID
+    - value: 1 (좋아요) / -1 (싫어요)
+    - created_at: 생성일
+    """
+    POST = 1
+    COMMENT = 2
+    TARGET_CHOICES = [
+        (POST, '게시글'),
+        (COMMENT, '댓글'),
+    ]
+    LIKE = 1
+    DISLIKE = -1
+    VALUE_CHOICES = [
+        (LIKE, '좋아요'),
+        (DISLIKE, '싫어요'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='reactions',
+        verbose_name='사용자'
+    )
+    target_type = models.PositiveSmallIntegerField(
+        '대상 종류',
+        choices=TARGET_CHOICES
+    )
+    target_id = models.PositiveBigIntegerField(
+        '대상 ID'
+    )
+    value = models.SmallIntegerField(
+        '반응',
+        choices=VALUE_CHOICES
+    )
+    created_at = models.DateTimeField(
+        '생성일',
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = '반응'
+        verbose_name_plural = '반응 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['target_type', 'target_id', 'user'],
+                name='unique_target_user_reaction'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} {self.get_value_display()} {self.get_target_type_display()} #{self.target_id}'
+
+    @classmethod
+    def target_type_for(cls, model):
+        """모델 클래스 → 대상 종류"""
+        if model is Post:
+            return cls.POST
+        if model is Comment:
+            return cls.COMMENT
+        raise TypeError(f'반응을 지원하지 않는 대상입니다: {model.__name__}')
+
+
+class TimelineEntry(models.Model):
+    """
+    팔로잉 피드 항목
+
+    사용자별로 팔로우한 작성자의 게시글 ID 를 미리 저장 (blog.timeline)
+    피드 조회는 (user, created_at, post) 인덱스 범위 조회 1회
+
+    필드:
+    - user: 피드 소유자
+    - post: 게시글
+    - author: 게시글 작성자 (언팔로우 시 삭제용)
+    - created_at: 게시글 작성일 (피드 정렬 키)
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='사용자'
+    )
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='게시글'
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='작성자'
+    )
+    created_at = models.DateTimeField(
+        '게시글 작성일'
+    )
+
+    class Meta:
+        verbose_name = '피드 항목'
+        verbose_name_plural = '피드 항목 목록'
+        ordering = ['-created_at', '-post_id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'post'],
+                name='unique_user_timeline_post'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-post', '-id']),
+            models.Index(fields=['user', 'author']),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} ← {self.post_id}'
+
+
+class PostTerms(models.Model):
+    """
+    관련 게시글 색인용 게시글 단어 빈도
+
+    본문(HTML 제거)/제목/태그/카테고리에서 뽑은 {단어: 횟수}
+    TF-IDF 벡터는 전체 게시글의 단어 빈도로 계산 (blog.related)
+    min_score: 증분 갱신 시 이 게시글의 이웃 목록이 바뀔 수 있는지 판단 (이보다 유사도가 높아야 들어감)
+    """
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='terms',
+        verbose_name='게시글'
+    )
+    terms = models.JSONField(
+        '단어 빈도',
+        default=dict
+    )
+    min_score = models.FloatField(
+        '이웃 최저 유사도',
+        default=0,
+        help_text='저장된 이웃 목록의 마지막 유사도 (목록이 가득 차지 않았으면 0)'
+    )
+    updated_at = models.DateTimeField(
+        '갱신일',
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = '게시글 단어 빈도'
+        verbose_name_plural = '게시글 단어 빈도 목록'
+
+    def __str__(self):
+        return f'{self.post_id}: {len(self.terms)}개 단어'
+
+
+class RelatedPost(models.Model):
+    """
+    관련 게시글 (게시글별 유사도 상위 이웃)
+
+    필드:
+    - post: 기준 게시글
+    - related: 관련 게시글
+    - score: 코사인 유사도
+    - rank: 순위 (0 부터)
+    """
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='related_links',
+        verbose_name='게시글'
+    )
+    related = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='similar_to',
+        verbose_name='관련 게시글'
+    )
+    score = models.FloatField(
+        '유사도'
+    )
+    rank = models.PositiveSmallIntegerField(
+        '순위'
+    )
+
+    class Meta:
+        verbose_name = '관련 게시글'
+        verbose_name_plural = '관련 게시글 목록'
+        ordering = ['post', 'rank']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'related'],
+                name='unique_related_post'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['post', 'rank']),
+        ]
+
+    def __str__(self):
+        return f'{self.post_id} → {self.related_id} ({self.score:.3f})'
+
+
+class SiteStat(models.Model):
+    """
+    사이트 통계 (전체 게시글/댓글/회원/조회수)
+
+    홈/관리자 대시보드가 매 요청 COUNT/SUM 하지 않도록
+    변경 시점에 증감하고 주기적으로 DB 기준 값과 맞춤 (blog.site_stats)
+
+    필드:
+    - key: 통계 이름 (site_stats.STATS)
+    - value: 현재 값
+    - updated_at: 마지막 증감 시각
+    - reconciled_at: 마지막 재계산 시각
+    - drift: 마지막 재계산 시 증감 값과 DB 기준 값의 차이 (증감 값 - 실제 값)
+    """
+    key = models.CharField(
+        '이름',
+        max_length=50,
+        primary_key=True
+    )
+    value = models.BigIntegerField(
+        '값',
+        default=0
+    )
+    updated_at = models.DateTimeField(
+        '갱신일',
+        default=timezone.now
+    )
+    reconciled_at = models.DateTimeField(
+        '재계산일',
+        default=timezone.now
+    )
+    drift = models.BigIntegerField(
+        '재계산 차이',
+        default=0
+    )
+
+    class Meta:
+        verbose_name = '사이트 통계'
+        verbose_name_plural = '사이트 통계 목록'
+        ordering = ['key']
+
+    def __str__(self):
+        return f'{self.key}: {self.value}'
+
+
+class PostActivityHour(models.Model):
+    """
+    게시글 시간별 활동 (최근 집계, blog.analytics)
+
+    버퍼에서 flush 된 증감을 시간 단위로 누적
+    ANALYTICS_HOURLY_RETENTION_DAYS 가 지나면 일별 집계(PostActivityDay)로 합친 뒤 삭제
+
+    필드:
+    - post: 게시글
+    - hour: 시간 (정시)
+    - views / likes / comments / bookmarks: 해당 시간의 증감 (취소 시 차감)
+    """
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='activity_hours',
+        verbose_name='게시글'
+    )
+    hour = models.DateTimeField(
+        '시간'
+    )
+    views = models.IntegerField('조회수', default=0)
+    likes = models.IntegerField('좋아요', default=0)
+    comments = models.IntegerField('댓글', default=0)
+    bookmarks = models.IntegerField('북마크', default=0)
+
+    class Meta:
+        verbose_name = '게시글 시간별 활동'
+        verbose_name_plural = '게시글 시간별 활동 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'hour'],
+                name='unique_post_activity_hour'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['hour']),
+        ]
+
+    def __str__(self):
+        return f'{self.post_id} @ {self.hour:%Y-%m-%d %H}시'
+
+
+class PostActivityDay(models.Model):
+    """
+    게시글 일별 활동 (blog.analytics)
+
+    필드:
+    - post: 게시글
+    - date: 날짜 (TIME_ZONE 기준)
+    - views / likes / comments / bookmarks: 해당 날짜의 증감 (취소 시 차감)
+    """
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='activity_days',
+        verbose_name='게시글'
+    )
+    date = models.DateField(
+        '날짜'
+    )
+    views = models.IntegerField('조회수', default=0)
+    likes = models.IntegerField('좋아요', default=0)
+    comments = models.IntegerField('댓글', default=0)
+    bookmarks = models.IntegerField('북마크', default=0)
+
+    class Meta:
+        verbose_name = '게시글 일별 활동'
+        verbose_name_plural = '게시글 일별 활동 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'date'],
+                name='unique_post_activity_day'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f'{self.post_id} @ {self.date}'
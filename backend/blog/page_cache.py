@@ -0,0 +1,142 @@
+"""
+Blog 앱 - 전체 페이지 캐시
+=========================
+홈/게시글 목록/상세/카테고리/태그/시리즈 페이지 HTML 을 공유 캐시에 저장하여
+같은 페이지를 요청마다 다시 조회/렌더링하지 않음
+
+저장 조건:
+- 비로그인 요청 (세션 쿠키 없음) 의 GET 200 응답만 저장
+- 응답이 쿠키를 설정하거나 CSRF 토큰을 발급했으면 저장하지 않음
+  (캐시 대상 템플릿은 {% csrf_token %} 대신 사용자 상태 JSON 의 토큰 사용)
+
+사용 조건:
+- 로그인 사용자도 같은 캐시 사용 (페이지는 비로그인 상태로 렌더링된 HTML)
+  → 사용자 메뉴/알림 수/좋아요·북마크 상태/작성자 버튼은
+    static/js/main.js 가 blog:viewer_state JSON 1회 조회로 채움
+- 메시지 쿠키가 있는 요청 (작성/삭제 직후 리다이렉트 등) 은 캐시를 건너뛰고 렌더링
+
+무효화 (의존성 태그, blog.cache_tags):
+- 페이지마다 의존 태그를 함께 저장 → 해당 태그가 갱신된 페이지만 무효화
+  - 고정 태그: 데코레이터 tags 인자 (예: post:list)
+  - 렌더링 중 정해지는 태그: add_page_tags(request, 'post:1', ...)
+    대상 객체를 표시용으로 조회하기 전에 호출 (슬러그 → ID 만 먼저 확인하고, 태그 기록 후 다시 조회)
+- 모든 페이지는 pages 태그에도 의존 → invalidate_pages() 로 전체 무효화
+- 그 외 (조회수, 좋아요 수 등) 는 PAGE_CACHE_TIMEOUT 초 후 갱신
+
+사용 예:
+    @method_decorator(cache_page_for_anonymous(tags=['post:list']), name='dispatch')
+    class PostListView(ListView): ...
+"""
+
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .cache_tags import invalidate_tags, is_current, tag_stamp
+
+ALL_PAGES_TAG = 'pages'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def invalidate_pages():
+    """캐시된 페이지 전체 무효화"""
+    invalidate_tags(ALL_PAGES_TAG)
+
+
+def collecting_page_tags(request):
+    """캐시에 저장할 페이지를 렌더링 중인지 (add_page_tags 가 태그를 기록하는 요청)"""
+    return getattr(request, '_page_cache_stamp', None) is not None
+
+
+def add_page_tags(request, *tags):
+    """
+    현재 페이지의 의존 태그 추가 (캐시 대상 요청이 아니면 무시)
+
+    태그의 현재 토큰을 호출 시점에 읽으므로 의존 데이터를 조회하기 전에 호출
+    """
+    stamp = getattr(request, '_page_cache_stamp', None)
+    if stamp is not None:
+        stamp.update(tag_stamp(tag for tag in tags if tag not in stamp))
+
+
+def request_fingerprint(request):
+    """호스트 + 경로 + 정렬된 쿼리스트링 해시 (blog.degraded 도 사용)"""
+    query = urlencode(sorted(
+        (name, value) for name, values in request.GET.lists() for value in values
+    ))
+    raw = f'{request.get_host()}{request.path}?{query}'
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def page_cache_key(request):
+    return f'page:{request_fingerprint(request)}'
+
+
+def _can_serve(request):
+    return (
+        _setting('PAGE_CACHE_ENABLED', True)
+        and request.method in ('GET', 'HEAD')
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def _can_store(request, response):
+    return (
+        request.method == 'GET'
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+def cache_page_for_anonymous(timeout=None, on_hit=None, tags=()):
+    """
+    전체 페이지 캐시 데코레이터
+
+    Args:
+        timeout: 캐시 유지 시간 (기본값: PAGE_CACHE_TIMEOUT)
+        on_hit: 캐시 사용 시 호출 (request, meta)
+                meta 는 렌더링 시 response.page_cache_meta 에 넣은 값 (예: 조회수 기록용 게시글 ID)
+        tags: 항상 의존하는 태그 (예: ['post:list', 'category:list'])
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _can_serve(request):
+                return view_func(request, *args, **kwargs)
+
+            key = page_cache_key(request)
+            entry = cache.get(key)
+            if entry is not None and is_current(entry['stamp']):
+                if on_hit is not None:
+                    on_hit(request, entry['meta'])
+                response = HttpResponse(entry['content'], content_type=entry['content_type'])
+                response['X-Page-Cache'] = 'hit'
+                return response
+
+            # 렌더링 전에 토큰을 읽어 렌더링 중 무효화된 페이지는 다음 요청에서 버림
+            request._page_cache_stamp = tag_stamp([ALL_PAGES_TAG, *tags])
+            response = view_func(request, *args, **kwargs)
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+            if _can_store(request, response):
+                cache.set(key, {
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'meta': getattr(response, 'page_cache_meta', {}),
+                    'stamp': request._page_cache_stamp,
+                }, timeout if timeout is not None else _setting('PAGE_CACHE_TIMEOUT', 60))
+                response['X-Page-Cache'] = 'miss'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,252 @@
+"""
+Blog 앱 - 키셋 페이지네이션
+==========================
+OFFSET/COUNT 없이 이전 페이지 마지막 행의 정렬 키 다음부터 조회하는
+커서 기반 페이지네이션
+
+동작 방식:
+- 쿼리셋의 order_by (없으면 Meta.ordering) 를 정렬 키로 사용
+- 정렬 키 끝에 id 를 붙여 동일 값이 있어도 순서가 항상 유일하도록 보장
+  (예: -likes_count, -created_at → -likes_count, -created_at, -id)
+- 커서에는 경계 행의 정렬 키 값과 정렬 방식만 담아 base64 로 인코딩
+- 다음 페이지: WHERE (정렬 키) > 커서 값 ORDER BY ... LIMIT n + 1
+  이전 페이지: 정렬을 뒤집어 같은 방식으로 조회 후 순서 복원
+- 전체 개수(COUNT)와 페이지 번호는 제공하지 않음
+
+제약:
+- 정렬 키는 현재 모델의 필드 또는 annotate 값이어야 함 (관계 필드 경로 불가)
+- 정렬 키 값은 NULL 이 아니어야 함
+
+사용 예:
+    page = paginate(Post.objects.order_by('-created_at'), request.GET.get('cursor'))
+    for post in page:
+        ...
+    page.next_cursor
+"""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(Exception):
+    """해석할 수 없거나 현재 정렬과 맞지 않는 커서"""
+
+
+# ==================== 정렬 키 ====================
+
+def get_ordering(queryset):
+    """
+    쿼리셋의 키셋 정렬 키
+
+    Returns:
+        [(필드명, 내림차순 여부), ...] (마지막은 항상 pk)
+    """
+    meta = queryset.model._meta
+    ordering = list(queryset.query.order_by)
+    if not ordering and queryset.query.default_ordering:
+        ordering = list(meta.ordering)
+
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or item == '?' or '__' in item:
+            raise ValueError(f'키셋 페이지네이션에 사용할 수 없는 정렬입니다: {item!r}')
+        descending = item.startswith('-')
+        name = item.lstrip('-+')
+        if name == 'pk':
+            name = meta.pk.name
+        try:
+            name = meta.get_field(name).attname
+        except FieldDoesNotExist:
+            pass  # annotate 값
+        if all(name != key for key, _ in keys):
+            keys.append((name, descending))
+        if name == meta.pk.attname:
+            # pk 이후 정렬 키는 의미 없음
+            return keys
+
+    keys.append((meta.pk.attname, keys[-1][1] if keys else False))
+    return keys
+
+
+def _signature(keys):
+    return ','.join(('-' if descending else '') + name for name, descending in keys)
+
+
+def _to_json(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+# ==================== 커서 ====================
+
+def encode_cursor(keys, obj, reverse=False):
+    """경계 행으로부터 커서 문자열 생성"""
+    payload = {
+        'o': _signature(keys),
+        'k': [_to_json(getattr(obj, name)) for name, _ in keys],
+    }
+    if reverse:
+        payload['r'] = 1
+    raw = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, keys):
+    """
+    커서 문자열 해석
+
+    Returns:
+        (정렬 키 값 리스트, 역방향 여부)
+
+    Raises:
+        InvalidCursor: 형식 오류이거나 다른 정렬에서 만든 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload['k']
+        signature = payload['o']
+        reverse = bool(payload.get('r'))
+    except (TypeError, ValueError, KeyError, binascii.Error):
+        raise InvalidCursor(cursor)
+    if signature != _signature(keys) or not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor(cursor)
+    return values, reverse
+
+
+def _keyset_filter(keys, values, reverse):
+    """
+    정렬 키 기준 경계 이후 행 조건
+
+    (a, b, id) 내림차순이면
+    a <= x AND (a < x OR (a = x AND b < y) OR (a = x AND b = y AND id < z))
+    첫 조건은 첫 정렬 키 인덱스 범위 검색용
+    """
+    condition = Q()
+    equal = {}
+    for (name, descending), value in zip(keys, values):
+        lookup = 'lt' if descending != reverse else 'gt'
+        condition |= Q(**equal, **{f'{name}__{lookup}': value})
+        equal[name] = value
+
+    first_name, first_descending = keys[0]
+    lookup = 'lte' if first_descending != reverse else 'gte'
+    return Q(**{f'{first_name}__{lookup}': values[0]}) & condition
+
+
+# ==================== 페이지 ====================
+
+class KeysetPage:
+    """
+    키셋 페이지 (Django Page 와 비슷한 인터페이스)
+
+    템플릿에서 page_obj.has_next / page_obj.next_cursor 등으로 사용
+    """
+
+    def __init__(self, object_list, has_next, has_previous, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+
+def paginate(queryset, cursor=None, page_size=10):
+    """
+    키셋 페이지 조회
+
+    Args:
+        queryset: 정렬된 쿼리셋 (정렬이 없으면 Meta.ordering, 그것도 없으면 pk)
+        cursor: 이전 응답의 next_cursor / previous_cursor (None 이면 첫 페이지)
+        page_size: 페이지 크기
+
+    Returns:
+        KeysetPage
+
+    Raises:
+        InvalidCursor: 잘못된 커서
+    """
+    keys = get_ordering(queryset)
+    position, reverse = (None, False)
+    if cursor:
+        position, reverse = decode_cursor(cursor, keys)
+
+    queryset = queryset.order_by(*[
+        ('-' if descending != reverse else '') + name for name, descending in keys
+    ])
+    if position is not None:
+        queryset = queryset.filter(_keyset_filter(keys, position, reverse))
+
+    rows = list(queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+
+    if reverse:
+        has_next, has_previous = position is not None, has_more
+    else:
+        has_next, has_previous = has_more, position is not None
+
+    return KeysetPage(
+        rows,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=encode_cursor(keys, rows[-1]) if has_next and rows else None,
+        previous_cursor=encode_cursor(keys, rows[0], reverse=True) if has_previous and rows else None,
+    )
+
+
+class KeysetPaginationMixin:
+    """
+    ListView 키셋 페이지네이션 믹스인
+
+    ?page= 대신 ?cursor= 사용, paginate_by 는 그대로 페이지 크기로 사용
+    컨텍스트:
+    - page_obj: KeysetPage
+    - page_query: cursor 를 제외한 현재 쿼리스트링 (필터/검색/정렬 유지용)
+    """
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = paginate(queryset, self.request.GET.get(self.cursor_kwarg), page_size)
+        except InvalidCursor:
+            raise Http404('잘못된 페이지 커서입니다.')
+        return None, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        params = self.request.GET.copy()
+        params.pop(self.cursor_kwarg, None)
+        params.pop('page', None)
+        context['page_query'] = params.urlencode()
+        return context
@@ -0,0 +1,123 @@
+"""
+Blog 앱 - 좋아요/싫어요
+======================
+게시글/댓글 좋아요·싫어요 상태 전환을 한 트랜잭션에서 처리
+네 개의 토글 뷰(게시글/댓글 × 좋아요/싫어요)가 모두 이 경로를 사용
+
+저장 구조:
+- Reaction 테이블 한 곳에 (대상 종류, 대상 ID, 사용자) 당 한 행, value = 1 / -1
+- 좋아요 ↔ 싫어요 상호 배타는 유니크 인덱스로 보장 (한 사용자당 한 행)
+
+처리 순서 (한 트랜잭션):
+1. 대상 행 잠금 + 현재 카운터 조회 (SELECT ... FOR UPDATE)
+   같은 대상에 대한 동시 요청(더블클릭 등)이 순서대로 처리됨
+2. 현재 반응 조회 (유니크 인덱스)
+3. 반응 행 하나만 변경: INSERT / UPDATE value / DELETE
+4. 바뀐 만큼 카운터 증감 (UPDATE 1회)
+   게시글 좋아요 증감은 일별 활동 통계에도 기록 (blog.analytics)
+5. 잠금 시 읽은 카운터 + 증감값으로 새 카운트 반환 (다시 COUNT 하지 않음)
+
+사용 예:
+    result = toggle_reaction(post, request.user, LIKE)
+    result.value, result.likes_count, result.dislikes_count
+"""
+
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .analytics import record_activity
+from .models import Post, Reaction
+from .viewer_state import invalidate_viewer_state
+
+LIKE = Reaction.LIKE
+DISLIKE = Reaction.DISLIKE
+CLEAR = 0
+
+COUNTER_FOR = {LIKE: 'likes_count', DISLIKE: 'dislikes_count'}
+
+
+@dataclass(frozen=True)
+class ReactionResult:
+    """반응 전환 결과"""
+    value: int
+    likes_count: int
+    dislikes_count: int
+
+    @property
+    def liked(self):
+        return self.value == LIKE
+
+    @property
+    def disliked(self):
+        return self.value == DISLIKE
+
+
+def set_reaction(target, user, value):
+    """
+    반응 상태를 value 로 설정
+
+    Args:
+        target: Post 또는 Comment 인스턴스
+        user: 사용자
+        value: LIKE / DISLIKE / CLEAR
+
+    Returns:
+        ReactionResult
+    """
+    return _apply(target, user, lambda current: value)
+
+
+def toggle_reaction(target, user, value):
+    """같은 반응이 있으면 취소, 없으면 value 로 전환"""
+    return _apply(target, user, lambda current: CLEAR if current == value else value)
+
+
+def remove_reaction(target, user, value):
+    """현재 반응이 value 일 때만 취소"""
+    return _apply(target, user, lambda current: CLEAR if current == value else current)
+
+
+def _apply(target, user, transition):
+    model = type(target)
+    key = {
+        'target_type': Reaction.target_type_for(model),
+        'target_id': target.pk,
+        'user_id': user.pk,
+    }
+    deltas = {}
+
+    with transaction.atomic():
+        counts = model.objects.select_for_update()\
+            .values('likes_count', 'dislikes_count').get(pk=target.pk)
+
+        current = Reaction.objects.filter(**key).values_list('value', flat=True).first() or CLEAR
+        value = transition(current)
+
+        if value != current:
+            if current == CLEAR:
+                Reaction.objects.create(**key, value=value)
+            elif value == CLEAR:
+                Reaction.objects.filter(**key).delete()
+            else:
+                Reaction.objects.filter(**key).update(value=value)
+
+            if current != CLEAR:
+                deltas[COUNTER_FOR[current]] = -1
+            if value != CLEAR:
+                deltas[COUNTER_FOR[value]] = 1
+            model.objects.filter(pk=target.pk).update(**{
+                field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+            })
+
+    if deltas:
+        invalidate_viewer_state(user)
+        if model is Post:
+            record_activity(target.pk, likes=deltas.get('likes_count', 0))
+    return ReactionResult(
+        value=value,
+        likes_count=max(counts['likes_count'] + deltas.get('likes_count', 0), 0),
+        dislikes_count=max(counts['dislikes_count'] + deltas.get('dislikes_count', 0), 0),
+    )
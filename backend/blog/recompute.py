@@ -0,0 +1,259 @@
+"""
+Blog 앱 - 캐시 재계산 보호
+=========================
+비싼 집계 값 (인기 게시글, 태그 클라우드, 시리즈 목록, 관리자 대시보드 통계 등) 의 캐시가 만료될 때
+동시에 들어온 요청이 모두 같은 값을 다시 계산하지 않도록 보호
+
+방식:
+- 단일 재계산 (single-flight): 공유 캐시 잠금 (cache.add) 을 얻은 워커 1개만 재계산
+  - 이전 값이 남아 있으면 나머지 요청은 기다리지 않고 이전 값 사용
+  - 이전 값이 없으면 결과가 저장되거나 잠금이 풀릴 때까지 기다림
+    (계산 실패로 잠금이 해제되거나 RECOMPUTE_LOCK_TIMEOUT 이 지나 만료된 경우에만 잠금을 얻어 직접 계산,
+     RECOMPUTE_WAIT 초보다 오래 기다린 요청은 wait_timeouts 로 집계)
+- 확률적 조기 갱신 (XFetch): 만료가 가까울수록, 계산이 오래 걸리는 값일수록 높은 확률로
+  만료 전에 미리 재계산 → 만료 시점에 요청이 몰리지 않음
+- TTL 분산: 저장 시 TTL 을 최대 RECOMPUTE_JITTER 비율만큼 줄여 같은 시각에 저장된 값들의 만료 시각을 분산
+- 만료 후에도 RECOMPUTE_STALE_TTL 초 동안 이전 값을 보관 (재계산 중 사용)
+
+지표: 이름별 적중/재계산/조기 갱신/잠금 경합/대기 수 (metrics(), 관리자 API blog:cache_metrics)
+
+사용 예:
+    @guarded_cache('dashboard:activity', ttl=60)
+    def dashboard_activity(days):
+        return analytics.site_series(days)
+
+    boards = RecomputeGuard('leaderboard', ttl=300)
+    rows = boards.get_or_compute('all', load_rows)
+"""
+
+import math
+import random
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+_registry = {}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def jittered(ttl, jitter=None):
+    """TTL 을 최대 jitter 비율만큼 임의로 줄인 값 (기본값: RECOMPUTE_JITTER)"""
+    jitter = _setting('RECOMPUTE_JITTER', 0.1) if jitter is None else jitter
+    return max(1, ttl * (1 - random.uniform(0, jitter)))
+
+
+class _Stats:
+    """이름별 지표 (현재 워커 기준, 스레드 안전)"""
+
+    FIELDS = (
+        'hits', 'misses', 'recomputes', 'early_refreshes', 'stale_hits',
+        'lock_contention', 'lock_waits', 'wait_hits', 'wait_timeouts',
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+        self._compute_seconds = 0.0
+        self._compute_max = 0.0
+
+    def count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def computed(self, seconds):
+        with self._lock:
+            self._counts['recomputes'] += 1
+            self._compute_seconds += seconds
+            self._compute_max = max(self._compute_max, seconds)
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+            recomputes = counts['recomputes']
+            return {
+                **counts,
+                'avg_compute_ms': round(self._compute_seconds * 1000 / recomputes, 2) if recomputes else None,
+                'max_compute_ms': round(self._compute_max * 1000, 2),
+            }
+
+
+def _stats(name):
+    stats = _registry.get(name)
+    if stats is None:
+        stats = _registry.setdefault(name, _Stats())
+    return stats
+
+
+def single_flight(lock_key, compute, poll, name):
+    """
+    잠금을 얻은 호출만 compute() 실행, 나머지는 poll() 결과를 기다림
+
+    Args:
+        lock_key: 공유 캐시 잠금 키
+        compute: 값을 계산하여 저장하고 반환 (인자 없음)
+        poll: 저장된 값 또는 None (인자 없음)
+        name: 지표 이름
+
+    Returns:
+        compute() 또는 poll() 결과
+        (기다리는 중 잠금이 풀렸는데 값이 없으면 잠금을 얻은 호출 1개만 compute())
+    """
+    stats = _stats(name)
+    lock_timeout = _setting('RECOMPUTE_LOCK_TIMEOUT', 30)
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            return compute()
+        finally:
+            cache.delete(lock_key)
+
+    stats.count('lock_contention')
+    stats.count('lock_waits')
+    long_wait = time.monotonic() + _setting('RECOMPUTE_WAIT', 2)
+    interval = 0.02
+    while True:
+        time.sleep(interval)
+        interval = min(interval * 2, 0.2)
+        value = poll()
+        if value is not None:
+            stats.count('wait_hits')
+            return value
+        if long_wait is not None and time.monotonic() >= long_wait:
+            stats.count('wait_timeouts')
+            long_wait = None
+        # 계산 중인 워커가 실패했거나 잠금이 만료됨 → 다음 1개만 계산
+        if cache.add(lock_key, 1, lock_timeout):
+            try:
+                value = poll()
+                return value if value is not None else compute()
+            finally:
+                cache.delete(lock_key)
+
+
+class RecomputeGuard:
+    """
+    재계산 보호 캐시 (이름 단위)
+
+    저장 형식: {'value': 값, 'expires_at': 만료 시각 (epoch), 'delta': 계산 소요 시간 (초)}
+    공유 캐시에는 만료 시각 + RECOMPUTE_STALE_TTL 초 동안 보관
+
+    Args:
+        name: 키 접두어 겸 지표 이름
+        ttl: 값 유지 시간 (초, 분산 적용 전)
+        beta: 조기 갱신 강도 (0 이면 조기 갱신 없음, 기본값: RECOMPUTE_BETA)
+    """
+
+    def __init__(self, name, ttl, beta=None):
+        self.name = name
+        self.ttl = ttl
+        self.beta = beta
+        self.stats = _stats(name)
+
+    def _key(self, key):
+        return f'recompute:{self.name}:{key}'
+
+    def _refresh_early(self, entry, remaining):
+        """XFetch: delta * beta * -ln(U) 가 남은 시간보다 크면 미리 재계산"""
+        beta = _setting('RECOMPUTE_BETA', 1.0) if self.beta is None else self.beta
+        if not beta or not entry['delta']:
+            return False
+        return entry['delta'] * beta * -math.log(1 - random.random()) >= remaining
+
+    def _store(self, full_key, value, delta):
+        ttl = jittered(self.ttl)
+        entry = {'value': value, 'expires_at': time.time() + ttl, 'delta': delta}
+        cache.set(full_key, entry, int(ttl + _setting('RECOMPUTE_STALE_TTL', 60)))
+        return entry
+
+    def _compute(self, full_key, loader):
+        started = time.monotonic()
+        value = loader()
+        delta = time.monotonic() - started
+        self.stats.computed(delta)
+        return self._store(full_key, value, delta)
+
+    def get_or_compute(self, key, loader):
+        """
+        캐시된 값 또는 loader() 결과
+
+        Args:
+            key: 이름 안의 키 (문자열)
+            loader: 값이 없거나 만료되었을 때 호출 (인자 없음)
+        """
+        full_key = self._key(key)
+        lock_key = f'{full_key}:lock'
+        entry = cache.get(full_key)
+
+        if entry is not None:
+            remaining = entry['expires_at'] - time.time()
+            if remaining > 0 and not self._refresh_early(entry, remaining):
+                self.stats.count('hits')
+                return entry['value']
+            if remaining > 0:
+                self.stats.count('early_refreshes')
+            # 다른 워커가 재계산 중이면 이전 값 사용
+            if not cache.add(lock_key, 1, _setting('RECOMPUTE_LOCK_TIMEOUT', 30)):
+                self.stats.count('lock_contention')
+                self.stats.count('stale_hits')
+                return entry['value']
+            try:
+                return self._compute(full_key, loader)['value']
+            finally:
+                cache.delete(lock_key)
+
+        self.stats.count('misses')
+        entry = single_flight(
+            lock_key, lambda: self._compute(full_key, loader), lambda: cache.get(full_key), self.name
+        )
+        return entry['value']
+
+    def peek(self, key):
+        """저장된 값 (만료 여부 무관, 없으면 None)"""
+        entry = cache.get(self._key(key))
+        return entry['value'] if entry is not None else None
+
+    def set(self, key, value):
+        """값 직접 저장 (증분 갱신 등, 이전 계산 소요 시간 유지)"""
+        full_key = self._key(key)
+        previous = cache.get(full_key)
+        self._store(full_key, value, previous['delta'] if previous is not None else 0)
+
+    def delete(self, key):
+        cache.delete(self._key(key))
+
+
+def guarded_cache(name, ttl, key=None, beta=None):
+    """
+    재계산 보호 캐시 데코레이터 (뷰 헬퍼 함수용)
+
+    Args:
+        name: 키 접두어 겸 지표 이름
+        ttl: 값 유지 시간 (초)
+        key: 인자로 키를 만드는 함수 (기본값: 위치/키워드 인자 문자열)
+        beta: 조기 갱신 강도
+
+    decorated.guard 로 RecomputeGuard 에 접근 (예: decorated.guard.delete(key))
+    """
+    guard = RecomputeGuard(name, ttl, beta=beta)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            else:
+                cache_key = ':'.join([*map(str, args), *(f'{k}={v}' for k, v in sorted(kwargs.items()))])
+            return guard.get_or_compute(cache_key or '-', lambda: func(*args, **kwargs))
+        wrapper.guard = guard
+        return wrapper
+    return decorator
+
+
+def metrics():
+    """이름별 재계산 보호 지표 (현재 워커 기준)"""
+    return {name: stats.snapshot() for name, stats in sorted(_registry.items())}
@@ -0,0 +1,615 @@
+"""
+Blog 앱 - 관련 게시글
+====================
+본문/제목/태그/카테고리 TF-IDF 벡터의 코사인 유사도로 관련 게시글 계산
+게시글별 상위 RELATED_POSTS_COUNT 개를 RelatedPost 테이블에 미리 저장하여
+상세 페이지는 (post, rank) 인덱스 조회 1회로 읽음
+
+특징 추출 (PostTerms):
+- 본문: HTML 제거 후 검색과 같은 토큰화 (한글 2-gram, blog.search.tokenize)
+- 제목: 토큰 가중치 TITLE_WEIGHT 배
+- 태그/카테고리: '#tag:ID' / '#category:ID' 특징 (단어 토큰과 겹치지 않음)
+- 게시글당 빈도 상위 MAX_TERMS 개 단어만 저장
+
+벡터 (NumPy):
+- TF = 1 + log(횟수), IDF = log((1 + N) / (1 + df)) + 1, 행 단위 L2 정규화
+- CSR (게시글 → 단어) 와 역색인 CSC (단어 → 게시글) 배열로 보관
+- 한 게시글의 유사도는 공유 단어의 역색인 목록만 합산 (np.bincount)
+
+갱신:
+- 게시글 저장/태그 변경 시 백그라운드에서 update_post()
+  해당 게시글의 이웃을 다시 계산하고, 유사도가 바뀐 다른 게시글의 이웃 목록에 반영
+  다른 게시글 중 확인하는 대상은 이 게시글이 이미 목록에 있거나, 새 유사도가 그 게시글의
+  저장된 최저 유사도 (PostTerms.min_score, 목록이 가득 차지 않았으면 0) 보다 높은 게시글뿐
+  이웃 목록에서 빠진 게시글이 있으면 (유사도 감소, 비공개 전환) 그 목록은 다시 계산하여 채움
+- 증분 갱신은 프로세스별 색인 (RelatedIndex) 사용: 전체 행렬은 처음 한 번만 읽고,
+  이후에는 마지막 동기화 이후 바뀐 PostTerms 행만 읽어 반영 (저장 1회 비용이 전체 게시글 수와 무관)
+  바뀐 게시글이 RELATED_INDEX_MAX_CHANGES 개를 넘거나 RELATED_INDEX_TTL 초가 지나면 전체를 다시 읽음 (IDF 반영)
+- 전체 재계산: python manage.py rebuild_related_posts --processes 4
+  (IDF 변화까지 반영, 행 구간을 여러 프로세스에서 계산, 모든 프로세스의 증분 색인 초기화)
+"""
+
+import logging
+import math
+import secrets
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Post, PostTerms, RelatedPost
+from .search import html_to_text, tokenize
+
+logger = logging.getLogger(__name__)
+
+MAX_TERMS = 200
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 3
+CATEGORY_WEIGHT = 2
+# 전체 게시글의 절반 이상에 나오는 단어는 유사도 계산에서 제외 (게시글 10개 이상일 때)
+MAX_DF_RATIO = 0.5
+MIN_DF_CORPUS = 10
+
+INDEX_VERSION_KEY = 'related:index_version'
+# 다른 워커가 저장 중인 (아직 커밋 전) 단어 빈도를 놓치지 않도록 동기화 구간을 겹침
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def neighbor_count():
+    return getattr(settings, 'RELATED_POSTS_COUNT', 10)
+
+
+# ==================== 특징 추출 ====================
+
+def extract_terms(post, tag_ids=None):
+    """
+    게시글 단어 빈도
+
+    Args:
+        post: Post (content_html, title, category_id 사용)
+        tag_ids: 태그 ID 목록 (생략 시 post.tags 조회)
+
+    Returns:
+        {단어: 횟수} (빈도 상위 MAX_TERMS 개)
+    """
+    counts = Counter(tokenize(html_to_text(post.content_html or post.content)))
+    for token in tokenize(post.title):
+        counts[token] += TITLE_WEIGHT
+    if tag_ids is None:
+        tag_ids = post.tags.values_list('pk', flat=True)
+    for tag_id in tag_ids:
+        counts[f'#tag:{tag_id}'] += TAG_WEIGHT
+    if post.category_id:
+        counts[f'#category:{post.category_id}'] += CATEGORY_WEIGHT
+    return dict(counts.most_common(MAX_TERMS))
+
+
+def _indexable():
+    return Post.objects.filter(published=True, is_draft=False)
+
+
+# ==================== 벡터 ====================
+
+class TermMatrix:
+    """
+    TF-IDF 희소 행렬 (행 = 게시글, 열 = 단어)
+
+    CSR: indptr / indices / data
+    역색인: col_ptr / col_rows / col_data
+    vocabulary: {단어: 열}, idf: 열별 IDF (새 단어 빈도를 같은 기준으로 벡터화할 때 사용)
+    """
+
+    def __init__(self, post_ids, indptr, indices, data, vocabulary, idf):
+        self.post_ids = np.asarray(post_ids, dtype=np.int64)
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.row_of = {int(pk): row for row, pk in enumerate(self.post_ids)}
+        vocabulary_size = len(vocabulary)
+
+        rows = np.repeat(np.arange(len(self.post_ids)), np.diff(indptr))
+        order = np.argsort(indices, kind='stable')
+        self.col_rows = rows[order]
+        self.col_data = data[order]
+        self.col_ptr = np.zeros(vocabulary_size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=vocabulary_size), out=self.col_ptr[1:])
+
+    @classmethod
+    def build(cls, documents):
+        """
+        Args:
+            documents: [(post_id, {단어: 횟수}), ...]
+        """
+        vocabulary = {}
+        doc_terms = []
+        for _, terms in documents:
+            doc_terms.append([
+                (vocabulary.setdefault(term, len(vocabulary)), count)
+                for term, count in terms.items()
+            ])
+
+        n = len(documents)
+        df = np.zeros(len(vocabulary), dtype=np.int64)
+        for terms in doc_terms:
+            df[[column for column, _ in terms]] += 1
+        idf = np.log((1 + n) / (1 + df)) + 1
+        if n >= MIN_DF_CORPUS:
+            idf[df > n * MAX_DF_RATIO] = 0
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indices, data = [], []
+        for row, terms in enumerate(doc_terms):
+            columns = np.fromiter((c for c, _ in terms), dtype=np.int64, count=len(terms))
+            counts = np.fromiter((v for _, v in terms), dtype=np.float64, count=len(terms))
+            weights = (1 + np.log(np.maximum(counts, 1))) * idf[columns]
+            keep = weights > 0
+            columns, weights = columns[keep], weights[keep]
+            norm = math.sqrt(float(weights @ weights))
+            if norm:
+                weights = weights / norm
+            indices.append(columns)
+            data.append(weights)
+            indptr[row + 1] = indptr[row] + len(columns)
+
+        return cls(
+            [post_id for post_id, _ in documents],
+            indptr,
+            np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+            np.concatenate(data) if data else np.zeros(0, dtype=np.float64),
+            vocabulary,
+            idf,
+        )
+
+    def weigh(self, terms):
+        """
+        단어 빈도 → 정규화된 (열, 가중치) (이 행렬의 IDF 기준)
+
+        행렬에 없는 단어는 다른 게시글과 겹치지 않으므로 정규화에만 반영 (df = 1)
+        """
+        unseen_idf = math.log((1 + len(self.post_ids)) / 2) + 1
+        columns, weights = [], []
+        unseen = 0.0
+        for term, count in terms.items():
+            tf = 1 + math.log(max(count, 1))
+            column = self.vocabulary.get(term)
+            if column is None:
+                unseen += (tf * unseen_idf) ** 2
+            elif self.idf[column] > 0:
+                columns.append(column)
+                weights.append(tf * self.idf[column])
+        columns = np.asarray(columns, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        norm = math.sqrt(float(weights @ weights) + unseen)
+        if norm:
+            weights = weights / norm
+        return columns, weights
+
+    def row_vector(self, row):
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def scores(self, columns, weights):
+        """(열, 가중치) 벡터와 모든 행의 코사인 유사도 (공유 단어의 역색인 목록만 합산)"""
+        scores = np.zeros(len(self.post_ids))
+        if len(columns):
+            lengths = self.col_ptr[columns + 1] - self.col_ptr[columns]
+            positions = np.concatenate([
+                np.arange(self.col_ptr[c], self.col_ptr[c + 1]) for c in columns
+            ])
+            scores = np.bincount(
+                self.col_rows[positions],
+                weights=self.col_data[positions] * np.repeat(weights, lengths),
+                minlength=len(self.post_ids),
+            )
+        return scores
+
+    def similarities(self, row):
+        """row 게시글과 모든 게시글의 코사인 유사도 (자기 자신은 0)"""
+        scores = self.scores(*self.row_vector(row))
+        scores[row] = 0
+        return scores
+
+    def top_k(self, row, k):
+        """row 게시글의 유사도 상위 k 개 [(post_id, score), ...]"""
+        scores = self.similarities(row)
+        return _top_k(self.post_ids, scores, k)
+
+
+def _top_k(post_ids, scores, k):
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    candidates = candidates[np.lexsort((post_ids[candidates], -scores[candidates]))]
+    return [(int(post_ids[i]), float(scores[i])) for i in candidates]
+
+
+def load_matrix():
+    """색인된 발행 게시글 전체 TF-IDF 행렬"""
+    documents = list(
+        PostTerms.objects.filter(post__published=True, post__is_draft=False)
+        .order_by('post_id')
+        .values_list('post_id', 'terms')
+    )
+    return TermMatrix.build(documents)
+
+
+def _dot(left, right):
+    columns_left, weights_left = left
+    columns_right, weights_right = right
+    _, i, j = np.intersect1d(columns_left, columns_right, assume_unique=True, return_indices=True)
+    return float(weights_left[i] @ weights_right[j])
+
+
+class RelatedIndex:
+    """
+    증분 갱신용 색인 (프로세스별)
+
+    - matrix: 마지막 전체 로드 시점의 TF-IDF 행렬 (역색인 포함)
+    - changed: 그 이후 바뀐 게시글의 벡터 (matrix 의 IDF 기준), matrix 의 해당 행 대신 사용
+    - removed: 그 이후 색인에서 빠진 게시글
+    - base_min_scores / min_scores: 게시글별 저장된 이웃 최저 유사도 (행렬 행 순서 / 이후 바뀐 값)
+    """
+
+    def __init__(self):
+        self.version = cache.get(INDEX_VERSION_KEY)
+        self.synced_at = timezone.now()
+        self.loaded_at = time.monotonic()
+        self.matrix = load_matrix()
+        stored = dict(PostTerms.objects.filter(post_id__in=self.matrix.row_of).values_list('post_id', 'min_score'))
+        self.base_min_scores = np.fromiter(
+            (stored.get(int(pk), 0.0) for pk in self.matrix.post_ids),
+            dtype=np.float64,
+            count=len(self.matrix.post_ids),
+        )
+        self.min_scores = {}
+        self.changed = {}
+        self.removed = set()
+
+    def is_stale(self):
+        return (
+            len(self.changed) + len(self.removed) > getattr(settings, 'RELATED_INDEX_MAX_CHANGES', 500)
+            or time.monotonic() - self.loaded_at > getattr(settings, 'RELATED_INDEX_TTL', 60 * 60)
+            or cache.get(INDEX_VERSION_KEY) != self.version
+        )
+
+    def sync(self):
+        """마지막 동기화 이후 바뀐 단어 빈도 반영 (다른 워커의 갱신 포함)"""
+        synced_at = timezone.now()
+        rows = PostTerms.objects.filter(
+            updated_at__gte=self.synced_at - SYNC_OVERLAP, post__published=True, post__is_draft=False
+        ).values_list('post_id', 'terms', 'min_score')
+        for post_id, terms, min_score in rows:
+            self.set(post_id, terms)
+            self.min_scores[post_id] = min_score
+        self.synced_at = synced_at
+
+    def set(self, post_id, terms):
+        self.changed[post_id] = self.matrix.weigh(terms)
+        self.removed.discard(post_id)
+
+    def remove(self, post_id):
+        self.changed.pop(post_id, None)
+        self.removed.add(post_id)
+
+    def vector(self, post_id):
+        """게시글 벡터 (색인에 없으면 None)"""
+        if post_id in self.removed:
+            return None
+        if post_id in self.changed:
+            return self.changed[post_id]
+        row = self.matrix.row_of.get(post_id)
+        return self.matrix.row_vector(row) if row is not None else None
+
+    def similarities(self, vector):
+        """
+        벡터와 색인된 게시글의 코사인 유사도
+
+        Returns:
+            (post_ids, scores) 배열
+        """
+        matrix = self.matrix
+        scores = matrix.scores(*vector)
+        hidden = [matrix.row_of[pk] for pk in (*self.changed, *self.removed) if pk in matrix.row_of]
+        scores[hidden] = 0
+        changed_ids = list(self.changed)
+        changed_scores = np.fromiter(
+            (_dot(vector, self.changed[pk]) for pk in changed_ids), dtype=np.float64, count=len(changed_ids)
+        )
+        return (
+            np.concatenate([matrix.post_ids, np.asarray(changed_ids, dtype=np.int64)]),
+            np.concatenate([scores, changed_scores]),
+        )
+
+    def thresholds(self, post_ids):
+        """similarities() 결과 순서의 게시글별 저장된 이웃 최저 유사도"""
+        base_count = len(self.base_min_scores)
+        values = np.zeros(len(post_ids))
+        values[:base_count] = self.base_min_scores
+        if self.min_scores:
+            positions = {int(pk): i for i, pk in enumerate(post_ids[base_count:], base_count)}
+            for pk, score in self.min_scores.items():
+                position = positions.get(pk, self.matrix.row_of.get(pk))
+                if position is not None:
+                    values[position] = score
+        return values
+
+    def neighbors(self, post_id, k):
+        """게시글의 상위 k 개 이웃 [(post_id, score), ...]"""
+        vector = self.vector(post_id)
+        if vector is None:
+            return []
+        post_ids, scores = self.similarities(vector)
+        scores[post_ids == post_id] = 0
+        return self.live_top_k(post_ids, scores, k)
+
+    def live_top_k(self, post_ids, scores, k):
+        """
+        상위 k 개 중 발행 중인 게시글만 (scores 는 제외된 게시글만큼 0 으로 바뀜)
+
+        다른 워커에서 비공개로 바뀐 게시글은 색인에 남아 있을 수 있으므로 발행 여부 확인 후 제외
+        """
+        while True:
+            neighbors = _top_k(post_ids, scores, k)
+            found = {related_id for related_id, _ in neighbors}
+            dead = found - set(_indexable().filter(pk__in=found).values_list('pk', flat=True))
+            if not dead:
+                return neighbors
+            for related_id in dead:
+                self.remove(related_id)
+            scores[np.isin(post_ids, list(dead))] = 0
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _current_index():
+    """프로세스별 색인 (_index_lock 안에서 호출)"""
+    global _index
+    if _index is None or _index.is_stale():
+        _index = RelatedIndex()
+    else:
+        _index.sync()
+    return _index
+
+
+def reset_index():
+    """모든 프로세스의 증분 색인을 다음 갱신 때 다시 읽도록 표시 (전체 재계산 후)"""
+    cache.set(INDEX_VERSION_KEY, secrets.token_hex(6), None)
+
+
+# ==================== 저장 ====================
+
+def build_links(post_id, neighbors):
+    """이웃 목록 → RelatedPost 인스턴스 (순위 순)"""
+    return [
+        RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+        for rank, (related_id, score) in enumerate(neighbors)
+    ]
+
+
+def min_score(neighbors, k):
+    """이웃 목록의 최저 유사도 (가득 차지 않았으면 0, 어떤 유사도든 들어갈 수 있음)"""
+    return neighbors[k - 1][1] if len(neighbors) >= k else 0.0
+
+
+def save_min_scores(min_scores, batch_size=1000):
+    """게시글별 이웃 최저 유사도 저장 ({post_id: score}, 다른 워커 색인이 동기화하도록 갱신일도 변경)"""
+    now = timezone.now()
+    PostTerms.objects.bulk_update(
+        [PostTerms(post_id=post_id, min_score=score, updated_at=now) for post_id, score in min_scores.items()],
+        ['min_score', 'updated_at'],
+        batch_size=batch_size,
+    )
+
+
+def save_neighbors(neighbors_by_post):
+    """
+    게시글별 이웃 목록 교체 ({post_id: [(related_id, score), ...]})
+
+    Returns:
+        {post_id: 최저 유사도}
+    """
+    if not neighbors_by_post:
+        return {}
+    k = neighbor_count()
+    min_scores = {post_id: min_score(neighbors, k) for post_id, neighbors in neighbors_by_post.items()}
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=list(neighbors_by_post)).delete()
+        RelatedPost.objects.bulk_create(
+            [link for post_id, neighbors in neighbors_by_post.items() for link in build_links(post_id, neighbors)],
+            batch_size=2000,
+        )
+        save_min_scores(min_scores)
+    return min_scores
+
+
+def remove_post(post_id):
+    """색인에서 게시글 제거 (비공개/임시저장 전환), 이 게시글이 빠진 이웃 목록은 다시 채움"""
+    holders = set(RelatedPost.objects.filter(related_id=post_id).values_list('post_id', flat=True))
+    with transaction.atomic():
+        PostTerms.objects.filter(post_id=post_id).delete()
+        RelatedPost.objects.filter(post_id=post_id).delete()
+        RelatedPost.objects.filter(related_id=post_id).delete()
+    holders.discard(post_id)
+    if not holders:
+        return
+
+    k = neighbor_count()
+    with _index_lock:
+        index = _current_index()
+        index.remove(post_id)
+        index.min_scores.update(
+            save_neighbors({other_id: index.neighbors(other_id, k) for other_id in holders})
+        )
+
+
+# ==================== 증분 갱신 ====================
+
+def update_post(post_id):
+    """
+    게시글 1개 증분 갱신
+
+    1. 단어 빈도 재계산 (바뀌지 않았으면 종료)
+    2. 이 게시글의 상위 이웃 재계산 (색인에서 공유 단어의 역색인 목록만 합산)
+    3. 다른 게시글의 이웃 목록에 이 게시글 유사도 반영, DB 에서 읽는 대상은
+       - 이미 목록에 이 게시글이 있는 게시글 (related_id 인덱스 조회)
+       - 새 유사도가 저장된 최저 유사도보다 높은 게시글 (색인 안에서 비교)
+       가득 찬 목록에서 이 게시글의 유사도가 낮아지면 그 목록은 다시 계산 (밀려나 있던 게시글로 채움)
+    """
+    post = _indexable().filter(pk=post_id).only(
+        'id', 'title', 'content', 'content_html', 'category_id'
+    ).first()
+    if post is None:
+        remove_post(post_id)
+        return
+
+    terms = extract_terms(post)
+    stored = PostTerms.objects.filter(post_id=post_id).values_list('terms', flat=True).first()
+    if stored == terms:
+        return
+    PostTerms.objects.update_or_create(post_id=post_id, defaults={'terms': terms})
+
+    k = neighbor_count()
+    with _index_lock:
+        index = _current_index()
+        index.set(post_id, terms)
+        post_ids, scores = index.similarities(index.vector(post_id))
+        scores[post_ids == post_id] = 0
+
+        # 이미 이웃 목록에 이 게시글이 있거나, 목록에 새로 들어갈 수 있는 게시글 (발행 중인 것만)
+        holders = set(RelatedPost.objects.filter(related_id=post_id).values_list('post_id', flat=True))
+        entering = scores > index.thresholds(post_ids)
+        affected = {int(pk) for pk in post_ids[entering]} | holders
+        affected.discard(post_id)
+        live = set(_indexable().filter(pk__in=affected).values_list('pk', flat=True))
+        for dead in affected - live:
+            index.remove(dead)
+        mask = np.isin(post_ids, list(live))
+        # 바뀐 게시글은 행렬 행 (0) 뒤에 새 벡터 행이 오므로 뒤의 값이 남음
+        score_of = dict(zip(post_ids[mask].tolist(), scores[mask].tolist()))
+
+        changed = {post_id: index.live_top_k(post_ids, scores, k)}
+
+        current = {}
+        for other_id, related_id, score in RelatedPost.objects.filter(post_id__in=live)\
+                .order_by('post_id', 'rank').values_list('post_id', 'related_id', 'score'):
+            current.setdefault(other_id, []).append((related_id, score))
+
+        for other_id in live:
+            before = current.get(other_id, [])
+            previous = dict(before).get(post_id)
+            score = score_of.get(other_id, 0.0)
+            if previous is not None and len(before) >= k and score < previous:
+                # 목록 밖에서 기다리던 게시글이 들어올 수 있음
+                neighbors = index.neighbors(other_id, k)
+            else:
+                neighbors = [(related_id, s) for related_id, s in before if related_id != post_id]
+                if score > 0:
+                    neighbors.append((post_id, score))
+                neighbors = sorted(neighbors, key=lambda item: (-item[1], item[0]))[:k]
+            if neighbors != before:
+                changed[other_id] = neighbors
+
+        index.min_scores.update(save_neighbors(changed))
+    logger.debug('관련 게시글 갱신 (post=%s, 변경 %d개)', post_id, len(changed))
+
+
+def schedule_update(post_id):
+    """커밋 후 백그라운드에서 증분 갱신"""
+    from . import background
+
+    def run():
+        if getattr(settings, 'RELATED_POSTS_ASYNC', True):
+            background.submit(update_post, post_id, key=('related_posts', post_id))
+        else:
+            update_post(post_id)
+
+    transaction.on_commit(run)
+
+
+# ==================== 전체 재계산 ====================
+
+_worker_matrix = None
+
+
+def _init_worker(matrix):
+    global _worker_matrix
+    _worker_matrix = matrix
+
+
+def _neighbors_for_rows(args):
+    """워커: 행 구간의 상위 이웃"""
+    rows, k = args
+    return [
+        (int(_worker_matrix.post_ids[row]), _worker_matrix.top_k(row, k))
+        for row in rows
+    ]
+
+
+def compute_all_neighbors(matrix, k=None, processes=1, chunk_size=200):
+    """
+    모든 게시글의 상위 이웃 계산
+
+    Args:
+        matrix: TermMatrix
+        k: 이웃 수
+        processes: 프로세스 수 (1 이면 현재 프로세스에서 계산)
+        chunk_size: 작업 단위 행 수
+
+    Yields:
+        (post_id, [(related_id, score), ...])
+    """
+    k = k or neighbor_count()
+    chunks = [
+        (range(start, min(start + chunk_size, len(matrix.post_ids))), k)
+        for start in range(0, len(matrix.post_ids), chunk_size)
+    ]
+    if processes <= 1:
+        _init_worker(matrix)
+        for chunk in chunks:
+            yield from _neighbors_for_rows(chunk)
+        return
+
+    import multiprocessing
+
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(matrix,)) as pool:
+        for result in pool.imap_unordered(_neighbors_for_rows, chunks):
+            yield from result
+
+
+def rebuild_terms(batch_size=500):
+    """발행 게시글 전체 단어 빈도 재계산 (색인 대상이 아닌 게시글은 제거)"""
+    PostTerms.objects.exclude(post__in=_indexable()).delete()
+    queryset = _indexable().only('id', 'title', 'content', 'content_html', 'category_id')\
+        .prefetch_related('tags').order_by('pk')
+
+    count = 0
+    batch = []
+    for post in queryset.iterator(chunk_size=batch_size):
+        terms = extract_terms(post, [tag.pk for tag in post.tags.all()])
+        batch.append(PostTerms(post_id=post.pk, terms=terms))
+        if len(batch) >= batch_size:
+            count += _save_terms(batch)
+            batch = []
+    if batch:
+        count += _save_terms(batch)
+    return count
+
+
+def _save_terms(batch):
+    PostTerms.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=['post'],
+        update_fields=['terms', 'updated_at'],
+    )
+    return len(batch)
@@ -0,0 +1,176 @@
+"""
+Blog 앱 - 본문 렌더링
+====================
+게시글 저장 시 본문을 한 번만 가공하여 저장
+요청마다 content|safe, striptags, JS 목차 생성을 반복하지 않음
+
+저장 결과 (Post 필드):
+- content_html: 허용 태그/속성만 남긴 본문 HTML (제목 태그에 앵커 id 부여)
+- excerpt: 본문 앞부분 일반 텍스트 (목록/메타 설명용)
+- word_count: 단어 수 (공백 기준)
+- reading_time: 예상 읽기 시간 (분, 최소 1)
+- toc: 목차 [{'level': 2, 'text': '소개', 'anchor': 'heading-소개'}, ...]
+
+앵커 id 는 제목 텍스트로 만들어 본문이 수정되어도 같은 제목이면 유지됨
+"""
+
+import math
+import re
+
+import bleach
+from django.utils.text import Truncator, slugify
+
+from .search import html_to_text
+
+try:
+    from bleach.css_sanitizer import CSSSanitizer
+except ImportError:  # tinycss2 미설치 시 style 속성 제거
+    CSSSanitizer = None
+
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 225
+TOC_LEVELS = (2, 3)
+
+ALLOWED_TAGS = {
+    'p', 'br', 'hr', 'div', 'span', 'font',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'strong', 'b', 'em', 'i', 'u', 's', 'strike', 'del', 'ins',
+    'sub', 'sup', 'small', 'mark',
+    'blockquote', 'pre', 'code',
+    'ul', 'ol', 'li',
+    'a', 'img', 'figure', 'figcaption', 'iframe',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'caption', 'colgroup', 'col',
+}
+
+ALLOWED_PROTOCOLS = {'http', 'https', 'mailto', 'data'}
+
+# 동영상 삽입 허용 도메인 (Summernote 동영상 버튼)
+IFRAME_SOURCES = (
+    'https://www.youtube.com/embed/',
+    'https://www.youtube-nocookie.com/embed/',
+    'https://player.vimeo.com/video/',
+)
+
+ALLOWED_CSS_PROPERTIES = {
+    'color', 'background-color', 'font-size', 'font-weight', 'font-style', 'font-family',
+    'text-align', 'text-decoration', 'line-height', 'width', 'height', 'float',
+    'margin', 'margin-left', 'margin-right', 'padding',
+}
+
+HEADING_RE = re.compile(r'<h([1-6])([^>]*)>(.*?)</h\1>', re.IGNORECASE | re.DOTALL)
+
+
+def _filter_link(tag, name, value):
+    if name in ('title', 'target', 'rel'):
+        return True
+    # data: URI 링크 차단 (이미지에서만 허용)
+    return name == 'href' and not value.strip().lower().startswith('data:')
+
+
+def _filter_image(tag, name, value):
+    if name in ('alt', 'title', 'width', 'height'):
+        return True
+    if name == 'src':
+        return not value.startswith('data:') or value.startswith('data:image/')
+    return False
+
+
+def _filter_iframe(tag, name, value):
+    if name in ('width', 'height', 'frameborder', 'allowfullscreen'):
+        return True
+    return name == 'src' and value.startswith(IFRAME_SOURCES)
+
+
+ALLOWED_ATTRIBUTES = {
+    '*': ['class', 'style'],
+    'a': _filter_link,
+    'img': _filter_image,
+    'iframe': _filter_iframe,
+    'font': ['color', 'face', 'size'],
+    'ol': ['start', 'type'],
+    'td': ['colspan', 'rowspan'],
+    'th': ['colspan', 'rowspan'],
+    'col': ['span'],
+}
+
+
+def _build_cleaner():
+    attributes = ALLOWED_ATTRIBUTES
+    css_sanitizer = None
+    if CSSSanitizer is not None:
+        css_sanitizer = CSSSanitizer(allowed_css_properties=ALLOWED_CSS_PROPERTIES)
+    else:
+        attributes = {
+            tag: [a for a in allowed if a != 'style'] if isinstance(allowed, list) else allowed
+            for tag, allowed in ALLOWED_ATTRIBUTES.items()
+        }
+    return bleach.Cleaner(
+        tags=ALLOWED_TAGS,
+        attributes=attributes,
+        protocols=ALLOWED_PROTOCOLS,
+        css_sanitizer=css_sanitizer,
+        strip=True,
+        strip_comments=True,
+    )
+
+
+_cleaner = _build_cleaner()
+
+
+def sanitize(content):
+    """허용 태그/속성만 남긴 HTML"""
+    return _cleaner.clean(content or '')
+
+
+def add_heading_anchors(content_html):
+    """
+    제목 태그에 앵커 id 부여 후 목차 생성
+
+    Returns:
+        (앵커가 추가된 HTML, 목차 리스트)
+    """
+    toc = []
+    used = set()
+
+    def replace(match):
+        level = int(match.group(1))
+        attrs, inner = match.group(2), match.group(3)
+        text = html_to_text(inner)
+        base = f"heading-{slugify(text, allow_unicode=True) or 'section'}"
+        anchor = base
+        suffix = 2
+        while anchor in used:
+            anchor = f'{base}-{suffix}'
+            suffix += 1
+        used.add(anchor)
+        if level in TOC_LEVELS and text:
+            toc.append({'level': level, 'text': text, 'anchor': anchor})
+        return f'<h{level} id="{anchor}"{attrs}>{inner}</h{level}>'
+
+    return HEADING_RE.sub(replace, content_html), toc
+
+
+def render_content(content):
+    """
+    본문 가공
+
+    Returns:
+        Post 렌더링 필드 딕셔너리
+        (content_html, excerpt, word_count, reading_time, toc)
+    """
+    content_html, toc = add_heading_anchors(sanitize(content))
+    text = html_to_text(content_html)
+    word_count = len(text.split())
+    return {
+        'content_html': content_html,
+        'excerpt': Truncator(text).chars(EXCERPT_LENGTH),
+        'word_count': word_count,
+        'reading_time': max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+        'toc': toc,
+    }
+
+
+def render_post(post):
+    """게시글 인스턴스에 렌더링 결과 반영 (저장은 호출자가 수행)"""
+    for field, value in render_content(post.content).items():
+        setattr(post, field, value)
@@ -0,0 +1,232 @@
+"""
+Blog 앱 - 검색
+==============
+게시글 전문 검색 (PostgreSQL tsvector + GIN 인덱스)
+
+색인:
+- Post.search_document: HTML 제거 후 토큰화한 제목/작성자/본문 (모든 DB 공통)
+- Post.search_vector: search_document 기반 tsvector (PostgreSQL 전용, GIN 인덱스)
+  제목은 가중치 A, 작성자/본문은 가중치 B
+
+한국어 토큰화:
+- 형태소 분석 없이 한글 구간을 2-gram 으로 분해 ("장고블로그" → 장고 고블 블로 로그)
+- 검색어도 같은 방식으로 분해하여 모든 토큰이 포함된 게시글만 검색 (AND)
+- PostgreSQL 에서는 접두사 매칭(:*)으로 한 글자 검색어도 지원
+
+검색 백엔드:
+- PostgreSQL: search_vector @@ to_tsquery, ts_rank 순위
+- 그 외 (SQLite 등 로컬 테스트): search_document 부분 일치, 제목 일치 가중 순위
+
+사용 예:
+    queryset = search_posts(Post.objects.filter(published=True), '장고 검색')
+    posts = attach_snippets(list(queryset[:10]), '장고 검색')
+"""
+
+import html
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+# 한글 음절 범위
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^가-힣]+')
+HANGUL_RE = re.compile(r'[가-힣]')
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+SEARCH_CONFIG = 'simple'
+SNIPPET_LENGTH = 160
+
+
+# ==================== 텍스트 처리 ====================
+
+def html_to_text(value):
+    """HTML 태그 제거 및 엔티티 복원"""
+    if not value:
+        return ''
+    # 블록 태그 경계에서 단어가 붙지 않도록 태그 앞에 공백 삽입
+    text = html.unescape(strip_tags(value.replace('<', ' <')))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def tokenize(text):
+    """
+    검색용 토큰 분리
+
+    - 소문자화 후 단어 단위 분리
+    - 한글 구간은 2-gram (한 글자 구간은 그대로)
+    - 그 외 구간은 단어 그대로
+    """
+    tokens = []
+    for word in WORD_RE.findall((text or '').lower()):
+        if not HANGUL_RE.search(word):
+            tokens.append(word)
+            continue
+        for run in HANGUL_RUN_RE.findall(word):
+            if not HANGUL_RE.match(run):
+                tokens.append(run)
+            elif len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _query_tokens(query):
+    """검색어 토큰 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(tokenize(query)))
+
+
+# ==================== 색인 ====================
+
+def build_title_document(post):
+    return ' '.join(tokenize(post.title))
+
+
+def build_body_document(post):
+    author = post.author.username if post.author_id else ''
+    return ' '.join(tokenize(f'{author} {html_to_text(post.content)}'))
+
+
+def build_search_document(post):
+    """게시글 검색 문서 (제목 토큰 + 작성자/본문 토큰)"""
+    return f'{build_title_document(post)} {build_body_document(post)}'.strip()
+
+
+def is_postgres(using='default'):
+    return connections[using].vendor == 'postgresql'
+
+
+def update_search_vector(post, using='default'):
+    """
+    tsvector 갱신 (PostgreSQL 전용)
+
+    제목 토큰은 가중치 A, 작성자/본문 토큰은 가중치 B
+    """
+    from .models import Post
+
+    if not is_postgres(using):
+        return
+    Post.objects.using(using).filter(pk=post.pk).update(
+        search_vector=(
+            SearchVector(Value(build_title_document(post)), weight='A', config=SEARCH_CONFIG)
+            + SearchVector(Value(build_body_document(post)), weight='B', config=SEARCH_CONFIG)
+        )
+    )
+
+
+def reindex_post(post, using='default'):
+    """게시글 하나 재색인 (search_document + search_vector)"""
+    from .models import Post
+
+    post.search_document = build_search_document(post)
+    Post.objects.using(using).filter(pk=post.pk).update(search_document=post.search_document)
+    update_search_vector(post, using=using)
+
+
+# ==================== 검색 ====================
+
+def search_posts(queryset, query):
+    """
+    게시글 검색
+
+    Args:
+        queryset: Post 쿼리셋
+        query: 검색어
+
+    Returns:
+        검색 결과 쿼리셋 (search_rank 주석 포함, 정렬은 호출자가 결정)
+    """
+    tokens = _query_tokens(query)
+    if not tokens:
+        return queryset.none()
+
+    if is_postgres(queryset.db):
+        raw = ' & '.join(f'{token}:*' for token in tokens)
+        search_query = SearchQuery(raw, config=SEARCH_CONFIG, search_type='raw')
+        return queryset.filter(search_vector=search_query).annotate(
+            search_rank=SearchRank(F('search_vector'), search_query)
+        )
+
+    # 폴백: 토큰 부분 일치 (AND), 제목에 포함된 토큰마다 가중
+    condition = Q()
+    for token in tokens:
+        condition &= Q(search_document__icontains=token)
+    rank = Value(0.0, output_field=FloatField())
+    for token in tokens:
+        rank = rank + Case(
+            When(title__icontains=token, then=Value(1.0)),
+            default=Value(0.1),
+            output_field=FloatField(),
+        )
+    return queryset.filter(condition).annotate(search_rank=rank)
+
+
+def order_by_rank(queryset):
+    """검색 순위순 정렬 (동점은 최신순)"""
+    return queryset.order_by('-search_rank', '-created_at', '-id')
+
+
+# ==================== 스니펫 ====================
+
+def _highlight_terms(query):
+    """하이라이트 대상 (검색어 원문 단어 + 토큰, 긴 것부터)"""
+    words = WORD_RE.findall((query or '').lower())
+    terms = set(words) | set(_query_tokens(query))
+    return sorted((t for t in terms if t), key=len, reverse=True)
+
+
+def highlight(text, query, length=SNIPPET_LENGTH):
+    """
+    검색어 주변 본문 발췌 후 <mark> 하이라이트
+
+    Args:
+        text: 일반 텍스트 (HTML 제거된 본문)
+        query: 검색어
+        length: 발췌 길이
+
+    Returns:
+        안전한 HTML 문자열
+    """
+    text = text or ''
+    terms = _highlight_terms(query)
+    if not terms:
+        return escape(text[:length])
+
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    positions = [p for p in positions if p >= 0]
+    start = max(min(positions) - length // 4, 0) if positions else 0
+    snippet = text[start:start + length]
+
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    parts = []
+    last = 0
+    for match in pattern.finditer(snippet):
+        parts.append(escape(snippet[last:match.start()]))
+        parts.append(f'<mark>{escape(match.group(0))}</mark>')
+        last = match.end()
+    parts.append(escape(snippet[last:]))
+
+    prefix = '… ' if start > 0 else ''
+    suffix = ' …' if start + length < len(text) else ''
+    return mark_safe(prefix + ''.join(parts) + suffix)
+
+
+def attach_snippets(posts, query):
+    """
+    게시글 목록에 search_snippet 속성 추가
+
+    목록 쿼리셋이 본문을 제외했으면 (PostQuerySet.for_list) 현재 페이지 게시글의 본문만 한 번에 조회
+    """
+    from .models import Post
+
+    deferred = [post.pk for post in posts if 'content' in post.get_deferred_fields()]
+    contents = dict(Post.objects.filter(pk__in=deferred).values_list('pk', 'content')) if deferred else {}
+    for post in posts:
+        content = contents[post.pk] if post.pk in contents else post.content
+        post.search_snippet = highlight(html_to_text(content), query)
+    return posts
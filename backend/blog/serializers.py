@@ -5,8 +5,11 @@ DRF 시리얼라이저 정의
 REST API를 통한 블로그 데이터 직렬화
 """
 
+from django.db import transaction
 from rest_framework import serializers
 from .models import Category, Post, Comment
+from .counters import adjust_post_counters
+from .comments import load_comment_tree
 from accounts.serializers import UserSerializer
 
 
@@ -14,17 +17,13 @@ class CategorySerializer(serializers.ModelSerializer):
     """
     카테고리 시리얼라이저
     
-    게시글 수 포함
+    게시글 수 포함 (비정규화 컬럼)
     """
-    post_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Category
         fields = ['id', 'name', 'slug', 'description', 'post_count', 'created_at']
-        read_only_fields = ['id', 'slug', 'created_at']
-    
-    def get_post_count(self, obj):
-        return obj.get_post_count()
+        read_only_fields = ['id', 'slug', 'post_count', 'created_at']
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -46,9 +45,11 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'author', 'created_at', 'updated_at']
     
     def get_replies(self, obj):
-        """대댓글 목록"""
-        if obj.parent is None:  # 부모 댓글인 경우만
-            replies = obj.replies.filter(is_active=True)
+        """대댓글 목록 (댓글 트리로 읽은 경우 추가 조회 없음)"""
+        if obj.parent_id is None:  # 부모 댓글인 경우만
+            replies = getattr(obj, 'reply_list', None)
+            if replies is None:
+                replies = obj.replies.filter(is_active=True).select_related('author')
             return CommentSerializer(replies, many=True).data
         return []
 
@@ -66,7 +67,36 @@ class CommentCreateSerializer(serializers.ModelSerializer):
         # request에서 author와 post 설정
         validated_data['author'] = self.context['request'].user
         validated_data['post'] = self.context['post']
-        return super().create(validated_data)
+        with transaction.atomic():
+            comment = super().create(validated_data)
+            adjust_post_counters(comment.post_id, comment_count=1)
+        return comment
+
+
+class ThumbnailImageField(serializers.Field):
+    """
+    썸네일 파생 이미지 (blog.thumbnails)
+    
+    {"src", "width", "height", "variants": [{"format", "width", "height", "url"}]}
+    파생 이미지가 아직 없으면 src 는 원본, variants 는 빈 목록
+    """
+    
+    def __init__(self, **kwargs):
+        kwargs.update(source='*', read_only=True)
+        super().__init__(**kwargs)
+    
+    def to_representation(self, post):
+        image = post.thumbnail_image
+        if image is None:
+            return None
+        request = self.context.get('request')
+        absolute = request.build_absolute_uri if request is not None else str
+        return {
+            'src': absolute(image.src),
+            'width': image.width,
+            'height': image.height,
+            'variants': [{**variant, 'url': absolute(variant['url'])} for variant in image.variants],
+        }
 
 
 class PostListSerializer(serializers.ModelSerializer):
@@ -77,18 +107,17 @@ class PostListSerializer(serializers.ModelSerializer):
     """
     author = UserSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
-    comment_count = serializers.SerializerMethodField()
+    thumbnail_image = ThumbnailImageField()
     
     class Meta:
         model = Post
         fields = [
             'id', 'title', 'slug', 'author', 'category',
-            'thumbnail', 'published', 'views',
-            'created_at', 'updated_at', 'comment_count'
+            'thumbnail', 'thumbnail_image', 'published', 'views',
+            'created_at', 'updated_at', 'comment_count',
+            'likes_count', 'dislikes_count', 'bookmark_count',
+            'excerpt', 'reading_time'
         ]
-    
-    def get_comment_count(self, obj):
-        return obj.get_comment_count()
 
 
 class PostDetailSerializer(serializers.ModelSerializer):
@@ -99,26 +128,24 @@ class PostDetailSerializer(serializers.ModelSerializer):
     """
     author = UserSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
+    thumbnail_image = ThumbnailImageField()
     comments = serializers.SerializerMethodField()
     related_posts = serializers.SerializerMethodField()
-    comment_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Post
         fields = [
-            'id', 'title', 'slug', 'content', 'author', 'category',
-            'thumbnail', 'published', 'views',
+            'id', 'title', 'slug', 'content', 'content_html', 'author', 'category',
+            'thumbnail', 'thumbnail_image', 'published', 'views',
             'created_at', 'updated_at',
-            'comments', 'comment_count', 'related_posts'
+            'comments', 'comment_count', 'related_posts',
+            'likes_count', 'dislikes_count', 'bookmark_count',
+            'excerpt', 'word_count', 'reading_time', 'toc'
         ]
     
     def get_comments(self, obj):
-        """활성 댓글만 (부모 댓글만)"""
-        comments = obj.comments.filter(is_active=True, parent__isnull=True)
-        return CommentSerializer(comments, many=True).data
-    
-    def get_comment_count(self, obj):
-        return obj.get_comment_count()
+        """활성 댓글 트리 (부모 댓글 + 대댓글)"""
+        return CommentSerializer(load_comment_tree(obj).roots, many=True).data
     
     def get_related_posts(self, obj):
         """관련 게시글 요약"""
@@ -0,0 +1,430 @@
+"""
+Blog 앱 - 시그널
+================
+모델 변경 시 파생 데이터(캐시 등) 갱신
+
+- 인기 게시글 리더보드: 게시글 비공개/삭제/수정 시 무효화
+- 좋아요/싫어요: 게시글/댓글 삭제 시 해당 Reaction 정리 (FK 가 아니므로 CASCADE 없음)
+- 새 게시글 알림: 게시글이 처음 발행되면 팔로워 알림/피드 발송 예약 (accounts.notifications)
+- 팔로잉 피드: 게시글 비공개 전환 시 피드에서 삭제, 다시 발행 시 피드에 복원 (알림은 1회만)
+- 관련 게시글: 게시글 제목/본문/카테고리/발행 상태/태그 변경 시 색인 증분 갱신 (blog.related)
+- 카테고리/태그/시리즈 게시글 수: 발행 상태, 카테고리/시리즈, 태그 변경 및 삭제 시 증감
+- 사이트 통계: 게시글/댓글 생성, 삭제, 발행/활성 상태 변경 시 증감 (blog.site_stats)
+- 게시글 활동 통계: 댓글 작성/삭제, 북마크 추가/취소 기록 (blog.analytics)
+- 썸네일: 썸네일 변경 시 파생 이미지 생성 예약, 게시글 삭제 시 파생 이미지 삭제 (blog.thumbnails)
+- 캐시 의존성 태그: 게시글/댓글/카테고리/태그/시리즈/북마크 변경 시 관련 태그 갱신 (blog.cache_tags)
+- 카테고리/태그/시리즈 조회 캐시: 저장/삭제 시 커밋 후 무효화 (blog.taxonomy)
+"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver
+
+from accounts.notifications import schedule_new_post_fanout
+
+from . import leaderboard, related, site_stats, taxonomy, thumbnails, timeline
+from .analytics import record_activity
+from .counters import adjust_taxonomy_counts
+from .models import Post, Comment, Bookmark, Reaction, Category, Tag, PostSeries
+from .cache_tags import invalidate_tags
+
+
+# 리더보드와 무관한 필드만 저장된 경우 (카운터 등) 무시
+LEADERBOARD_IGNORED_FIELDS = {'views', 'draft_saved_at', *Post.COUNTER_FIELDS}
+
+# 관련 게시글 색인에 영향을 주는 필드
+RELATED_SOURCE_FIELDS = {'title', 'content', 'category', 'published', 'is_draft'}
+
+
+@receiver(post_save, sender=Post)
+def invalidate_leaderboard_on_save(sender, instance, update_fields=None, **kwargs):
+    """게시글 저장 시 리더보드 무효화"""
+    if update_fields and set(update_fields) <= LEADERBOARD_IGNORED_FIELDS:
+        return
+    before = getattr(instance, '_taxonomy_before', None)
+    previous_category_id = before['category_id'] if before is not None else None
+    if leaderboard.affects(instance, previous_category_id):
+        leaderboard.invalidate()
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_leaderboard_on_delete(sender, instance, **kwargs):
+    """게시글 삭제 시 리더보드 무효화"""
+    if leaderboard.affects(instance):
+        leaderboard.invalidate()
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Comment)
+def delete_reactions(sender, instance, **kwargs):
+    """삭제된 게시글/댓글의 좋아요/싫어요 삭제"""
+    Reaction.objects.filter(
+        target_type=Reaction.target_type_for(sender), target_id=instance.pk
+    ).delete()
+
+
+@receiver(post_save, sender=Post)
+def schedule_new_post_notifications(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    게시글 발행 시 팔로워 알림 발송 예약 (게시글당 1회)
+
+    이미 발송된 게시글이 비공개 → 발행으로 바뀌면 알림 없이 팔로워 피드만 복원
+    (비공개 전환 시 remove_unpublished_from_timelines 가 피드 항목을 삭제함)
+    """
+    if raw or not instance.published:
+        return
+    if update_fields is not None and 'published' not in update_fields:
+        return
+    if schedule_new_post_fanout(instance) is not None:
+        return
+    before = getattr(instance, '_taxonomy_before', None)
+    if before is not None and not before['published']:
+        post_id = instance.pk
+        transaction.on_commit(lambda: timeline.schedule_restore(post_id))
+
+
+@receiver(post_save, sender=Post)
+def remove_unpublished_from_timelines(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """비공개 전환 시 팔로잉 피드에서 삭제"""
+    if raw or created or instance.published:
+        return
+    if update_fields is not None and 'published' not in update_fields:
+        return
+    timeline.remove_post(instance.pk)
+
+
+@receiver(post_save, sender=Post)
+def update_related_posts(sender, instance, raw=False, update_fields=None, **kwargs):
+    """관련 게시글 색인 증분 갱신 (커밋 후 백그라운드)"""
+    if raw:
+        return
+    if update_fields is not None and not RELATED_SOURCE_FIELDS & set(update_fields):
+        return
+    related.schedule_update(instance.pk)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_related_posts_on_tags(sender, instance, action, reverse, pk_set=None, **kwargs):
+    """태그 변경 시 관련 게시글 색인 증분 갱신"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    post_ids = (pk_set or ()) if reverse else [instance.pk]
+    for post_id in post_ids:
+        related.schedule_update(post_id)
+
+
+# ==================== 카테고리/태그/시리즈 게시글 수 ====================
+
+TAXONOMY_FIELDS = {'published', 'category', 'series'}
+
+
+def _taxonomy_state(published, category_id, series_id):
+    return {'published': published, 'category_id': category_id, 'series_id': series_id}
+
+
+@receiver(pre_save, sender=Post)
+def remember_taxonomy_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """저장 전 발행 상태/카테고리/시리즈 기억"""
+    instance._taxonomy_before = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not TAXONOMY_FIELDS & set(update_fields):
+        return
+    before = Post.objects.filter(pk=instance.pk)\
+        .values_list('published', 'category_id', 'series_id').first()
+    if before is not None:
+        instance._taxonomy_before = _taxonomy_state(*before)
+
+
+@receiver(post_save, sender=Post)
+def update_taxonomy_counts(sender, instance, created, raw=False, **kwargs):
+    """발행 상태/카테고리/시리즈 변경분만큼 게시글 수 증감"""
+    if raw:
+        return
+    before = getattr(instance, '_taxonomy_before', None)
+    if before is None and not created:
+        return
+    if before is None:
+        before = _taxonomy_state(False, None, None)
+    after = _taxonomy_state(instance.published, instance.category_id, instance.series_id)
+    if before == after:
+        return
+
+    if before['published']:
+        adjust_taxonomy_counts(-1, category_ids=[before['category_id']], series_ids=[before['series_id']])
+    if after['published']:
+        adjust_taxonomy_counts(1, category_ids=[after['category_id']], series_ids=[after['series_id']])
+
+    if before['published'] != after['published'] and not created:
+        tag_ids = list(instance.tags.values_list('pk', flat=True))
+        adjust_taxonomy_counts(1 if after['published'] else -1, tag_ids=tag_ids)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post_tags(sender, instance, **kwargs):
+    """삭제 전 태그 기억 (태그 연결은 게시글보다 먼저 삭제됨)"""
+    if instance.published:
+        instance._deleted_tag_ids = list(instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Post)
+def decrease_taxonomy_counts(sender, instance, **kwargs):
+    """발행 게시글 삭제 시 게시글 수 감소"""
+    if not instance.published:
+        return
+    adjust_taxonomy_counts(
+        -1,
+        category_ids=[instance.category_id],
+        series_ids=[instance.series_id],
+        tag_ids=getattr(instance, '_deleted_tag_ids', ()),
+    )
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_tag_counts(sender, instance, action, reverse, pk_set=None, **kwargs):
+    """
+    태그 연결/해제 시 태그 게시글 수 증감
+
+    post_add 의 pk_set 은 새로 연결된 ID 만 포함하지만
+    remove/clear 는 실제로 연결되어 있던 ID 를 pre_ 단계에서 조회
+    """
+    through = Post.tags.through
+    if reverse:
+        # tag.posts.add(...) : instance = Tag, pk_set = 게시글 ID
+        if action in ('pre_remove', 'pre_clear'):
+            links = through.objects.filter(tag_id=instance.pk, post__published=True)
+            if action == 'pre_remove':
+                links = links.filter(post_id__in=pk_set)
+            instance._removed_post_count = links.count()
+        elif action == 'post_add':
+            count = Post.objects.filter(pk__in=pk_set, published=True).count()
+            adjust_taxonomy_counts(count, tag_ids=[instance.pk])
+        elif action in ('post_remove', 'post_clear'):
+            adjust_taxonomy_counts(-getattr(instance, '_removed_post_count', 0), tag_ids=[instance.pk])
+        return
+
+    # post.tags.add(...) : instance = Post, pk_set = 태그 ID
+    if not instance.published:
+        return
+    if action in ('pre_remove', 'pre_clear'):
+        links = through.objects.filter(post_id=instance.pk)
+        if action == 'pre_remove':
+            links = links.filter(tag_id__in=pk_set)
+        instance._removed_tag_ids = list(links.values_list('tag_id', flat=True))
+    elif action == 'post_add':
+        adjust_taxonomy_counts(1, tag_ids=pk_set)
+    elif action in ('post_remove', 'post_clear'):
+        adjust_taxonomy_counts(-1, tag_ids=getattr(instance, '_removed_tag_ids', ()))
+
+
+# ==================== 사이트 통계 ====================
+
+@receiver(post_save, sender=Post)
+def count_post(sender, instance, created, raw=False, **kwargs):
+    """게시글 생성/발행 상태 변경 시 사이트 통계 증감"""
+    if raw:
+        return
+    if created:
+        site_stats.adjust(posts=1, published_posts=1 if instance.published else 0)
+        return
+    # 발행 상태는 카테고리/태그 게시글 수 시그널에서 저장 전 값을 기억
+    before = getattr(instance, '_taxonomy_before', None)
+    if before is not None and before['published'] != instance.published:
+        site_stats.adjust(published_posts=1 if instance.published else -1)
+
+
+@receiver(post_delete, sender=Post)
+def uncount_post(sender, instance, **kwargs):
+    """게시글 삭제 시 사이트 통계 감소"""
+    site_stats.adjust(posts=-1, published_posts=-1 if instance.published else 0)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """저장 전 댓글 활성 상태 기억"""
+    instance._was_active = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and 'is_active' not in update_fields:
+        return
+    instance._was_active = Comment.objects.filter(pk=instance.pk)\
+        .values_list('is_active', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def count_comment(sender, instance, created, raw=False, **kwargs):
+    """댓글 생성/활성 상태 변경 시 활성 댓글 수 증감"""
+    if raw:
+        return
+    was_active = False if created else getattr(instance, '_was_active', None)
+    if was_active is None or was_active == instance.is_active:
+        return
+    site_stats.adjust(active_comments=1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=Comment)
+def uncount_comment(sender, instance, **kwargs):
+    """활성 댓글 삭제 시 활성 댓글 수 감소"""
+    if instance.is_active:
+        site_stats.adjust(active_comments=-1)
+
+
+# ==================== 게시글 활동 통계 ====================
+
+@receiver(post_save, sender=Comment)
+def record_comment_activity(sender, instance, created, raw=False, **kwargs):
+    """댓글 작성/활성 상태 변경 기록"""
+    if raw:
+        return
+    was_active = False if created else getattr(instance, '_was_active', None)
+    if was_active is None or was_active == instance.is_active:
+        return
+    record_activity(instance.post_id, comments=1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=Comment)
+def record_comment_removal(sender, instance, **kwargs):
+    """활성 댓글 삭제 기록"""
+    if instance.is_active:
+        record_activity(instance.post_id, comments=-1)
+
+
+@receiver(post_save, sender=Bookmark)
+def record_bookmark_activity(sender, instance, created, raw=False, **kwargs):
+    """북마크 추가 기록"""
+    if created and not raw:
+        record_activity(instance.post_id, bookmarks=1)
+
+
+@receiver(post_delete, sender=Bookmark)
+def record_bookmark_removal(sender, instance, **kwargs):
+    """북마크 취소 기록"""
+    record_activity(instance.post_id, bookmarks=-1)
+
+
+# ==================== 썸네일 ====================
+
+@receiver(post_save, sender=Post)
+def generate_thumbnail_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    """썸네일이 바뀌었으면 커밋 후 파생 이미지 생성"""
+    if raw or not instance.thumbnail:
+        return
+    if update_fields is not None and 'thumbnail' not in update_fields:
+        return
+    if (instance.thumbnail_variants or {}).get('source') == instance.thumbnail.name:
+        return
+    post_id = instance.pk
+    transaction.on_commit(lambda: thumbnails.schedule(post_id))
+
+
+@receiver(post_delete, sender=Post)
+def delete_thumbnail_variants(sender, instance, **kwargs):
+    """게시글 삭제 시 파생 이미지 파일 삭제 (커밋 후)"""
+    if instance.thumbnail_variants:
+        transaction.on_commit(lambda: thumbnails.delete_variants(instance))
+
+
+# ==================== 캐시 의존성 태그 ====================
+
+CACHE_TAG_IGNORED_FIELDS = LEADERBOARD_IGNORED_FIELDS | {'post_count'}
+
+CACHE_TAG_NAMES = {Category: 'category', Tag: 'tag', PostSeries: 'series'}
+
+
+def _counters_only(update_fields):
+    """카운터/조회수만 저장된 경우 (표시 내용 변경 없음, 캐시 TTL 로 갱신)"""
+    return bool(update_fields) and set(update_fields) <= CACHE_TAG_IGNORED_FIELDS
+
+
+def _post_cache_tags(post, tag_ids=None):
+    """게시글이 표시되는 페이지의 태그 (상세, 전체/작성자/카테고리/시리즈/태그별 게시글 목록)"""
+    before = getattr(post, '_taxonomy_before', None) or {}
+    if tag_ids is None:
+        tag_ids = post.tags.values_list('pk', flat=True) if post.pk else ()
+    return [
+        f'post:{post.pk}', 'post:list', f'user:{post.author_id}:posts',
+        f'category:{post.category_id}:posts', f'category:{before.get("category_id")}:posts',
+        f'series:{post.series_id}:posts', f'series:{before.get("series_id")}:posts',
+        *(f'tag:{pk}:posts' for pk in tag_ids),
+    ]
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post_cache_tags(sender, instance, raw=False, update_fields=None, **kwargs):
+    """게시글 저장 시 관련 페이지 태그 갱신"""
+    if raw or _counters_only(update_fields):
+        return
+    invalidate_tags(*_post_cache_tags(instance))
+
+
+@receiver(pre_delete, sender=Post)
+def remember_post_cache_tags(sender, instance, **kwargs):
+    """삭제 전 관련 페이지 태그 기억 (태그 연결은 게시글보다 먼저 삭제됨)"""
+    instance._cache_tags = _post_cache_tags(instance)
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_deleted_post_cache_tags(sender, instance, **kwargs):
+    invalidate_tags(*getattr(instance, '_cache_tags', ()))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_cache_tags(sender, instance, raw=False, update_fields=None, **kwargs):
+    """댓글 변경 시 게시글 상세 태그 갱신"""
+    if raw or _counters_only(update_fields):
+        return
+    invalidate_tags(f'post:{instance.post_id}')
+
+
+@receiver(post_save, sender=Bookmark)
+@receiver(post_delete, sender=Bookmark)
+def invalidate_bookmark_cache_tags(sender, instance, raw=False, **kwargs):
+    """북마크 변경 시 게시글/사용자 태그 갱신"""
+    if not raw:
+        invalidate_tags(f'post:{instance.post_id}', f'user:{instance.user_id}')
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=PostSeries)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=PostSeries)
+def invalidate_taxonomy_cache_tags(sender, instance, raw=False, update_fields=None, **kwargs):
+    """카테고리/태그/시리즈 변경 시 해당 페이지와 전체 목록 태그 갱신"""
+    if raw or _counters_only(update_fields):
+        return
+    name = CACHE_TAG_NAMES[sender]
+    invalidate_tags(f'{name}:{instance.pk}', f'{name}:list')
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_tag_link_cache_tags(sender, instance, action, reverse, pk_set=None, **kwargs):
+    """
+    게시글-태그 연결 변경 시 게시글/태그 태그 갱신
+
+    clear 는 pk_set 이 없으므로 pre_clear 에서 연결된 ID 기억
+    """
+    own, other = ('tag', 'post') if reverse else ('post', 'tag')
+    if action == 'pre_clear':
+        links = sender.objects.filter(**{f'{own}_id': instance.pk})
+        instance._cleared_link_ids = list(links.values_list(f'{other}_id', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        ids = pk_set if action != 'post_clear' else getattr(instance, '_cleared_link_ids', ())
+        post_ids, tag_ids = (ids, [instance.pk]) if reverse else ([instance.pk], ids)
+        invalidate_tags(*(f'post:{pk}' for pk in post_ids), *(f'tag:{pk}:posts' for pk in tag_ids))
+
+
+# ==================== 카테고리/태그/시리즈 조회 캐시 ====================
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=PostSeries)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=PostSeries)
+def invalidate_taxonomy_cache(sender, instance, raw=False, **kwargs):
+    """카테고리/태그/시리즈 변경 시 조회 캐시 무효화"""
+    if not raw:
+        taxonomy.invalidate(sender)
@@ -0,0 +1,140 @@
+"""
+Blog 앱 - 사이트 통계
+====================
+홈페이지/관리자 대시보드의 전체 게시글/댓글/회원/조회수를
+요청마다 COUNT(*) / SUM 하지 않고 SiteStat 행에서 읽음 (집계 쿼리 0회)
+
+갱신 시점:
+- 게시글 생성/삭제, 발행 상태 변경 (blog.signals)
+- 댓글 생성/삭제, 활성 상태 변경 (blog.signals)
+- 회원 가입/삭제, 활성 상태 변경 (accounts.signals)
+- 조회수 flush (blog.view_counter, 반영된 조회수 합계)
+- 시그널 없는 일괄 변경 (관리자 액션 등): reconcile() 로 해당 통계만 재계산
+
+재계산 (reconcile):
+- 조회 시 마지막 재계산이 SITE_STATS_RECONCILE_INTERVAL 초보다 오래되면 백그라운드 재계산
+  (여러 워커가 동시에 실행하지 않도록 캐시 잠금)
+- python manage.py reconcile_site_stats (cron 등 주기 실행)
+- 재계산 시 증감 값과 실제 값의 차이를 drift 로 기록 (대시보드 표시)
+
+증감은 UPDATE ... SET value = value + n 한 문장으로 처리
+재계산 중 동시에 들어온 증감은 다음 재계산에서 보정될 수 있음
+
+사용 예:
+    stats = get_stats()
+    stats['published_posts'].value, stats['published_posts'].reconciled_at
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F, Sum
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from . import background
+from .models import Post, Comment, SiteStat
+
+logger = logging.getLogger(__name__)
+
+
+def _count_views():
+    return Post.objects.aggregate(total=Sum('views'))['total'] or 0
+
+
+# 통계 이름 → (표시 이름, DB 기준 값 계산 함수)
+STATS = {
+    'posts': ('전체 게시글', lambda: Post.objects.count()),
+    'published_posts': ('발행 게시글', lambda: Post.objects.filter(published=True).count()),
+    'active_comments': ('활성 댓글', lambda: Comment.objects.filter(is_active=True).count()),
+    'users': ('전체 회원', lambda: get_user_model().objects.count()),
+    'active_users': ('활성 회원', lambda: get_user_model().objects.filter(is_active=True).count()),
+    'views': ('전체 조회수', _count_views),
+}
+
+RECONCILE_LOCK_KEY = 'site_stats:reconciling'
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def adjust(**deltas):
+    """
+    통계 증감
+
+    Args:
+        **deltas: 통계 이름=증감값 (예: posts=1, published_posts=-1)
+    """
+    now = timezone.now()
+    for key, delta in deltas.items():
+        if key in STATS and delta:
+            SiteStat.objects.filter(key=key).update(
+                value=Greatest(F('value') + delta, 0),
+                updated_at=now,
+            )
+
+
+def reconcile(keys=None):
+    """
+    DB 기준으로 재계산
+
+    Args:
+        keys: 재계산할 통계 이름 목록 (기본값: 전체)
+
+    Returns:
+        {통계 이름: SiteStat}
+    """
+    keys = list(STATS) if keys is None else [key for key in keys if key in STATS]
+    previous = SiteStat.objects.in_bulk(keys)
+    result = {}
+    for key in keys:
+        actual = STATS[key][1]()
+        now = timezone.now()
+        stat = previous.get(key)
+        drift = stat.value - actual if stat is not None else 0
+        stat, _ = SiteStat.objects.update_or_create(
+            key=key,
+            defaults={'value': actual, 'drift': drift, 'updated_at': now, 'reconciled_at': now},
+        )
+        if drift:
+            logger.info('사이트 통계 보정 (%s: %+d)', key, -drift)
+        result[key] = stat
+    return result
+
+
+def schedule_reconcile():
+    """재계산 예약 (다른 워커가 진행 중이면 무시)"""
+    if not cache.add(RECONCILE_LOCK_KEY, 1, _setting('SITE_STATS_RECONCILE_LOCK', 60)):
+        return
+    if not _setting('SITE_STATS_ASYNC', True):
+        reconcile()
+        return
+    background.submit(reconcile, key=('site_stats',))
+
+
+def get_stats():
+    """
+    전체 통계 (SiteStat 1회 조회)
+
+    행이 없는 통계는 즉시 계산하여 저장
+    마지막 재계산이 오래되었으면 재계산 예약 (이번 응답은 현재 값 사용)
+
+    Returns:
+        {통계 이름: SiteStat} (각 객체에 label 속성 추가)
+    """
+    stats = SiteStat.objects.in_bulk(list(STATS))
+    missing = [key for key in STATS if key not in stats]
+    if missing:
+        stats.update(reconcile(missing))
+
+    stale_before = timezone.now() - timedelta(seconds=_setting('SITE_STATS_RECONCILE_INTERVAL', 3600))
+    if any(stat.reconciled_at < stale_before for stat in stats.values()):
+        schedule_reconcile()
+
+    for key, stat in stats.items():
+        stat.label = STATS[key][0]
+    return {key: stats[key] for key in STATS}
@@ -0,0 +1,82 @@
+"""
+Blog 앱 - 카테고리/태그/시리즈 조회
+=================================
+목록 페이지마다 반복되는 카테고리 목록, 태그/시리즈 조회를 2단계 캐시(blog.tiered_cache)로 제공
+
+캐시 항목:
+- categories: 전체 카테고리 목록 (슬러그 조회도 이 목록에서)
+- tags: 게시글이 있는 태그 목록 (게시글 수 순), 슬러그별 태그
+- series: 게시글이 있는 시리즈 목록, 슬러그별 시리즈 (작성자 포함)
+
+무효화:
+- 카테고리/태그/시리즈 저장/삭제 시 (blog.signals)
+- 발행 게시글 수 증감/재계산 시 (blog.counters), 목록 페이지 캐시 태그 (category:list 등) 도 함께 갱신
+"""
+
+from django.db import transaction
+from django.http import Http404
+
+from .cache_tags import invalidate_tags
+from .models import Category, PostSeries, Tag
+from .tiered_cache import TieredCache
+
+category_cache = TieredCache('categories')
+tag_cache = TieredCache('tags')
+series_cache = TieredCache('series')
+
+CACHES_BY_MODEL = {Category: category_cache, Tag: tag_cache, PostSeries: series_cache}
+
+LIST_TAGS = {Category: 'category:list', Tag: 'tag:list', PostSeries: 'series:list'}
+
+
+def get_categories():
+    """전체 카테고리 목록 (이름순)"""
+    return category_cache.get_or_set('all', lambda: list(Category.objects.all()))
+
+
+def get_category_or_404(slug):
+    for category in get_categories():
+        if category.slug == slug:
+            return category
+    raise Http404('카테고리를 찾을 수 없습니다.')
+
+
+def get_tags():
+    """게시글이 있는 태그 목록 (게시글 수 내림차순)"""
+    return tag_cache.get_or_set(
+        'used', lambda: list(Tag.objects.filter(post_count__gt=0).order_by('-post_count', 'name'))
+    )
+
+
+def get_tag_or_404(slug):
+    tag = tag_cache.get_or_set(f'slug:{slug}', lambda: Tag.objects.filter(slug=slug).first())
+    if tag is None:
+        raise Http404('태그를 찾을 수 없습니다.')
+    return tag
+
+
+def get_series_list():
+    """게시글이 있는 시리즈 목록 (최근 수정순)"""
+    return series_cache.get_or_set(
+        'used',
+        lambda: list(
+            PostSeries.objects.filter(post_count__gt=0)
+            .select_related('author').order_by('-updated_at')
+        ),
+    )
+
+
+def get_series_or_404(slug):
+    series = series_cache.get_or_set(
+        f'slug:{slug}', lambda: PostSeries.objects.select_related('author').filter(slug=slug).first()
+    )
+    if series is None:
+        raise Http404('시리즈를 찾을 수 없습니다.')
+    return series
+
+
+def invalidate(*models):
+    """해당 모델 캐시 무효화 (커밋 후, 트랜잭션 밖이면 즉시)"""
+    for model in models:
+        transaction.on_commit(CACHES_BY_MODEL[model].invalidate)
+    invalidate_tags(*(LIST_TAGS[model] for model in models))
@@ -0,0 +1,252 @@
+"""
+Blog 앱 - 썸네일 파생 이미지
+==========================
+게시글 썸네일 원본 대신 크기별 AVIF / WebP / JPEG 파생 이미지를 제공
+목록 카드에 수 MB 원본을 내려보내지 않도록 <picture> srcset 으로 알맞은 크기 선택
+
+처리 흐름:
+- 썸네일 저장/변경 시 커밋 후 백그라운드 작업 스레드에서 generate() (blog.signals)
+- 원본 디코딩/리사이즈/인코딩은 프로세스 풀에서 실행 (blog.imaging, THUMBNAIL_PROCESSES)
+- 파생 이미지는 원본 옆에 저장: posts/thumbnails/2026/01/photo.640w.webp
+- EXIF 제거: 파생 이미지는 메타데이터 없이 저장, EXIF 가 있던 원본은 제거한 파일로 교체
+- 결과 메타데이터는 Post.thumbnail_variants 에 저장 (원본 파일명 포함)
+  저장 후 게시글 상세/목록 페이지 캐시 태그 갱신 (원본 URL 로 렌더링된 페이지 무효화)
+- 썸네일이 바뀌었으면 (메타데이터의 원본 파일명 불일치) 이전 파생 이미지 삭제
+
+기존 게시글:
+- thumbnail_image() 조회 시 메타데이터가 없거나 원본과 다르면 생성 예약 후 원본 URL 사용
+- python manage.py generate_thumbnails 로 일괄 생성
+
+설정:
+- THUMBNAIL_WIDTHS: 생성 너비 목록
+- THUMBNAIL_FORMATS: 생성 포맷 (Pillow 가 지원하지 않는 포맷은 건너뜀)
+- THUMBNAIL_DEFAULT_WIDTH: <img src> 기본 너비 (srcset 미지원 브라우저)
+- THUMBNAIL_PROCESSES: 프로세스 풀 크기 (0 이면 현재 스레드에서 변환)
+- THUMBNAIL_ASYNC: False 이면 커밋 직후 요청 스레드에서 생성
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, UnidentifiedImageError
+
+from . import background
+from .cache_tags import invalidate_tags
+from .imaging import FORMATS, render_variants
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+@dataclass(frozen=True)
+class ThumbnailImage:
+    """
+    템플릿/API 용 썸네일 정보
+
+    - src: <img src> (기본 너비 JPEG, 파생 이미지가 없으면 원본)
+    - srcset: <img srcset> (JPEG 너비별)
+    - sources: (MIME 타입, srcset) 목록 (<source>, AVIF → WebP 순)
+    - variants: 파생 이미지 목록 ({'format', 'width', 'height', 'url'})
+    """
+    src: str
+    srcset: str = ''
+    width: int = None
+    height: int = None
+    sources: tuple = ()
+    variants: tuple = ()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # 웹 워커의 스레드 상태를 복제하지 않도록 spawn
+            _pool = ProcessPoolExecutor(
+                max_workers=_setting('THUMBNAIL_PROCESSES', 2),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _pool
+
+
+def process(func, *args):
+    """
+    이미지 변환 함수를 프로세스 풀에서 실행하고 결과 반환
+    (blog.imaging 함수, 프로필 이미지 변환 accounts.avatars 에서도 사용)
+    """
+    if _setting('THUMBNAIL_PROCESSES', 2) <= 0:
+        return func(*args)
+    try:
+        return _get_pool().submit(func, *args).result()
+    except BrokenProcessPool:
+        # 작업 프로세스가 비정상 종료되면 다음 요청에서 풀을 새로 생성
+        global _pool
+        with _pool_lock:
+            _pool = None
+        raise
+
+
+def _render(data):
+    return process(
+        render_variants,
+        data,
+        _setting('THUMBNAIL_WIDTHS', (320, 640, 1280)),
+        _setting('THUMBNAIL_FORMATS', ('avif', 'webp', 'jpeg')),
+        _setting('THUMBNAIL_QUALITY', None),
+    )
+
+
+def variant_name(source, width, fmt):
+    """원본 옆에 저장할 파생 이미지 이름"""
+    root, _ = os.path.splitext(source)
+    return f'{root}.{width}w.{FORMATS[fmt][1]}'
+
+
+def save_file(storage, name, content):
+    """같은 이름으로 저장 (기존 파일 교체)"""
+    if storage.exists(name):
+        storage.delete(name)
+    return storage.save(name, ContentFile(content))
+
+
+def delete_files(storage, names):
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception:
+            logger.warning('파생 이미지 삭제 실패 (%s)', name, exc_info=True)
+
+
+def _variant_names(meta):
+    return {variant['name'] for variant in (meta or {}).get('variants', ())}
+
+
+def schedule(post_id):
+    """파생 이미지 생성 예약 (같은 게시글 중복 예약 무시)"""
+    if not _setting('THUMBNAIL_ASYNC', True):
+        generate(post_id)
+        return
+    background.submit(generate, post_id, key=('thumbnail', post_id))
+
+
+def generate(post_id):
+    """
+    게시글 썸네일 파생 이미지 생성
+
+    이미지가 아니거나 손상된 파일은 오류를 메타데이터에 기록하여 반복 시도하지 않음
+    (프로세스 풀 장애 등 일시적인 오류는 예외 그대로 전달 → 다음 조회/커맨드에서 재시도)
+
+    Returns:
+        저장된 메타데이터 또는 None (썸네일 없음 / 처리 중 썸네일 변경)
+    """
+    from .models import Post
+
+    post = Post.objects.filter(pk=post_id)\
+        .only('id', 'thumbnail', 'thumbnail_variants', 'author', 'category', 'series').first()
+    if post is None or not post.thumbnail:
+        return None
+    source = post.thumbnail.name
+    storage = post.thumbnail.storage
+    previous = post.thumbnail_variants or {}
+
+    try:
+        with storage.open(source, 'rb') as file:
+            result = _render(file.read())
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        logger.warning('썸네일 변환 실패 (post=%s, %s): %s', post_id, source, exc)
+        meta = {'source': source, 'error': str(exc)[:200], 'variants': []}
+    else:
+        if result['original'] is not None:
+            save_file(storage, source, result['original'])
+        meta = {
+            'source': source,
+            'width': result['width'],
+            'height': result['height'],
+            'variants': [
+                {
+                    'format': fmt,
+                    'width': width,
+                    'height': height,
+                    'name': save_file(storage, variant_name(source, width, fmt), content),
+                }
+                for fmt, width, height, content in result['variants']
+            ],
+        }
+
+    # 처리 중 썸네일이 바뀌었으면 이번 결과 폐기
+    if not Post.objects.filter(pk=post_id, thumbnail=source).update(thumbnail_variants=meta):
+        delete_files(storage, _variant_names(meta))
+        return None
+    delete_files(storage, _variant_names(previous) - _variant_names(meta))
+    # 원본 URL 로 렌더링되어 캐시된 상세/목록 페이지 무효화
+    invalidate_tags(
+        f'post:{post_id}', 'post:list', f'user:{post.author_id}:posts',
+        f'category:{post.category_id}:posts', f'series:{post.series_id}:posts',
+        *(f'tag:{pk}:posts' for pk in post.tags.values_list('pk', flat=True)),
+    )
+    logger.info('썸네일 파생 이미지 생성 (post=%s, %d개)', post_id, len(meta['variants']))
+    return meta
+
+
+def delete_variants(post):
+    """게시글의 파생 이미지 파일 삭제 (게시글 삭제 시)"""
+    if post.thumbnail_variants:
+        delete_files(post.thumbnail.storage, _variant_names(post.thumbnail_variants))
+
+
+def thumbnail_image(post):
+    """
+    게시글 썸네일 정보
+
+    파생 이미지가 아직 없으면 (기존 게시글 등) 생성 예약 후 원본 URL 반환
+
+    Returns:
+        ThumbnailImage 또는 None (썸네일 없음)
+    """
+    if not post.thumbnail:
+        return None
+    meta = post.thumbnail_variants or {}
+    if meta.get('source') != post.thumbnail.name:
+        if post.pk:
+            schedule(post.pk)
+        return ThumbnailImage(src=post.thumbnail.url)
+    if not meta['variants']:
+        return ThumbnailImage(src=post.thumbnail.url, width=meta.get('width'), height=meta.get('height'))
+
+    storage = post.thumbnail.storage
+    variants = tuple(
+        {'format': v['format'], 'width': v['width'], 'height': v['height'], 'url': storage.url(v['name'])}
+        for v in meta['variants']
+    )
+
+    def srcset(fmt):
+        return ', '.join(f"{v['url']} {v['width']}w" for v in variants if v['format'] == fmt)
+
+    sources = tuple(
+        (FORMATS[fmt][2], srcset(fmt))
+        for fmt in ('avif', 'webp')
+        if any(v['format'] == fmt for v in variants)
+    )
+    fallback = [v for v in variants if v['format'] == 'jpeg']
+    default_width = _setting('THUMBNAIL_DEFAULT_WIDTH', 640)
+    src = min(fallback, key=lambda v: abs(v['width'] - default_width))['url'] if fallback else post.thumbnail.url
+    return ThumbnailImage(
+        src=src,
+        srcset=srcset('jpeg'),
+        width=meta['width'],
+        height=meta['height'],
+        sources=sources,
+        variants=variants,
+    )
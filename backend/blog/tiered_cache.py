@@ -0,0 +1,268 @@
+"""
+Blog 앱 - 2단계 캐시
+===================
+작고 자주 읽으며 거의 바뀌지 않는 객체 (카테고리 목록, 태그/시리즈 조회 등) 를
+요청마다 DB 나 공유 캐시에서 다시 읽지 않도록 워커 메모리에 보관
+
+계층:
+- L1: 프로세스 메모리 LRU (워커별, 항목 TTL + 항목 수/바이트 한도)
+- L2: 공유 캐시 (CACHES['default'], 워커 간 공유)
+- 둘 다 없으면 loader 로 DB 조회 후 L2, L1 순으로 저장
+  (blog.recompute.single_flight: 워커 1개만 조회, 나머지는 L2 에 저장될 때까지 대기)
+- L1/L2 TTL 은 항목마다 분산 (blog.recompute.jittered) → 같은 시각에 만료되지 않음
+
+일관성 (버전 스탬프):
+- 네임스페이스마다 버전 번호를 L2 에 저장 (tiered:<네임스페이스>:version)
+- L2 키에 버전 포함, L1 항목은 저장 당시 버전을 함께 보관 → 버전이 다르면 사용하지 않음
+- 현재 버전은 TIERED_CACHE_VERSION_CHECK_INTERVAL 초마다 L2 에서 다시 읽음
+  (그 사이에는 L2 왕복 없이 L1 만 사용, 다른 워커의 무효화는 최대 이 시간만큼 늦게 반영)
+- invalidate(): L2 버전 증가 + 현재 워커 L1 항목 즉시 삭제
+- 버전 키가 L2 에서 제거되면 현재 시각(ms)으로 다시 시작 → 이전 버전 키와 겹치지 않음
+
+크기 계산:
+- 값은 한 번 pickle 하여 L2 에 바이트로 저장, 같은 바이트 수를 L1 크기로 사용
+- TIERED_CACHE_L1_MAX_BYTES 보다 큰 값은 L1 에 넣지 않음
+
+지표: 계층별 적중/실패 수와 적중률 (metrics(), 관리자 API blog:cache_metrics)
+
+사용 예:
+    categories = TieredCache('categories')
+    items = categories.get_or_set('all', lambda: list(Category.objects.all()))
+    categories.invalidate()
+
+L1 값은 여러 요청이 같은 객체를 공유하므로 읽기 전용으로 사용
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .recompute import jittered, single_flight
+
+_MISSING = object()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _ratio(hits, misses):
+    total = hits + misses
+    return round(hits / total, 4) if total else None
+
+
+class LRUCache:
+    """
+    크기 제한 LRU (스레드 안전)
+
+    항목 수 또는 바이트 합계가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    항목: 키 → (값, 크기, 만료 시각, 버전)
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key):
+        _, size, _, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key, version):
+        """버전이 같고 만료되지 않은 값 (없으면 _MISSING)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            value, _, expires_at, item_version = item
+            if item_version != version or expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, size, ttl, version):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, time.monotonic() + ttl, version)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, old_size, _, _) = self._data.popitem(last=False)
+                self._bytes -= old_size
+                self.evictions += 1
+
+    def delete_namespace(self, namespace):
+        """(네임스페이스, 키) 형식 키 중 해당 네임스페이스 항목 삭제"""
+        with self._lock:
+            for key in [key for key in self._data if key[0] == namespace]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+# 워커 전체가 공유하는 L1 (네임스페이스별 한도 없이 전체 한도 적용)
+l1_cache = LRUCache(
+    max_entries=_setting('TIERED_CACHE_L1_MAX_ENTRIES', 1000),
+    max_bytes=_setting('TIERED_CACHE_L1_MAX_BYTES', 4 * 1024 * 1024),
+)
+
+_registry = {}
+
+
+class TieredCache:
+    """
+    네임스페이스 단위 2단계 캐시
+
+    get_or_set(key, loader): L1 → L2 → loader 순으로 조회
+    invalidate(): 네임스페이스 전체 무효화 (모든 워커, 버전 증가)
+    """
+
+    def __init__(self, namespace, l1_ttl=None, l2_ttl=None):
+        self.namespace = namespace
+        self.l1_ttl = l1_ttl
+        self.l2_ttl = l2_ttl
+        self._version = None
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ('l1_hits', 'l1_misses', 'l2_hits', 'l2_misses', 'loads', 'invalidations'), 0
+        )
+        _registry[namespace] = self
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    @property
+    def version_key(self):
+        return f'tiered:{self.namespace}:version'
+
+    def _l2_key(self, version, key):
+        return f'tiered:{self.namespace}:{version}:{key}'
+
+    def version(self):
+        """현재 버전 (TIERED_CACHE_VERSION_CHECK_INTERVAL 초 동안은 L2 를 다시 읽지 않음)"""
+        now = time.monotonic()
+        interval = _setting('TIERED_CACHE_VERSION_CHECK_INTERVAL', 2)
+        if self._version is None or now - self._version_checked_at >= interval:
+            version = cache.get(self.version_key)
+            if version is None:
+                cache.add(self.version_key, int(time.time() * 1000), None)
+                version = cache.get(self.version_key)
+            self._version = version
+            self._version_checked_at = now
+        return self._version
+
+    def get_or_set(self, key, loader):
+        """
+        캐시된 값 또는 loader() 결과 (None 도 그대로 캐시)
+
+        Args:
+            key: 네임스페이스 안의 키 (문자열)
+            loader: 값이 없을 때 호출 (인자 없음)
+        """
+        version = self.version()
+        value = l1_cache.get((self.namespace, key), version)
+        if value is not _MISSING:
+            self._count('l1_hits')
+            return value
+        self._count('l1_misses')
+
+        l2_key = self._l2_key(version, key)
+        data = cache.get(l2_key)
+        if data is not None:
+            self._count('l2_hits')
+        else:
+            self._count('l2_misses')
+
+            def load():
+                self._count('loads')
+                loaded = pickle.dumps(loader(), pickle.HIGHEST_PROTOCOL)
+                cache.set(l2_key, loaded, int(jittered(self.l2_ttl or _setting('TIERED_CACHE_L2_TTL', 3600))))
+                return loaded
+
+            data = single_flight(f'{l2_key}:lock', load, lambda: cache.get(l2_key), f'tiered:{self.namespace}')
+        value = pickle.loads(data)
+
+        l1_cache.set(
+            (self.namespace, key), value, len(data),
+            jittered(self.l1_ttl or _setting('TIERED_CACHE_L1_TTL', 60)), version,
+        )
+        return value
+
+    def invalidate(self):
+        """네임스페이스 무효화 (다른 워커는 다음 버전 확인 시 반영)"""
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            version = int(time.time() * 1000)
+            cache.set(self.version_key, version, None)
+        self._version = version
+        self._version_checked_at = time.monotonic()
+        l1_cache.delete_namespace(self.namespace)
+        self._count('invalidations')
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            **stats,
+            'l1_hit_ratio': _ratio(stats['l1_hits'], stats['l1_misses']),
+            'l2_hit_ratio': _ratio(stats['l2_hits'], stats['l2_misses']),
+            'version': self._version,
+        }
+
+
+def metrics():
+    """
+    계층별 적중률 (현재 워커 기준)
+
+    - l1: LRU 상태 + 전체 네임스페이스 적중/실패
+    - l2: L1 실패 후 공유 캐시 적중/실패
+    - namespaces: 네임스페이스별 지표
+    """
+    namespaces = {name: tiered.metrics() for name, tiered in _registry.items()}
+
+    def total(name):
+        return sum(item[name] for item in namespaces.values())
+
+    return {
+        'l1': {
+            **l1_cache.stats(),
+            'hits': total('l1_hits'),
+            'misses': total('l1_misses'),
+            'hit_ratio': _ratio(total('l1_hits'), total('l1_misses')),
+        },
+        'l2': {
+            'hits': total('l2_hits'),
+            'misses': total('l2_misses'),
+            'hit_ratio': _ratio(total('l2_hits'), total('l2_misses')),
+        },
+        'namespaces': namespaces,
+    }
@@ -0,0 +1,194 @@
+"""
+Blog 앱 - 팔로잉 피드
+====================
+사용자별로 팔로우한 작성자의 게시글 ID 를 미리 저장해 두는 피드 (fan-out-on-write)
+피드 페이지는 TimelineEntry (user, created_at, post) 인덱스 범위 조회 1회로 읽음
+(Follow ⨝ Post 조인 없음)
+
+채우는 시점:
+- 게시글 발행: 팔로워 알림 발송 작업(accounts.notifications)이 같은 배치로 push_post()
+- 팔로우: 작성자의 최근 게시글 backfill()
+- 언팔로우: 해당 작성자 항목 remove_author()
+- 비공개 전환: 해당 게시글 항목 remove_post()
+- 재발행 (비공개 → 발행): 알림 없이 팔로워 피드에 다시 추가 restore_post() (blog.signals)
+
+팔로워가 많은 작성자 (TIMELINE_FANOUT_MAX_FOLLOWERS 초과):
+- 발행 시 피드에 넣지 않고 게시글에 timeline_pull 표시
+- 팔로워가 피드를 볼 때 pull() 로 가져와 본인 피드에만 저장 (fan-out-on-read)
+  (사용자당 TIMELINE_PULL_INTERVAL 초에 1회)
+
+피드 크기는 TIMELINE_SIZE 개로 제한 (오래된 항목 정리):
+- pull 시 본인 피드
+- push_post / backfill 후 항목을 받은 사용자 중 TIMELINE_SIZE + TIMELINE_TRIM_SLACK 개를 넘은 사용자
+  (배치당 집계 쿼리 1회, 정리는 사용자당 TIMELINE_TRIM_SLACK 개 추가마다 1회 수준)
+
+피드 조회는 발행 게시글만 (시그널을 거치지 않고 비공개된 게시글의 항목이 남아 있어도 표시하지 않음)
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from . import background
+from .models import Post, PostQuerySet, TimelineEntry
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def timeline_size():
+    return _setting('TIMELINE_SIZE', 500)
+
+
+def should_pull(follower_count):
+    """발행 시 피드에 넣지 않고 조회 시 가져올 작성자인지"""
+    return follower_count > _setting('TIMELINE_FANOUT_MAX_FOLLOWERS', 10000)
+
+
+def _insert(user_ids, posts):
+    """(사용자 × 게시글) 피드 항목 일괄 저장 (이미 있으면 무시)"""
+    entries = [
+        TimelineEntry(user_id=user_id, post_id=post.pk, author_id=post.author_id, created_at=post.created_at)
+        for user_id in user_ids
+        for post in posts
+    ]
+    TimelineEntry.objects.bulk_create(entries, batch_size=1000, ignore_conflicts=True)
+    return len(entries)
+
+
+def push_post(post, user_ids):
+    """발행된 게시글을 팔로워 피드에 추가 (크기를 넘은 피드 정리)"""
+    inserted = _insert(user_ids, [post])
+    trim_users(user_ids)
+    return inserted
+
+
+def mark_pull(post):
+    """팔로워 피드 조회 시 가져오도록 표시"""
+    Post.objects.filter(pk=post.pk).update(timeline_pull=True)
+
+
+def _recent_posts(author_filter, limit):
+    return list(
+        Post.objects.filter(author_filter, published=True)
+        .only('id', 'author_id', 'created_at')
+        .order_by('-created_at', '-id')[:limit]
+    )
+
+
+def backfill(user_id, author_id, limit=None):
+    """팔로우한 작성자의 최근 게시글을 피드에 추가"""
+    posts = _recent_posts(Q(author_id=author_id), limit or _setting('TIMELINE_BACKFILL', 50))
+    inserted = _insert([user_id], posts)
+    trim_users([user_id])
+    return inserted
+
+
+def remove_author(user_id, author_id):
+    """언팔로우한 작성자의 게시글을 피드에서 삭제"""
+    TimelineEntry.objects.filter(user_id=user_id, author_id=author_id).delete()
+
+
+def remove_post(post_id):
+    """비공개 전환된 게시글을 모든 피드에서 삭제"""
+    TimelineEntry.objects.filter(post_id=post_id).delete()
+
+
+def restore_post(post_id, batch_size=1000):
+    """
+    재발행된 게시글을 팔로워 피드에 다시 추가 (알림은 다시 보내지 않음)
+
+    팔로워가 많은 작성자는 timeline_pull 표시만 (피드 조회 시 반영)
+
+    Returns:
+        추가 시도한 항목 수
+    """
+    from accounts.models import Follow
+
+    post = Post.objects.filter(pk=post_id, published=True)\
+        .only('id', 'author_id', 'created_at').first()
+    if post is None:
+        return 0
+    followers = Follow.objects.filter(following_id=post.author_id)
+    if should_pull(followers.count()):
+        mark_pull(post)
+        return 0
+
+    inserted = 0
+    last_follower_id = 0
+    while True:
+        follower_ids = list(
+            followers.filter(follower_id__gt=last_follower_id)
+            .order_by('follower_id')
+            .values_list('follower_id', flat=True)[:batch_size]
+        )
+        if not follower_ids:
+            return inserted
+        inserted += push_post(post, follower_ids)
+        last_follower_id = follower_ids[-1]
+
+
+def schedule_restore(post_id):
+    """재발행 게시글 피드 복원 예약 (알림 발송과 같은 설정으로 백그라운드 실행)"""
+    if not _setting('NOTIFICATION_FANOUT_ASYNC', True):
+        restore_post(post_id)
+        return
+    background.submit(restore_post, post_id, key=('timeline_restore', post_id))
+
+
+def pull(user_id):
+    """
+    팔로워가 많은 작성자의 게시글을 피드에 반영 후 피드 크기 정리
+
+    사용자당 TIMELINE_PULL_INTERVAL 초에 1회만 실행
+    """
+    if not cache.add(f'timeline:{user_id}:pulled', 1, _setting('TIMELINE_PULL_INTERVAL', 60)):
+        return
+    from accounts.models import Follow
+
+    followed = Follow.objects.filter(follower_id=user_id).values('following_id')
+    posts = _recent_posts(
+        Q(timeline_pull=True, author_id__in=followed),
+        _setting('TIMELINE_BACKFILL', 50),
+    )
+    if posts:
+        _insert([user_id], posts)
+    trim(user_id)
+
+
+def trim(user_id):
+    """TIMELINE_SIZE 개를 넘는 오래된 항목 삭제"""
+    size = timeline_size()
+    boundary = TimelineEntry.objects.filter(user_id=user_id)\
+        .order_by('-created_at', '-post_id')\
+        .values_list('created_at', 'post_id')[size:size + 1]
+    boundary = list(boundary)
+    if not boundary:
+        return
+    created_at, post_id = boundary[0]
+    TimelineEntry.objects.filter(user_id=user_id).filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at, post_id__lte=post_id)
+    ).delete()
+
+
+def trim_users(user_ids):
+    """
+    TIMELINE_SIZE + TIMELINE_TRIM_SLACK 개를 넘은 사용자의 피드만 정리
+
+    대상 확인은 사용자 목록당 집계 쿼리 1회
+    """
+    limit = timeline_size() + _setting('TIMELINE_TRIM_SLACK', 50)
+    over_limit = TimelineEntry.objects.filter(user_id__in=list(user_ids))\
+        .values('user_id').annotate(count=Count('pk')).filter(count__gt=limit)\
+        .values_list('user_id', flat=True)
+    for user_id in list(over_limit):
+        trim(user_id)
+
+
+def feed_queryset(user):
+    """피드 항목 (최신순, 발행 게시글만, 게시글/작성자/카테고리 포함)"""
+    return TimelineEntry.objects.filter(user=user, post__published=True)\
+        .select_related('post__author', 'post__category')\
+        .defer(*PostQuerySet.list_deferred_fields('post__'))\
+        .order_by('-created_at', '-post_id')
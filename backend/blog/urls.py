@@ -12,6 +12,8 @@ app_name = 'blog'
 urlpatterns = [
     # 관리자 대시보드
     path('admin-dashboard/', views.AdminDashboardView.as_view(), name='admin_dashboard'),
+    path('admin-dashboard/view-counter/', views.view_counter_metrics, name='view_counter_metrics'),
+    path('admin-dashboard/cache/', views.cache_metrics, name='cache_metrics'),
     
     # 게시글 목록
     path('', views.PostListView.as_view(), name='post_list'),
@@ -29,6 +31,9 @@ urlpatterns = [
     path('tags/', views.TagListView.as_view(), name='tag_list'),
     re_path(r'^tag/(?P<slug>[\w-]+)/$', views.TagDetailView.as_view(), name='tag_detail'),
     
+    # 팔로잉 피드
+    path('feed/', views.FollowingFeedView.as_view(), name='following_feed'),
+    
     # ==================== 시리즈 관련 URL ====================
     path('series/', views.SeriesListView.as_view(), name='series_list'),
     path('series/create/', views.SeriesCreateView.as_view(), name='series_create'),
@@ -38,6 +43,7 @@ urlpatterns = [
     path('drafts/', views.draft_list, name='draft_list'),
     path('draft/<int:post_id>/delete/', views.delete_draft, name='delete_draft'),
     path('api/auto-save/', views.auto_save_post, name='auto_save'),
+    path('api/viewer-state/', views.viewer_state, name='viewer_state'),
     
     # 댓글 삭제
     path('comment/<int:comment_id>/delete/', views.delete_comment, name='delete_comment'),
@@ -0,0 +1,218 @@
+"""
+Blog 앱 - 조회수 버퍼
+====================
+게시글 조회수 write-behind 처리
+조회 요청마다 행을 UPDATE 하지 않고 프로세스 메모리에 누적한 뒤
+주기적으로 한 번에 반영
+
+동작 방식:
+- record(): 게시글 ID별 조회수를 메모리 버퍼에 누적
+- 백그라운드 스레드가 VIEW_COUNT_FLUSH_INTERVAL 초마다 flush()
+- flush(): 증가량이 같은 게시글끼리 묶어
+  UPDATE blog_post SET views = views + n WHERE id IN (...) 실행
+- 대기 중인 조회수가 VIEW_COUNT_MAX_PENDING 이상이면 즉시 flush
+- 프로세스 종료 시 (atexit, gunicorn worker_exit) 마지막 flush
+- flush 후 인기 게시글 리더보드 증분 갱신 (blog.leaderboard)
+- 같은 flush 에서 사이트 전체 조회수 증가 (blog.site_stats)
+
+설정:
+- VIEW_COUNT_FLUSH_INTERVAL: flush 주기 (초, 0이면 즉시 반영)
+- VIEW_COUNT_MAX_PENDING: 즉시 flush 기준 누적 조회수
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    프로세스 단위 조회수 버퍼
+
+    스레드 안전하며, flush 실패 시 누적분을 버퍼로 되돌려 다음 주기에 재시도
+    """
+
+    def __init__(self, flush_interval=10, max_pending=1000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._pending_hits = 0
+        self._oldest_pending_at = None
+        self._thread = None
+        self._stop = threading.Event()
+        # 지표
+        self._stats = {
+            'recorded_hits': 0,
+            'flushed_hits': 0,
+            'flushes': 0,
+            'failures': 0,
+            'last_flush_at': None,
+            'last_flush_duration': 0.0,
+            'last_flush_lag': 0.0,
+        }
+
+    def record(self, post_id, count=1):
+        """조회수 누적"""
+        with self._lock:
+            self._pending[post_id] += count
+            self._pending_hits += count
+            self._stats['recorded_hits'] += count
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = time.monotonic()
+            pending_hits = self._pending_hits
+
+        if self.flush_interval <= 0 or pending_hits >= self.max_pending:
+            self.flush()
+        else:
+            self._ensure_thread()
+
+    def pending_for(self, post_id):
+        """아직 반영되지 않은 조회수"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def flush(self):
+        """
+        누적된 조회수를 DB에 반영
+
+        Returns:
+            반영된 조회수 합계
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                pending = self._pending
+                oldest = self._oldest_pending_at
+                self._pending = defaultdict(int)
+                self._pending_hits = 0
+                self._oldest_pending_at = None
+
+            started = time.monotonic()
+            try:
+                self._write(pending)
+            except Exception:
+                logger.exception('조회수 flush 실패 (%d개 게시글)', len(pending))
+                with self._lock:
+                    for post_id, count in pending.items():
+                        self._pending[post_id] += count
+                        self._pending_hits += count
+                    if self._oldest_pending_at is None or oldest < self._oldest_pending_at:
+                        self._oldest_pending_at = oldest
+                    self._stats['failures'] += 1
+                return 0
+
+            finished = time.monotonic()
+            total = sum(pending.values())
+            self._notify(pending)
+            with self._lock:
+                self._stats['flushed_hits'] += total
+                self._stats['flushes'] += 1
+                self._stats['last_flush_at'] = time.time()
+                self._stats['last_flush_duration'] = finished - started
+                self._stats['last_flush_lag'] = finished - oldest
+            return total
+
+    def _write(self, pending):
+        """증가량이 같은 게시글끼리 묶어 일괄 UPDATE"""
+        from . import site_stats
+        from .models import Post
+
+        by_delta = defaultdict(list)
+        for post_id, count in pending.items():
+            by_delta[count].append(post_id)
+
+        with transaction.atomic():
+            for delta, post_ids in by_delta.items():
+                Post.objects.filter(pk__in=post_ids).update(views=F('views') + delta)
+            site_stats.adjust(views=sum(pending.values()))
+
+    def _notify(self, pending):
+        """반영된 조회수를 인기 게시글 리더보드에 전달"""
+        from .leaderboard import apply_view_deltas
+
+        try:
+            apply_view_deltas(pending)
+        except Exception:
+            logger.exception('리더보드 증분 갱신 실패')
+
+    def metrics(self):
+        """
+        버퍼 상태 및 지연 지표
+
+        - pending_posts / pending_hits: 반영 대기 중인 게시글 수 / 조회수
+        - lag_seconds: 가장 오래된 미반영 조회의 경과 시간
+        - last_flush_lag: 직전 flush 가 반영한 가장 오래된 조회의 지연 시간
+        """
+        with self._lock:
+            lag = 0.0
+            if self._oldest_pending_at is not None:
+                lag = time.monotonic() - self._oldest_pending_at
+            return {
+                'pending_posts': len(self._pending),
+                'pending_hits': self._pending_hits,
+                'lag_seconds': round(lag, 3),
+                'flush_interval': self.flush_interval,
+                **self._stats,
+            }
+
+    def _ensure_thread(self):
+        """flush 스레드 지연 시작 (첫 조회 시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='view-count-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def shutdown(self):
+        """flush 스레드 중지 후 마지막 flush"""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('종료 시 조회수 flush 실패')
+
+
+view_buffer = ViewCountBuffer(
+    flush_interval=getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10),
+    max_pending=getattr(settings, 'VIEW_COUNT_MAX_PENDING', 1000),
+)
+
+# 프로세스 종료 시 남은 조회수 반영
+atexit.register(view_buffer.shutdown)
+
+
+def record_view(post_id):
+    """게시글 조회 1회 기록 (누적 조회수 + 일별 활동 통계)"""
+    from .analytics import record_activity
+
+    view_buffer.record(post_id)
+    record_activity(post_id, views=1)
+
+
+def flush_views():
+    """대기 중인 조회수 즉시 반영"""
+    return view_buffer.flush()
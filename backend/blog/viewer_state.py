@@ -0,0 +1,158 @@
+"""
+Blog 앱 - 사용자 반응 상태
+========================
+"이 사용자가 게시글/댓글 N개에 좋아요/싫어요/북마크를 했는가"를
+관계별 1회 인덱스 조회로 확인 (좋아요/싫어요는 Reaction 1회, 북마크 1회)
+
+post.likes.all 처럼 관계 전체를 읽지 않고
+WHERE user_id = ? AND target_id IN (...) 로 필요한 행만 조회
+
+캐시:
+- 게시글/댓글 단위로 사용자별 캐시 (viewer:{user}:{version}:{p|c}:{id})
+- 캐시에 없는 ID만 DB 조회
+- 사용자가 반응을 바꾸면 invalidate_viewer_state()로 사용자 버전 증가
+
+사용 예:
+    state = get_viewer_state(request.user, post_ids=[post.pk])
+    state.post(post.pk)  # {'liked': True, 'disliked': False, 'bookmarked': False}
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Bookmark, Reaction
+
+POST_FLAGS = ('liked', 'disliked', 'bookmarked')
+COMMENT_FLAGS = ('liked', 'disliked')
+
+
+def _ttl():
+    return getattr(settings, 'VIEWER_STATE_TTL', 300)
+
+
+def _version_key(user_id):
+    return f'viewer:{user_id}:version'
+
+
+def _version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = 1
+        cache.add(_version_key(user_id), version, None)
+    return version
+
+
+def invalidate_viewer_state(user):
+    """사용자 반응 상태 캐시 무효화 (버전 증가)"""
+    key = _version_key(user.pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+
+def _reactions(user_id, target_type, target_ids):
+    """좋아요/싫어요 1회 조회 → {'liked': {...}, 'disliked': {...}}"""
+    rows = Reaction.objects.filter(
+        target_type=target_type, target_id__in=target_ids, user_id=user_id
+    ).values_list('target_id', 'value')
+    found = {'liked': set(), 'disliked': set()}
+    for target_id, value in rows:
+        found['liked' if value == Reaction.LIKE else 'disliked'].add(target_id)
+    return found
+
+
+def _post_relations(user_id, post_ids):
+    """게시글 관계별 1회 조회"""
+    return {
+        **_reactions(user_id, Reaction.POST, post_ids),
+        'bookmarked': set(
+            Bookmark.objects.filter(user_id=user_id, post_id__in=post_ids)
+            .values_list('post_id', flat=True)
+        ),
+    }
+
+
+def _comment_relations(user_id, comment_ids):
+    """댓글 좋아요/싫어요 1회 조회"""
+    return _reactions(user_id, Reaction.COMMENT, comment_ids)
+
+
+def _load(user_id, version, scope, ids, flags, relations):
+    """캐시 우선 조회, 캐시에 없는 ID만 DB 조회 후 저장"""
+    keys = {f'viewer:{user_id}:{version}:{scope}:{pk}': pk for pk in ids}
+    cached = cache.get_many(keys)
+    states = {keys[key]: dict(zip(flags, value)) for key, value in cached.items()}
+
+    missing = [pk for key, pk in keys.items() if key not in cached]
+    if missing:
+        found = {flag: set(queryset) for flag, queryset in relations(user_id, missing).items()}
+        fresh = {pk: {flag: pk in found[flag] for flag in flags} for pk in missing}
+        states.update(fresh)
+        cache.set_many(
+            {f'viewer:{user_id}:{version}:{scope}:{pk}': tuple(state[f] for f in flags)
+             for pk, state in fresh.items()},
+            _ttl(),
+        )
+    return states
+
+
+class ViewerState:
+    """
+    사용자 반응 상태
+
+    post(id) / comment(id) 로 개별 상태 조회
+    템플릿에서는 for_post 속성 (현재 게시글 상태) 사용
+    """
+
+    def __init__(self, posts=None, comments=None, current_post_id=None):
+        self.posts = posts or {}
+        self.comments = comments or {}
+        self.current_post_id = current_post_id
+
+    def post(self, post_id):
+        return self.posts.get(post_id) or dict.fromkeys(POST_FLAGS, False)
+
+    def comment(self, comment_id):
+        return self.comments.get(comment_id) or dict.fromkeys(COMMENT_FLAGS, False)
+
+    @property
+    def for_post(self):
+        """현재 게시글 상태 (템플릿용)"""
+        return self.post(self.current_post_id)
+
+    def as_dict(self):
+        """JSON 응답용 (키는 문자열 ID)"""
+        return {
+            'posts': {str(pk): state for pk, state in self.posts.items()},
+            'comments': {str(pk): state for pk, state in self.comments.items()},
+        }
+
+
+def get_viewer_state(user, post_ids=(), comment_ids=()):
+    """
+    사용자 반응 상태 조회
+
+    Args:
+        user: 현재 사용자 (비로그인이면 모두 False)
+        post_ids: 게시글 ID 목록
+        comment_ids: 댓글 ID 목록
+
+    Returns:
+        ViewerState
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    comment_ids = list(dict.fromkeys(comment_ids))
+    current = post_ids[0] if len(post_ids) == 1 else None
+
+    if user is None or not user.is_authenticated:
+        return ViewerState(
+            {pk: dict.fromkeys(POST_FLAGS, False) for pk in post_ids},
+            {pk: dict.fromkeys(COMMENT_FLAGS, False) for pk in comment_ids},
+            current_post_id=current,
+        )
+
+    version = _version(user.pk)
+    posts = _load(user.pk, version, 'p', post_ids, POST_FLAGS, _post_relations) if post_ids else {}
+    comments = _load(user.pk, version, 'c', comment_ids, COMMENT_FLAGS, _comment_relations) if comment_ids else {}
+    return ViewerState(posts, comments, current_post_id=current)
@@ -6,6 +6,7 @@ Class-Based Views 사용
 """
 
 import json
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.decorators import login_required
@@ -14,36 +15,85 @@ from django.views.generic import (
     ListView, DetailView, CreateView, UpdateView, DeleteView, TemplateView
 )
 from django.urls import reverse_lazy, reverse
-from django.db.models import Q, Count, Sum
+from django.db import transaction
+from django.db.models import Q
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from django.middleware.csrf import get_token
+
+from accounts.unread_counter import get_unread_count
 
 from .models import Category, Post, Comment, Bookmark, Tag, PostSeries
 from .forms import PostForm, CommentForm, CategoryForm, PostSeriesForm
+from .counters import adjust_post_counters
+from .view_counter import view_buffer, record_view
+from .leaderboard import get_popular_posts
+from .search import search_posts, order_by_rank, attach_snippets
+from .pagination import KeysetPaginationMixin
+from .comments import load_comment_tree
+from .viewer_state import get_viewer_state, invalidate_viewer_state
+from .page_cache import add_page_tags, cache_page_for_anonymous, collecting_page_tags
+from .taxonomy import (
+    get_categories, get_category_or_404, get_tags, get_tag_or_404,
+    get_series_list, get_series_or_404,
+)
+from .degraded import breaker
+from .recompute import guarded_cache, metrics as recompute_metrics
+from .tiered_cache import metrics as tiered_cache_metrics
+from .reactions import toggle_reaction, LIKE, DISLIKE
+from . import analytics, site_stats, timeline
+
+
+class PopularPostsMixin:
+    """
+    인기 게시글 사이드바 컨텍스트 믹스인
+
+    캐시된 리더보드(blog.leaderboard)에서 popular_posts 를 채움
+    카테고리별 리더보드가 필요하면 get_popular_posts_category() 오버라이드
+    """
+    
+    def get_popular_posts_category(self):
+        return None
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['popular_posts'] = get_popular_posts(self.get_popular_posts_category())
+        return context
+
 
-class PostListView(ListView):
+@method_decorator(cache_page_for_anonymous(tags=['post:list', 'category:list']), name='dispatch')
+class PostListView(KeysetPaginationMixin, PopularPostsMixin, ListView):
     """
     게시글 목록 뷰
     
     기능:
     - 발행된 게시글 목록 표시
-    - 페이지네이션 (10개씩)
+    - 키셋 페이지네이션 (10개씩, ?cursor=)
     - 카테고리 필터링
-    - 검색 기능
-    - 정렬 기능 (최신순/좋아요순)
+    - 검색 기능 (blog.search 전문 검색, 스니펫 하이라이트)
+    - 정렬 기능 (정확도순/최신순/좋아요순)
     """
     model = Post
     template_name = 'blog/post_list.html'
     context_object_name = 'posts'
     paginate_by = 10
     
+    def get_sort(self):
+        """정렬 기준 (검색 시 기본값은 정확도순)"""
+        default = 'relevance' if self.request.GET.get('q') else 'recent'
+        sort = self.request.GET.get('sort') or default
+        if sort == 'relevance' and not self.request.GET.get('q'):
+            sort = 'recent'
+        return sort
+    
     def get_queryset(self):
         """게시글 쿼리셋 - 필터링, 검색, 정렬 적용"""
+        # 좋아요/댓글 수는 비정규화 컬럼 사용 (카드별 COUNT 쿼리 없음)
         queryset = Post.objects.filter(published=True)\
-            .select_related('author', 'category')\
-            .prefetch_related('comments')\
-            .annotate(likes_count=Count('likes'))
+            .select_related('author', 'category').for_list()
         
         # 카테고리 필터
         category_slug = self.request.GET.get('category')
@@ -53,40 +103,44 @@ class PostListView(ListView):
         # 검색 필터
         search_query = self.request.GET.get('q')
         if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(content__icontains=search_query) |
-                Q(author__username__icontains=search_query)
-            )
+            queryset = search_posts(queryset, search_query)
             
         # 정렬 필터
-        sort = self.request.GET.get('sort', 'recent')
-        if sort == 'likes':
-            queryset = queryset.order_by('-likes_count', '-created_at')
+        sort = self.get_sort()
+        if sort == 'relevance':
+            queryset = order_by_rank(queryset)
+        elif sort == 'likes':
+            queryset = queryset.order_by('-likes_count', '-created_at', '-id')
         else:
-            queryset = queryset.order_by('-created_at')
+            queryset = queryset.order_by('-created_at', '-id')
         
         return queryset
     
     def get_context_data(self, **kwargs):
         """추가 컨텍스트: 카테고리 목록, 검색어, 정렬 기준, 인기 게시글"""
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
+        context['categories'] = get_categories()
         context['search_query'] = self.request.GET.get('q', '')
         context['current_category'] = self.request.GET.get('category', '')
-        context['current_sort'] = self.request.GET.get('sort', 'recent')
-        # 인기 게시글 (조회수 상위 5개)
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
+        context['current_sort'] = self.get_sort()
+        if context['search_query']:
+            context['posts'] = attach_snippets(list(context['posts']), context['search_query'])
         return context
 
 
+def _count_cached_view(request, meta):
+    """캐시된 상세 페이지 사용 시에도 조회수 기록"""
+    record_view(meta['post_id'])
+
+
+@method_decorator(cache_page_for_anonymous(on_hit=_count_cached_view), name='dispatch')
 class PostDetailView(DetailView):
     """
     게시글 상세 뷰
     
     기능:
     - 게시글 본문 표시
-    - 조회수 증가
+    - 조회수 증가 (캐시된 페이지 사용 시에도 기록)
     - 댓글 목록 표시
     - 관련 게시글 표시
     """
@@ -104,7 +158,20 @@ class PostDetailView(DetailView):
         return Post.objects.filter(published=True).select_related('author', 'category')
     
     def get_object(self, queryset=None):
-        """조회수 증가"""
+        """
+        조회수 증가
+
+        캐시할 페이지는 ID 만 먼저 조회하여 태그를 기록한 뒤 게시글 조회
+        (기록 이후 커밋된 수정은 캐시된 페이지를 무효화)
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+        if collecting_page_tags(self.request):
+            ids = queryset.filter(slug=self.kwargs[self.slug_url_kwarg])\
+                .values_list('pk', 'author_id', 'category_id').first()
+            if ids is not None:
+                pk, author_id, category_id = ids
+                add_page_tags(self.request, f'post:{pk}', f'user:{author_id}', f'category:{category_id}')
         obj = super().get_object(queryset)
         obj.increase_views()
         return obj
@@ -112,13 +179,22 @@ class PostDetailView(DetailView):
     def get_context_data(self, **kwargs):
         """추가 컨텍스트: 댓글, 관련 게시글"""
         context = super().get_context_data(**kwargs)
-        # 활성 댓글만 (부모 댓글만, 대댓글은 템플릿에서 처리)
-        context['comments'] = self.object.comments.filter(
-            is_active=True, parent__isnull=True
-        ).select_related('author').prefetch_related('replies')
+        # 활성 댓글 트리 (댓글 수와 무관하게 1회 조회)
+        thread = load_comment_tree(self.object, self.request.user)
+        context['comments'] = thread.roots
+        context['liked_comment_ids'] = thread.liked_ids
+        context['disliked_comment_ids'] = thread.disliked_ids
+        # 현재 사용자의 좋아요/싫어요/북마크 여부 (관계 전체를 읽지 않음)
+        context['viewer_state'] = get_viewer_state(self.request.user, post_ids=[self.object.pk])
         context['comment_form'] = CommentForm()
         context['related_posts'] = self.object.get_related_posts()
         return context
+    
+    def render_to_response(self, context, **response_kwargs):
+        """페이지 캐시 사용 시 조회수 기록용 게시글 ID"""
+        response = super().render_to_response(context, **response_kwargs)
+        response.page_cache_meta = {'post_id': self.object.pk}
+        return response
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -195,7 +271,8 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-class CategoryDetailView(ListView):
+@method_decorator(cache_page_for_anonymous(tags=['category:list']), name='dispatch')
+class CategoryDetailView(KeysetPaginationMixin, PopularPostsMixin, ListView):
     """
     카테고리별 게시글 목록 뷰
     """
@@ -205,17 +282,24 @@ class CategoryDetailView(ListView):
     paginate_by = 10
     
     def get_queryset(self):
-        self.category = get_object_or_404(Category, slug=self.kwargs['slug'])
+        self.category = get_category_or_404(self.kwargs['slug'])
+        if collecting_page_tags(self.request):
+            # 조회 캐시의 카테고리는 태그 기록 전 값일 수 있으므로 기록 후 다시 읽음
+            pk = self.category.pk
+            add_page_tags(self.request, f'category:{pk}', f'category:{pk}:posts')
+            self.category = get_object_or_404(Category, pk=pk, slug=self.kwargs['slug'])
         return Post.objects.filter(
             category=self.category, published=True
-        ).select_related('author')
+        ).select_related('author').for_list().order_by('-created_at', '-id')
+    
+    def get_popular_posts_category(self):
+        """카테고리별 인기 게시글"""
+        return self.category
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['category'] = self.category
-        context['categories'] = Category.objects.all()
-        # 인기 게시글 (조회수 상위 5개)
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
+        context['categories'] = get_categories()
         return context
 
 
@@ -242,7 +326,9 @@ def add_comment(request, slug):
                 parent = get_object_or_404(Comment, id=parent_id)
                 comment.parent = parent
             
-            comment.save()
+            with transaction.atomic():
+                comment.save()
+                adjust_post_counters(post.pk, comment_count=1)
             messages.success(request, '댓글이 작성되었습니다.')
     
     return redirect('blog:post_detail', slug=slug)
@@ -260,8 +346,12 @@ def delete_comment(request, comment_id):
     if comment.author != request.user and not request.user.is_staff:
         messages.error(request, '본인의 댓글만 삭제할 수 있습니다.')
     else:
-        comment.is_active = False
-        comment.save()
+        with transaction.atomic():
+            was_active = comment.is_active
+            comment.is_active = False
+            comment.save()
+            if was_active:
+                adjust_post_counters(comment.post_id, comment_count=-1)
         messages.success(request, '댓글이 삭제되었습니다.')
     
     return redirect('blog:post_detail', slug=comment.post.slug)
@@ -283,100 +373,45 @@ class CategoryCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
 
+def _reaction_response(result, key):
+    """좋아요/싫어요 토글 응답"""
+    return JsonResponse({
+        key: result.liked if key == 'liked' else result.disliked,
+        'likes_count': result.likes_count,
+        'dislikes_count': result.dislikes_count
+    })
+
+
 @login_required
 @require_POST
 def toggle_post_like(request, slug):
     """게시글 좋아요 토글"""
-    post = get_object_or_404(Post, slug=slug)
-    user = request.user
-    
-    if post.dislikes.filter(id=user.id).exists():
-        post.dislikes.remove(user)
-    
-    if post.likes.filter(id=user.id).exists():
-        post.likes.remove(user)
-        liked = False
-    else:
-        post.likes.add(user)
-        liked = True
-        
-    return JsonResponse({
-        'liked': liked,
-        'likes_count': post.likes.count(),
-        'dislikes_count': post.dislikes.count()
-    })
+    post = get_object_or_404(Post.objects.only('id'), slug=slug)
+    return _reaction_response(toggle_reaction(post, request.user, LIKE), 'liked')
 
 
 @login_required
 @require_POST
 def toggle_post_dislike(request, slug):
     """게시글 싫어요 토글"""
-    post = get_object_or_404(Post, slug=slug)
-    user = request.user
-    
-    if post.likes.filter(id=user.id).exists():
-        post.likes.remove(user)
-    
-    if post.dislikes.filter(id=user.id).exists():
-        post.dislikes.remove(user)
-        disliked = False
-    else:
-        post.dislikes.add(user)
-        disliked = True
-        
-    return JsonResponse({
-        'disliked': disliked,
-        'likes_count': post.likes.count(),
-        'dislikes_count': post.dislikes.count()
-    })
+    post = get_object_or_404(Post.objects.only('id'), slug=slug)
+    return _reaction_response(toggle_reaction(post, request.user, DISLIKE), 'disliked')
 
 
 @login_required
 @require_POST
 def toggle_comment_like(request, comment_id):
     """댓글 좋아요 토글"""
-    comment = get_object_or_404(Comment, id=comment_id)
-    user = request.user
-    
-    if comment.dislikes.filter(id=user.id).exists():
-        comment.dislikes.remove(user)
-    
-    if comment.likes.filter(id=user.id).exists():
-        comment.likes.remove(user)
-        liked = False
-    else:
-        comment.likes.add(user)
-        liked = True
-        
-    return JsonResponse({
-        'liked': liked,
-        'likes_count': comment.likes.count(),
-        'dislikes_count': comment.dislikes.count()
-    })
+    comment = get_object_or_404(Comment.objects.only('id'), id=comment_id)
+    return _reaction_response(toggle_reaction(comment, request.user, LIKE), 'liked')
 
 
 @login_required
 @require_POST
 def toggle_comment_dislike(request, comment_id):
     """댓글 싫어요 토글"""
-    comment = get_object_or_404(Comment, id=comment_id)
-    user = request.user
-    
-    if comment.likes.filter(id=user.id).exists():
-        comment.likes.remove(user)
-    
-    if comment.dislikes.filter(id=user.id).exists():
-        comment.dislikes.remove(user)
-        disliked = False
-    else:
-        comment.dislikes.add(user)
-        disliked = True
-        
-    return JsonResponse({
-        'disliked': disliked,
-        'likes_count': comment.likes.count(),
-        'dislikes_count': comment.dislikes.count()
-    })
+    comment = get_object_or_404(Comment.objects.only('id'), id=comment_id)
+    return _reaction_response(toggle_reaction(comment, request.user, DISLIKE), 'disliked')
 
 
 @login_required
@@ -386,26 +421,105 @@ def toggle_bookmark(request, slug):
     post = get_object_or_404(Post, slug=slug)
     user = request.user
     
-    bookmark, created = Bookmark.objects.get_or_create(user=user, post=post)
-    
-    if not created:
-        bookmark.delete()
-        saved = False
-    else:
-        saved = True
+    with transaction.atomic():
+        bookmark, created = Bookmark.objects.get_or_create(user=user, post=post)
         
+        if not created:
+            bookmark.delete()
+            saved = False
+            adjust_post_counters(post.pk, bookmark_count=-1)
+        else:
+            saved = True
+            adjust_post_counters(post.pk, bookmark_count=1)
+        
+    invalidate_viewer_state(user)
     return JsonResponse({
         'saved': saved,
         'message': '북마크에 저장되었습니다.' if saved else '북마크가 취소되었습니다.'
     })
 
 
+VIEWER_STATE_MAX_IDS = 100
+
+
+def _parse_ids(value):
+    """'1,2,3' 형식의 ID 목록 파싱"""
+    if not value:
+        return []
+    return [int(pk) for pk in value.split(',') if pk.strip()]
+
+
+def _viewer_profile(request):
+    """사용자 메뉴/알림 수/CSRF 토큰 (캐시된 페이지의 사용자별 영역 채우기용)"""
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    avatar = user.avatar[28]
+    return {
+        'id': user.pk,
+        'username': user.username,
+        'is_staff': user.is_staff,
+        'profile_url': reverse('accounts:profile', args=[user.username]),
+        'avatar': {'src': avatar.src, 'srcset': avatar.srcset} if avatar else None,
+        'unread_notifications': get_unread_count(user.pk),
+    }
+
+
+@never_cache
+def viewer_state(request):
+    """
+    사용자 상태 일괄 조회 API (페이지 캐시의 사용자별 영역 채우기, static/js/main.js)
+
+    GET ?posts=1,2,3&comments=4,5
+    응답: {"user": {"id", "username", "is_staff", "profile_url", "avatar", "unread_notifications"},
+           "csrf_token": "...",
+           "posts": {"1": {"liked": ..., "disliked": ..., "bookmarked": ...}},
+           "comments": {"4": {"liked": ..., "disliked": ...}}}
+    비로그인 사용자는 user/csrf_token 이 null, 반응 상태는 모두 false
+    """
+    try:
+        post_ids = _parse_ids(request.GET.get('posts'))
+        comment_ids = _parse_ids(request.GET.get('comments'))
+    except ValueError:
+        return JsonResponse({'error': 'ID 목록 형식이 올바르지 않습니다.'}, status=400)
+    if len(post_ids) > VIEWER_STATE_MAX_IDS or len(comment_ids) > VIEWER_STATE_MAX_IDS:
+        return JsonResponse(
+            {'error': f'한 번에 최대 {VIEWER_STATE_MAX_IDS}개까지 조회할 수 있습니다.'}, status=400
+        )
+    state = get_viewer_state(request.user, post_ids=post_ids, comment_ids=comment_ids)
+    profile = _viewer_profile(request)
+    return JsonResponse({
+        'user': profile,
+        'csrf_token': get_token(request) if profile else None,
+        **state.as_dict(),
+    })
+
+
+@guarded_cache('dashboard:activity', ttl=getattr(settings, 'DASHBOARD_CACHE_TTL', 60))
+def _dashboard_activity(days):
+    """일별 활동 차트 (최대 조회수 대비 비율 포함, 재계산 보호 캐시)"""
+    activity = analytics.site_series(days=days)
+    peak = max([day['views'] for day in activity] + [1])
+    for day in activity:
+        day['percent'] = round(max(day['views'], 0) * 100 / peak)
+    return activity
+
+
+@guarded_cache('dashboard:top_posts', ttl=getattr(settings, 'DASHBOARD_CACHE_TTL', 60))
+def _dashboard_top_posts(days, limit):
+    """기간 인기 게시글 (재계산 보호 캐시)"""
+    return analytics.top_posts(days=days, limit=limit)
+
+
 class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
     """
     관리자 대시보드 뷰
     
     기능:
     - 전체 게시글, 댓글, 사용자, 조회수 통계 표시
+      (blog.site_stats, 통계별 마지막 재계산/갱신 시각 포함)
+    - 최근 30일 일별 활동 차트, 최근 7일 인기 게시글, 게시글별 14일 조회수 추이
+      (blog.analytics 집계 테이블만 조회, DASHBOARD_CACHE_TTL 초 캐시)
     - 최근 게시글 현황 목록
     - 관리자 퀵 메뉴 제공
     """
@@ -417,45 +531,74 @@ class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        from accounts.models import User
         
-        # 기본 통계
-        context['total_posts'] = Post.objects.count()
-        context['total_comments'] = Comment.objects.filter(is_active=True).count()
-        context['total_users'] = User.objects.count()
-        context['total_views'] = Post.objects.aggregate(Sum('views'))['views__sum'] or 0
+        # 기본 통계 (집계 쿼리 없이 SiteStat 조회)
+        stats = site_stats.get_stats()
+        context['site_stats'] = stats
+        context['total_posts'] = stats['posts']
+        context['total_comments'] = stats['active_comments']
+        context['total_users'] = stats['users']
+        context['total_views'] = stats['views']
+        
+        # 최근 게시글 (미발행 포함) + 14일 조회수 스파크라인
+        recent_posts = list(
+            Post.objects.select_related('author', 'category').for_list().order_by('-created_at')[:10]
+        )
+        series = analytics.post_series([post.pk for post in recent_posts], days=14)
+        for post in recent_posts:
+            post.sparkline = analytics.sparkline_points(series[post.pk], width=80, height=20)
+            post.recent_views = sum(series[post.pk])
+        context['recent_posts'] = recent_posts
         
-        # 최근 게시글 (미발행 포함)
-        context['recent_posts'] = Post.objects.select_related('author', 'category')\
-            .order_by('-created_at')[:10]
+        # 일별 활동 차트 (최근 30일) / 최근 7일 인기 게시글
+        context['activity'] = _dashboard_activity(30)
+        context['top_posts_week'] = _dashboard_top_posts(7, 5)
         
         # 최근 댓글
         context['recent_comments'] = Comment.objects.select_related('author', 'post')\
             .filter(is_active=True).order_by('-created_at')[:10]
+        
+        # 조회수 버퍼 상태 (현재 워커 기준)
+        context['view_counter'] = view_buffer.metrics()
             
         return context
 
 
+@login_required
+def view_counter_metrics(request):
+    """조회수 버퍼 지표 API (관리자 전용, 현재 워커 기준)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    return JsonResponse(view_buffer.metrics())
+
+
+@login_required
+def cache_metrics(request):
+    """2단계 캐시 계층별 적중률 / 재계산 보호 / 읽기 전용 모드 지표 API (관리자 전용, 현재 워커 기준)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    return JsonResponse({
+        **tiered_cache_metrics(),
+        'recompute': recompute_metrics(),
+        'degraded': breaker.metrics(),
+    })
+
+
 # ==================== 태그 관련 뷰 ====================
 
-class TagListView(ListView):
+@method_decorator(cache_page_for_anonymous(tags=['tag:list']), name='dispatch')
+class TagListView(PopularPostsMixin, ListView):
     """태그 목록 뷰 (태그 클라우드)"""
     model = Tag
     template_name = 'blog/tag_list.html'
     context_object_name = 'tags'
     
     def get_queryset(self):
-        return Tag.objects.annotate(
-            post_count=Count('posts', filter=Q(posts__published=True))
-        ).filter(post_count__gt=0).order_by('-post_count')
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
-        return context
+        return get_tags()
 
 
-class TagDetailView(ListView):
+@method_decorator(cache_page_for_anonymous(), name='dispatch')
+class TagDetailView(KeysetPaginationMixin, PopularPostsMixin, ListView):
     """태그별 게시글 목록 뷰"""
     model = Post
     template_name = 'blog/tag_detail.html'
@@ -463,48 +606,72 @@ class TagDetailView(ListView):
     paginate_by = 10
     
     def get_queryset(self):
-        self.tag = get_object_or_404(Tag, slug=self.kwargs['slug'])
+        self.tag = get_tag_or_404(self.kwargs['slug'])
+        if collecting_page_tags(self.request):
+            # 조회 캐시의 태그는 태그 기록 전 값일 수 있으므로 기록 후 다시 읽음
+            pk = self.tag.pk
+            add_page_tags(self.request, f'tag:{pk}', f'tag:{pk}:posts')
+            self.tag = get_object_or_404(Tag, pk=pk, slug=self.kwargs['slug'])
         return Post.objects.filter(
             tags=self.tag, published=True
-        ).select_related('author', 'category').order_by('-created_at')
+        ).select_related('author', 'category').for_list().order_by('-created_at', '-id')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['tag'] = self.tag
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
         return context
 
 
+# ==================== 팔로잉 피드 ====================
+
+class FollowingFeedView(LoginRequiredMixin, KeysetPaginationMixin, PopularPostsMixin, ListView):
+    """팔로잉 피드 (팔로우한 작성자의 게시글, blog.timeline)"""
+    template_name = 'blog/following_feed.html'
+    context_object_name = 'entries'
+    paginate_by = 10
+
+    def get_queryset(self):
+        timeline.pull(self.request.user.pk)
+        return timeline.feed_queryset(self.request.user)
+
+
 # ==================== 시리즈 관련 뷰 ====================
 
-class SeriesListView(ListView):
+@method_decorator(cache_page_for_anonymous(tags=['series:list']), name='dispatch')
+class SeriesListView(PopularPostsMixin, ListView):
     """시리즈 목록 뷰"""
     model = PostSeries
     template_name = 'blog/series_list.html'
     context_object_name = 'series_list'
     
     def get_queryset(self):
-        return PostSeries.objects.annotate(
-            post_count=Count('posts', filter=Q(posts__published=True))
-        ).filter(post_count__gt=0).select_related('author').order_by('-updated_at')
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
-        return context
+        return get_series_list()
 
 
-class SeriesDetailView(DetailView):
+@method_decorator(cache_page_for_anonymous(), name='dispatch')
+class SeriesDetailView(PopularPostsMixin, DetailView):
     """시리즈 상세 뷰 (목차 포함)"""
     model = PostSeries
     template_name = 'blog/series_detail.html'
     context_object_name = 'series'
     slug_url_kwarg = 'slug'
     
+    def get_object(self, queryset=None):
+        series = get_series_or_404(self.kwargs['slug'])
+        if collecting_page_tags(self.request):
+            # 조회 캐시의 시리즈는 태그 기록 전 값일 수 있으므로 기록 후 다시 읽음
+            pk = series.pk
+            add_page_tags(
+                self.request, f'series:{pk}', f'series:{pk}:posts', f'user:{series.author_id}'
+            )
+            series = get_object_or_404(
+                PostSeries.objects.select_related('author'), pk=pk, slug=self.kwargs['slug']
+            )
+        return series
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['posts'] = self.object.get_posts()
-        context['popular_posts'] = Post.objects.filter(published=True).order_by('-views')[:5]
         return context
 
 
@@ -531,7 +698,7 @@ def draft_list(request):
     drafts = Post.objects.filter(
         author=request.user,
         is_draft=True
-    ).order_by('-draft_saved_at', '-updated_at')
+    ).for_list().order_by('-draft_saved_at', '-updated_at')
     
     return render(request, 'blog/draft_list.html', {
         'drafts': drafts
@@ -9,9 +9,22 @@ Django 블로그 프로젝트 설정 파일
 - 앱 설정 (INSTALLED_APPS)
 - 미들웨어 설정
 - 데이터베이스 설정 (PostgreSQL)
+- 캐시 설정 (Redis, 워커 메모리 2단계 캐시, 재계산 보호)
 - 인증 설정
 - 정적 파일 설정
 - REST Framework 설정
+- 조회수 버퍼 설정
+- 인기 게시글 리더보드 설정
+- 사용자 반응 상태 캐시 설정
+- 알림 설정
+- 팔로잉 피드 설정
+- 관련 게시글 설정
+- 사이트 통계 설정
+- 게시글 활동 통계 설정
+- 썸네일 파생 이미지 설정 (프로필 이미지 크기별 파일 포함)
+- 본문 인라인 이미지 설정
+- 전체 페이지 캐시 설정
+- DB 장애 시 읽기 전용 모드 설정
 - 보안 설정
 """
 
@@ -78,6 +91,8 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     # 공통 미들웨어
     'django.middleware.common.CommonMiddleware',
+    # DB 장애 시 읽기 전용 모드 (보관된 응답 사용, 쓰기 즉시 503)
+    'blog.degraded.DegradedModeMiddleware',
     # CSRF 보호
     'django.middleware.csrf.CsrfViewMiddleware',
     # 인증 미들웨어
@@ -105,6 +120,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'accounts.context_processors.notifications',
             ],
         },
     },
@@ -132,6 +148,49 @@ DATABASES = {
     }
 }
 
+# ===========================================
+# 캐시 설정 (Redis)
+# ===========================================
+
+# gunicorn 워커 간 공유 캐시 (DRF 스로틀, 리더보드, 알림 수, 페이지 캐시 등)
+# REDIS_URL 이 없으면 (로컬 개발) 프로세스별 메모리 캐시
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'blog',
+            'TIMEOUT': 300,
+        }
+    }
+    # 세션도 캐시 우선 조회 (DB 는 영속 저장용)
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'blog',
+        }
+    }
+
+# 2단계 캐시 (blog.tiered_cache): 워커 메모리 LRU (L1) → CACHES['default'] (L2)
+# 카테고리 목록, 태그/시리즈 조회 등 작고 자주 읽는 객체용
+TIERED_CACHE_L1_MAX_ENTRIES = 1000              # 워커당 최대 항목 수
+TIERED_CACHE_L1_MAX_BYTES = 4 * 1024 * 1024     # 워커당 최대 크기 (pickle 기준 바이트)
+TIERED_CACHE_L1_TTL = 60                        # L1 항목 유지 시간 (초)
+TIERED_CACHE_L2_TTL = 3600                      # L2 항목 유지 시간 (초)
+TIERED_CACHE_VERSION_CHECK_INTERVAL = 2         # 무효화 여부(버전) 확인 주기 (초, 다른 워커 반영 지연)
+
+# 재계산 보호 (blog.recompute): 인기 게시글, 태그/시리즈 목록, 관리자 대시보드 집계
+RECOMPUTE_LOCK_TIMEOUT = 30     # 재계산 잠금 유지 시간 (초, 계산 중 워커가 죽어도 이후 해제)
+RECOMPUTE_WAIT = 2              # 이전 값이 없을 때 이보다 오래 기다린 요청은 wait_timeouts 로 집계 (초, 잠금이 풀릴 때까지 계속 기다림)
+RECOMPUTE_STALE_TTL = 60        # 만료 후 재계산 중 사용할 이전 값 보관 시간 (초)
+RECOMPUTE_BETA = 1.0            # 확률적 조기 갱신 강도 (0 이면 만료 시에만 재계산)
+RECOMPUTE_JITTER = 0.1          # TTL 분산 비율 (최대 10% 단축)
+DASHBOARD_CACHE_TTL = 60        # 관리자 대시보드 활동 차트/인기 게시글 캐시 시간 (초)
+
 # ===========================================
 # 커스텀 사용자 모델
 # ===========================================
@@ -207,8 +266,8 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
-    # 페이지네이션
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # 페이지네이션 (키셋 커서, ?cursor=)
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
     # 필터링
     'DEFAULT_FILTER_BACKENDS': [
@@ -227,6 +286,126 @@ REST_FRAMEWORK = {
     },
 }
 
+# ===========================================
+# 조회수 버퍼 설정
+# ===========================================
+
+# 조회수를 메모리에 모았다가 일괄 반영하는 주기 (초, 0이면 즉시 반영)
+VIEW_COUNT_FLUSH_INTERVAL = config('VIEW_COUNT_FLUSH_INTERVAL', default=10, cast=int)
+# 누적 조회수가 이 값에 도달하면 주기와 상관없이 즉시 반영
+VIEW_COUNT_MAX_PENDING = config('VIEW_COUNT_MAX_PENDING', default=1000, cast=int)
+
+# ===========================================
+# 인기 게시글 리더보드 설정
+# ===========================================
+
+POPULAR_POSTS_LIMIT = 5     # 사이드바 표시 개수
+LEADERBOARD_SIZE = 20       # 캐시에 유지하는 상위 게시글 수 (증분 갱신 여유분)
+LEADERBOARD_TTL = 300       # 캐시 유지 시간 (초)
+
+# ===========================================
+# 사용자 반응 상태 캐시 설정
+# ===========================================
+
+VIEWER_STATE_TTL = 300      # 게시글/댓글별 좋아요/싫어요/북마크 여부 캐시 시간 (초)
+
+# ===========================================
+# 알림 설정
+# ===========================================
+
+NOTIFICATION_UNREAD_TTL = 300           # 읽지 않은 알림 수 캐시 시간 (초, 만료 시 DB 기준으로 보정)
+
+NOTIFICATION_FANOUT_BATCH_SIZE = 1000   # 배치당 팔로워 수 (bulk_create 1회)
+NOTIFICATION_FANOUT_ASYNC = True        # False 이면 커밋 직후 요청 스레드에서 발송
+NOTIFICATION_FANOUT_STALE_AFTER = 300   # 진행 기록이 끊긴 작업을 재시도 대상으로 보는 시간 (초)
+NOTIFICATION_FANOUT_RESUME_INTERVAL = 60  # 요청 처리 중 중단된 발송 작업 자동 재개 주기 (초, 0 이면 끔)
+NOTIFICATION_FANOUT_MAX_ATTEMPTS = 5    # 자동 재개 최대 실행 횟수 (넘으면 fanout_notifications 로 수동 실행)
+
+# ===========================================
+# 팔로잉 피드 설정
+# ===========================================
+
+TIMELINE_SIZE = 500                     # 사용자별 피드 최대 항목 수
+TIMELINE_BACKFILL = 50                  # 팔로우 시 가져오는 작성자의 최근 게시글 수
+TIMELINE_FANOUT_MAX_FOLLOWERS = 10000   # 이보다 팔로워가 많으면 발행 시 넣지 않고 피드 조회 시 반영
+TIMELINE_PULL_INTERVAL = 60             # 피드 조회 시 반영 주기 (초, 사용자별)
+TIMELINE_TRIM_SLACK = 50                # 발행/팔로우로 피드가 TIMELINE_SIZE 보다 이만큼 넘치면 정리
+
+# ===========================================
+# 관련 게시글 설정
+# ===========================================
+
+RELATED_POSTS_COUNT = 10    # 게시글당 저장하는 관련 게시글 수 (TF-IDF 유사도 상위)
+RELATED_POSTS_ASYNC = True  # False 이면 커밋 직후 요청 스레드에서 색인 갱신
+RELATED_INDEX_TTL = 60 * 60         # 증분 갱신용 색인을 전체 다시 읽는 주기 (초, IDF 반영)
+RELATED_INDEX_MAX_CHANGES = 500     # 마지막 전체 로드 이후 바뀐 게시글이 이보다 많으면 전체 다시 읽음
+
+# ===========================================
+# 사이트 통계 설정
+# ===========================================
+
+SITE_STATS_RECONCILE_INTERVAL = 3600    # 조회 시 이보다 오래된 통계는 DB 기준으로 재계산 (초)
+SITE_STATS_ASYNC = True                 # False 이면 재계산을 요청 스레드에서 실행
+
+# ===========================================
+# 게시글 활동 통계 설정
+# ===========================================
+
+ANALYTICS_FLUSH_INTERVAL = 60           # 조회/좋아요/댓글/북마크 증감을 시간별 집계에 반영하는 주기 (초)
+ANALYTICS_MAX_PENDING = 5000            # 누적 증감 건수가 이 값에 도달하면 즉시 반영
+ANALYTICS_HOURLY_RETENTION_DAYS = 2     # 시간별 집계 보관 일수 (오늘 포함, 이후 일별로 합침)
+ANALYTICS_COMPACT_INTERVAL = 3600       # 시간별 → 일별 합치기 실행 주기 (초)
+ANALYTICS_ASYNC = True                  # False 이면 합치기를 flush 스레드에서 바로 실행
+
+# ===========================================
+# 썸네일 파생 이미지 설정
+# ===========================================
+
+THUMBNAIL_WIDTHS = (320, 640, 1280)             # 생성 너비 (원본보다 큰 너비는 원본 너비로)
+THUMBNAIL_FORMATS = ('avif', 'webp', 'jpeg')    # Pillow 가 지원하지 않는 포맷은 건너뜀
+THUMBNAIL_QUALITY = {'avif': 50, 'webp': 75, 'jpeg': 80}
+THUMBNAIL_DEFAULT_WIDTH = 640                   # srcset 미지원 브라우저용 <img src> 너비
+THUMBNAIL_PROCESSES = 2                         # 디코딩/인코딩 프로세스 수 (0 이면 작업 스레드에서 직접 변환)
+THUMBNAIL_ASYNC = True                          # False 이면 커밋 직후 요청 스레드에서 생성 (프로필 이미지 포함)
+
+# 프로필 이미지: 템플릿에서 쓰는 크기 (px, 크기마다 1x / 2x WebP)
+# media/avatars/ 파일명에 내용 해시가 들어가므로 웹 서버에서 Cache-Control: immutable 로 제공
+AVATAR_SIZES = (24, 28, 32, 48, 60, 80, 150)
+AVATAR_QUALITY = 80
+AVATAR_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+
+# ===========================================
+# 본문 인라인 이미지 설정
+# ===========================================
+
+# 본문에 붙여넣은 base64 이미지를 저장할 디렉토리 (MEDIA_ROOT 기준, 파일명은 내용 해시)
+INLINE_IMAGE_DIR = 'posts/inline'
+
+# ===========================================
+# 전체 페이지 캐시 설정
+# ===========================================
+
+# 홈/게시글 목록/상세/카테고리/태그/시리즈 페이지 HTML 캐시 (blog.page_cache)
+# 비로그인 요청의 렌더링 결과만 저장, 사용자별 영역은 blog:viewer_state JSON 으로 채움
+PAGE_CACHE_ENABLED = config('PAGE_CACHE_ENABLED', default=True, cast=bool)
+PAGE_CACHE_TIMEOUT = 60     # 캐시 유지 시간 (초, 게시글/댓글/분류 변경 시 즉시 무효화)
+
+# ===========================================
+# DB 장애 시 읽기 전용 모드 설정
+# ===========================================
+
+# 비로그인 GET 응답 (페이지, 읽기 API) 을 보관하여 DB 지연/장애 중 stale 표시하여 응답 (blog.degraded)
+DEGRADED_MODE_ENABLED = config('DEGRADED_MODE_ENABLED', default=True, cast=bool)
+DEGRADED_SLOW_QUERY_MS = 1000           # 이 시간 이상 걸린 쿼리는 실패로 집계 (밀리초)
+DEGRADED_FAILURE_THRESHOLD = 3          # 연속 실패 횟수 도달 시 장애 모드
+DEGRADED_COOLDOWN = 30                  # 장애 모드 유지 시간 (초, DB 확인 성공 시 조기 해제)
+DEGRADED_PROBE_INTERVAL = 5             # 장애 중 DB 상태 확인 주기 (초, 전체 워커 기준)
+DEGRADED_CHECK_INTERVAL = 1             # 워커가 공유 장애 상태를 다시 읽는 주기 (초)
+DEGRADED_STALE_TTL = 60 * 60 * 24       # 보관 응답 유지 시간 (초)
+DEGRADED_REFRESH_INTERVAL = 60          # 같은 URL 응답을 다시 보관하는 최소 간격 (초)
+DEGRADED_API_PREFIX = '/api/'           # Accept 헤더별로 보관하는 읽기 API 경로
+DEGRADED_EXCLUDED_PATHS = ('/admin/', '/accounts/', '/api/auth/', '/blog/api/')  # 보관하지 않는 경로 (사용자별 응답)
+
 # ===========================================
 # CORS 설정
 # ===========================================
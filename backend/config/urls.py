@@ -4,29 +4,44 @@ Django 블로그 프로젝트 URL 설정
 프로젝트 레벨 URL 라우팅
 """
 
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.shortcuts import render
+from django.views.static import serve
 
-from blog.models import Post, Category, Comment
-from accounts.models import User
+from blog.models import Post
+from blog.page_cache import cache_page_for_anonymous
+from blog.site_stats import get_stats
+from blog.taxonomy import get_categories
 
 
+@cache_page_for_anonymous(tags=['post:list', 'category:list'])
 def home_view(request):
-    """홈페이지 뷰 - 최신 게시글, 카테고리, 통계 표시"""
+    """홈페이지 뷰 - 최신 게시글, 카테고리, 통계 표시 (통계는 blog.site_stats, 페이지 캐시 blog.page_cache)"""
+    stats = get_stats()
     context = {
         'latest_posts': Post.objects.filter(published=True)
-            .select_related('author', 'category')[:4],
-        'categories': Category.objects.all(),
-        'total_posts': Post.objects.filter(published=True).count(),
-        'total_comments': Comment.objects.filter(is_active=True).count(),
-        'total_users': User.objects.filter(is_active=True).count(),
+            .select_related('author', 'category').for_list()[:4],
+        'categories': get_categories(),
+        'total_posts': stats['published_posts'].value,
+        'total_comments': stats['active_comments'].value,
+        'total_users': stats['active_users'].value,
     }
     return render(request, 'home.html', context)
 
 
+def immutable_media(request, path):
+    """내용 해시가 포함된 미디어 파일 (개발 환경, 운영은 웹 서버 설정)"""
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    max_age = getattr(settings, 'AVATAR_CACHE_MAX_AGE', 60 * 60 * 24 * 365)
+    response['Cache-Control'] = f'public, max-age={max_age}, immutable'
+    return response
+
+
 urlpatterns = [
     # 관리자 페이지
     path('admin/', admin.site.urls),
@@ -48,7 +63,14 @@ urlpatterns = [
 ]
 
 # 개발 환경에서 미디어 파일 서빙
+# (프로필 이미지 크기별 파일은 내용 해시가 URL 에 포함되므로 immutable 캐시, accounts.avatars)
 if settings.DEBUG:
+    urlpatterns += [
+        re_path(
+            r'^%s(?P<path>avatars/.*)$' % re.escape(settings.MEDIA_URL.lstrip('/')),
+            immutable_media,
+        ),
+    ]
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
@@ -0,0 +1,21 @@
+"""
+Gunicorn 설정
+=============
+프로덕션 WSGI 서버 설정
+
+워커 종료 시 메모리에 남은 조회수/활동 통계를 DB에 반영 (blog.view_counter, blog.analytics)
+"""
+
+bind = '0.0.0.0:8000'
+workers = 3
+
+
+def worker_exit(server, worker):
+    """워커 종료 직전 조회수/활동 통계 버퍼 flush"""
+    try:
+        from blog.view_counter import view_buffer
+        from blog.analytics import activity_buffer
+    except Exception:
+        return
+    view_buffer.shutdown()
+    activity_buffer.shutdown()
@@ -255,59 +255,8 @@ document.addEventListener('DOMContentLoaded', function () {
         });
     });
 
-    // ===========================================
-    // 예상 읽기 시간 계산
-    // ===========================================
-
+    // 예상 읽기 시간과 목차는 저장 시 서버에서 생성 (blog.rendering)
     const postContent = document.querySelector('.post-content');
-    const readingTimeValue = document.getElementById('readingTimeValue');
-    const readingTime = document.getElementById('readingTime');
-    if (postContent && readingTimeValue && readingTime) {
-        const text = postContent.innerText;
-        const wpm = 225; // 평균 읽기 속도
-        const words = text.trim().split(/\s+/).length;
-        const time = Math.ceil(words / wpm);
-
-        if (words > 0 && words < wpm) {
-            readingTime.innerHTML = '<i class="bi bi-clock-history me-1"></i>예상 읽기 시간 1분 미만';
-        } else {
-            readingTimeValue.innerText = time;
-        }
-    }
-
-
-    // ===========================================
-    // 목차 (TOC) 자동 생성
-    // ===========================================
-    const tocContainer = document.querySelector('.toc-container');
-    if (postContent && tocContainer) {
-        const headings = postContent.querySelectorAll('h2, h3');
-        if (headings.length > 0) {
-            const tocList = document.createElement('nav');
-            tocList.className = 'toc-list mb-3';
-            headings.forEach((heading, index) => {
-                const id = `heading-${index}`;
-                heading.id = id;
-                const link = document.createElement('a');
-                link.href = `#${id}`;
-                link.innerText = heading.innerText;
-                link.className = `toc-link toc-${heading.tagName.toLowerCase()}`;
-
-                // 스크롤 이동 시 부드럽게
-                link.addEventListener('click', (e) => {
-                    e.preventDefault();
-                    heading.scrollIntoView({ behavior: 'smooth' });
-                });
-
-                tocList.appendChild(link);
-            });
-            tocContainer.innerHTML = '<h6 class="mb-3">목차</h6>';
-            tocContainer.appendChild(tocList);
-        } else {
-            const sideCard = tocContainer.closest('.card');
-            if (sideCard) sideCard.style.display = 'none';
-        }
-    }
 
     // ===========================================
     // 텍스트 하이라이트 시스템
@@ -379,5 +328,68 @@ document.addEventListener('DOMContentLoaded', function () {
         }
     }
 
+    // ===========================================
+    // 사용자별 영역 채우기 (전체 페이지 캐시)
+    // ===========================================
+    // 캐시된 페이지는 비로그인 상태로 렌더링되어 있으므로
+    // 로그인 흔적(CSRF 쿠키)이 있으면 사용자 상태 JSON 1회 조회로 채움 (blog.page_cache)
+    const pageBody = document.body;
+    const hasCsrfCookie = document.cookie.split('; ').some(c => c.startsWith('csrftoken='));
+
+    function applyPageState(state) {
+        const user = state.user;
+        if (!user) return;
+
+        pageBody.dataset.authenticated = 'true';
+        pageBody.dataset.userId = user.id;
+        pageBody.dataset.csrfToken = state.csrf_token;
+
+        document.querySelectorAll('[data-auth="user"]').forEach(el => { el.hidden = false; });
+        document.querySelectorAll('[data-auth="anon"]').forEach(el => { el.hidden = true; });
+        document.querySelectorAll('[data-auth="staff"]').forEach(el => { el.hidden = !user.is_staff; });
+        document.querySelectorAll('[data-owner]').forEach(el => {
+            el.hidden = el.dataset.owner !== String(user.id);
+        });
+        document.querySelectorAll('[data-user-field]').forEach(el => {
+            el.textContent = user[el.dataset.userField];
+        });
+        document.querySelectorAll('[data-user-href]').forEach(el => {
+            el.href = user[el.dataset.userHref];
+        });
+        document.querySelectorAll('[data-user-avatar]').forEach(img => {
+            if (user.avatar) {
+                img.src = user.avatar.src;
+                img.srcset = user.avatar.srcset;
+            }
+            img.hidden = !user.avatar;
+        });
+        document.querySelectorAll('[data-user-avatar-fallback]').forEach(el => { el.hidden = !!user.avatar; });
+        document.querySelectorAll('[data-unread-count]').forEach(el => {
+            el.textContent = user.unread_notifications;
+            el.hidden = user.unread_notifications === 0;
+        });
+        document.querySelectorAll('input[name="csrfmiddlewaretoken"]').forEach(input => {
+            if (!input.value) input.value = state.csrf_token;
+        });
+
+        // 페이지별 스크립트에서 반응 상태 반영 (post_detail.html 등)
+        document.dispatchEvent(new CustomEvent('pagestate', { detail: state }));
+    }
+
+    if (pageBody.dataset.authenticated !== 'true' && hasCsrfCookie && pageBody.dataset.pageStateUrl) {
+        const ids = (attr) => [...new Set(
+            [...document.querySelectorAll(`[${attr}]`)].map(el => el.getAttribute(attr))
+        )].slice(0, 100).join(',');
+        const params = new URLSearchParams({
+            posts: ids('data-viewer-post'),
+            comments: ids('data-viewer-comment'),
+        });
+
+        fetch(`${pageBody.dataset.pageStateUrl}?${params}`, { credentials: 'same-origin' })
+            .then(response => response.ok ? response.json() : null)
+            .then(state => { if (state) applyPageState(state); })
+            .catch(error => console.error('Error:', error));
+    }
+
     console.log('Django Blog JS loaded successfully!');
 });
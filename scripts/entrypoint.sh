@@ -26,5 +26,5 @@ if [ "$DEBUG" = "True" ]; then
     exec python manage.py runserver 0.0.0.0:8000
 else
     echo ">> 프로덕션 서버 시작 (gunicorn)..."
-    exec gunicorn config.wsgi:application --bind 0.0.0.0:8000 --workers 3
+    exec gunicorn config.wsgi:application -c gunicorn.conf.py
 fi